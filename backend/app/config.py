@@ -7,6 +7,8 @@ class Settings(BaseSettings):
     database_url: str
     mongo_url: str
     mongo_db_name: str = "ai_ats"
+    # Socket timeout for the workers' sync Mongo client
+    mongo_socket_timeout_ms: int = 3000
 
     class Config:
         env_file = ".env"
@@ -58,6 +60,7 @@ class Settings(BaseSettings):
     gcs_bucket_name: Optional[str] = None
     gcs_credentials_path: Optional[str] = None
     gcp_project_id: Optional[str] = None
+    gcs_delete_concurrency: int = 16  # Parallel GCS batch-delete requests in cleanup
     
     # Google Cloud Speech-to-Text
     google_application_credentials: Optional[str] = None
@@ -77,11 +80,21 @@ class Settings(BaseSettings):
     
     # Cache Configuration
     cache_ttl: int = 86400  # 1 day in seconds
+    cache_hash_algorithm: str = "xxh3"  # "sha256" keeps the original content-hash keys
+    # Reuse a candidate's LLM score for a job description whose embedding is at least
+    # this cosine-similar to one already scored; 0 disables the semantic lookup
+    semantic_score_threshold: float = 0.97
+    # Job descriptions at least this long are uploaded once as Gemini cached content and
+    # reused as the prompt prefix for every candidate; 0 disables context caching
+    gemini_context_cache_min_chars: int = 4096
+    gemini_context_cache_ttl: int = 3600
     
     # Batch Processing
     batch_embed_size: int = 25
     max_video_size_mb: int = 50
     use_small_model: bool = True
+    worker_log_level: str = "INFO"
+    live_interview_vector_upsert: bool = False  # False: QA vectors are upserted in one batch at finalize
     
     # API Configuration
     api_title: str = "AI-Powered HRMS & ATS"
@@ -80,6 +80,34 @@ async def init_database():
         raise
 
 
+async def _create_index(coll, keys, **kwargs) -> bool:
+    """Create one index, logging (not raising) a failure so the remaining indexes still get built."""
+    try:
+        await coll.create_index(keys, **kwargs)
+        return True
+    except Exception as e:
+        logger.error(f"Failed to create index {keys} on {coll.name}: {e}")
+        return False
+
+
+async def _create_application_id_index(coll):
+    """Unique index on application_id, covering only documents where it is a string.
+
+    Beanie used to build a plain application_id_1 index from Application.Settings;
+    that one has the same name and key, so it is dropped first.
+    """
+    try:
+        existing = (await coll.index_information()).get("application_id_1")
+        if existing and not existing.get("unique"):
+            await coll.drop_index("application_id_1")
+    except Exception as e:
+        logger.error(f"Failed to replace legacy application_id index: {e}")
+    await _create_index(
+        coll, [("application_id", 1)], unique=True,
+        partialFilterExpression={"application_id": {"$type": "string"}}
+    )
+
+
 async def create_indexes():
     """Create important indexes for better query performance."""
     try:
@@ -108,52 +136,63 @@ async def create_indexes():
 
                 # Candidate indexes
                 if model == Candidate:
-                    await coll.create_index([("email", 1)], unique=True)
-                    await coll.create_index([("skills", 1)])
-                    await coll.create_index([("stage", 1)])
-                    await coll.create_index([("created_at", -1)])
+                    await _create_index(coll, [("email", 1)], unique=True)
+                    await _create_index(coll, [("skills", 1)])
+                    await _create_index(coll, [("stage", 1)])
+                    await _create_index(coll, [("created_at", -1)])
 
                 # Job indexes
                 elif model == Job:
-                    await coll.create_index([("title", "text"), ("description", "text")])
-                    await coll.create_index([("status", 1)])
-                    await coll.create_index([("created_by", 1)])
-                    await coll.create_index([("created_at", -1)])
+                    await _create_index(coll, [("title", "text"), ("description", "text")])
+                    await _create_index(coll, [("status", 1)])
+                    await _create_index(coll, [("created_by", 1)])
+                    await _create_index(coll, [("created_at", -1)])
+                    await _create_index(coll, [("job_id", 1)], sparse=True)
+                    # Covers the failed-job cleanup query (status + updated_at, projecting _id)
+                    await _create_index(coll, [("status", 1), ("updated_at", 1), ("_id", 1)])
 
                 # Application indexes
                 elif model == Application:
-                    await coll.create_index([("job_id", 1), ("candidate_id", 1)], unique=True)
-                    await coll.create_index([("status", 1)])
-                    await coll.create_index([("applied_at", -1)])
+                    await _create_index(coll, [("job_id", 1), ("candidate_id", 1)], unique=True)
+                    # Business-id lookups from the workers filter on application_id alone.
+                    # gemini_answers is matched inside the update pipeline, not in the filter,
+                    # so a multikey index on its fields would only add write cost.
+                    await _create_application_id_index(coll)
+                    await _create_index(coll, [("status", 1)])
+                    await _create_index(coll, [("applied_at", -1)])
 
                 # Interview indexes
                 elif model == Interview:
-                    await coll.create_index([("candidate_id", 1)])
-                    await coll.create_index([("job_id", 1)])
-                    await coll.create_index([("type", 1)])
-                    await coll.create_index([("created_at", -1)])
+                    await _create_index(coll, [("candidate_id", 1)])
+                    await _create_index(coll, [("job_id", 1)])
+                    await _create_index(coll, [("type", 1)])
+                    await _create_index(coll, [("created_at", -1)])
 
                 # File indexes
                 elif model == File:
-                    await coll.create_index([("file_type", 1)])
-                    await coll.create_index([("uploaded_by", 1)])
-                    await coll.create_index([("job_id", 1)])
-                    await coll.create_index([("candidate_id", 1)])
-                    await coll.create_index([("deleted", 1)])
+                    await _create_index(coll, [("file_type", 1)])
+                    await _create_index(coll, [("uploaded_by", 1)])
+                    await _create_index(coll, [("job_id", 1)])
+                    await _create_index(coll, [("candidate_id", 1)])
+                    await _create_index(coll, [("deleted", 1)])
+                    # Covers the expired-file cleanup query (projects _id and gcs_path)
+                    await _create_index(coll, [("created_at", 1), ("deleted", 1), ("gcs_path", 1), ("_id", 1)])
 
                 # User indexes
                 elif model == User:
-                    await coll.create_index([("email", 1)], unique=True)
-                    await coll.create_index([("role", 1)])
-                    await coll.create_index([("is_active", 1)])
+                    await _create_index(coll, [("email", 1)], unique=True)
+                    await _create_index(coll, [("role", 1)])
+                    await _create_index(coll, [("is_active", 1)])
 
                 else:
                     logger.debug(f"No explicit indexes configured for {model.__name__}")
 
             except Exception as e:
-                # Log detailed context for debugging
+                # Log detailed context and carry on with the other collections
                 logger.error(f"Failed to create indexes for {model.__name__}: {e}")
-                raise
+
+        # Interview sessions are not a Beanie model; the workers look them up by session_id
+        await _create_index(database.interview_sessions, [("session_id", 1)])
 
         print("✅ Indexes created successfully for all collections!")
 
@@ -229,6 +229,8 @@ if __name__ == "__main__":
         # Disable automatic reload on Windows to avoid spawning extra
         # subprocesses that can exhaust socket/buffer resources.
         reload=(settings.debug and not sys.platform.startswith("win")),
+        # uvloop ships with uvicorn[standard] but has no Windows build
+        loop=("asyncio" if sys.platform.startswith("win") else "uvloop"),
         log_level=settings.log_level.lower(),
         access_log=True
     )
\ No newline at end of file
@@ -168,8 +168,8 @@ class Application(BaseDocument):
     
     class Settings:
         name = "applications"
+        # application_id gets a unique partial index in database.create_indexes
         indexes = [
-            "application_id",
             "job_id",
             "candidate_id",
             ("job_id", "status"),
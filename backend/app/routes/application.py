@@ -1,5 +1,7 @@
 from fastapi import APIRouter, HTTPException, Depends, File, UploadFile
+from fastapi.responses import StreamingResponse
 from typing import Dict, Any, Optional
+import json
 import uuid
 import logging
 from datetime import datetime, timedelta
@@ -18,7 +20,7 @@ from app.services.scorer import ScorerService
 from app.services.audit import AuditLogger
 from app.workers.resume_worker import process_resume
 from app.workers.scoring_worker import score_interview
-from app.workers.interview_worker import generate_interview_questions
+from app.workers.interview_worker import request_interview_questions
 from app.websocket_manager import websocket_manager
 from app.auth import get_current_user
 
@@ -315,7 +317,7 @@ async def start_interview(
         # Enqueue question generation as a Celery task (worker will persist questions)
         try:
             # `StartInterviewRequest` defines `time_per_question_seconds`
-            task = generate_interview_questions.delay(
+            request_id = request_interview_questions(
                 application_id,
                 job_id,
                 "technical",
@@ -331,7 +333,7 @@ async def start_interview(
             {
                 "stage": ApplicationStage.INTERVIEW,
                 "status": "interview_scheduled",
-                "interview_task_id": task.id,
+                "interview_request_id": request_id,
                 "updated_at": datetime.utcnow()
             }
         )
@@ -342,7 +344,7 @@ async def start_interview(
             target_type="application",
             target_id=application_id,
             metadata={
-                "task_id": task.id,
+                "request_id": request_id,
                 "num_questions": request.num_questions,
                 "time_per_question_seconds": request.time_per_question_seconds
             }
@@ -357,7 +359,7 @@ async def start_interview(
                 {
                     "application_id": application_id,
                     "status": "interview_queued",
-                    "task_id": task.id
+                    "request_id": request_id
                 }
             )
         except Exception:
@@ -366,7 +368,7 @@ async def start_interview(
         return {
             "application_id": application_id,
             "status": "interview_queued",
-            "task_id": task.id
+            "request_id": request_id
         }
         
     except Exception as e:
@@ -472,6 +474,68 @@ async def get_interview_result(application_id: str):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/{application_id}/interview/result/stream")
+async def stream_interview_result(application_id: str, current_user = Depends(get_current_user)):
+    """Stream Gemini interview evaluation as newline-delimited JSON events.
+
+    Emits ``chunk`` events while the model is generating so the UI can show
+    partial feedback, then a final ``result`` event with the parsed scores,
+    which are saved as ``gemini_results`` like score_interview does. Once
+    results exist they are returned as the single ``result`` event, without
+    calling Gemini again.
+    """
+    try:
+        db = DatabaseService()
+        application = await db.get_application(application_id)
+        
+        if not application:
+            raise HTTPException(status_code=404, detail="Application not found")
+        
+        stored = application.get("gemini_results")
+        if stored:
+            async def stored_result():
+                yield json.dumps({"type": "result", "scores": stored}, default=str) + "\n"
+            return StreamingResponse(stored_result(), media_type="application/x-ndjson")
+        
+        questions = application.get("gemini_questions", [])
+        answers = application.get("gemini_answers", [])
+        if not questions or not answers:
+            raise HTTPException(status_code=400, detail="No questions or answers found")
+        
+        question_text = {q.get("qid"): q.get("text", "") for q in questions}
+        scoring_data = {
+            "job_description": (application.get("job") or {}).get("description", ""),
+            "resume_text": application.get("resume_text") or "",
+            "qa_pairs": [
+                {
+                    "question": question_text.get(a.get("qid"), ""),
+                    "answer": a.get("answer_text") or a.get("answer", ""),
+                    "expired": a.get("expired", False)
+                }
+                for a in answers
+            ]
+        }
+        
+        scorer = ScorerService()
+        prompt_hash = scorer.get_prompt_hash("interview_scoring")
+        
+        async def event_stream():
+            async for event in scorer.score_interview_answers_stream(scoring_data, prompt_hash=prompt_hash):
+                if event["type"] == "result":
+                    # Persist before the final event so a refresh reads it instead of re-scoring
+                    await db.update_application(application_id, {
+                        "gemini_results": {**event["scores"], "prompt_hash": prompt_hash},
+                        "stage": "evaluation_done"
+                    })
+                yield json.dumps(event) + "\n"
+        
+        return StreamingResponse(event_stream(), media_type="application/x-ndjson")
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.post("/{application_id}/status")
 async def update_status(
     application_id: str,
@@ -14,7 +14,7 @@ from app.schemas import (
     InterviewQuestion
 )
 from app.workers.interview_worker import (
-    generate_interview_questions,
+    request_interview_questions,
     evaluate_interview_response
 )
 from app.services.notifier import NotificationService
@@ -76,8 +76,8 @@ async def create_interview_session(
                     detail="Application not ready for interview"
                 )
             
-            # Generate questions (async)
-            task = generate_interview_questions.delay(
+            # Generate questions (async, batched with other candidates for this job)
+            request_id = request_interview_questions(
                 application_id=request.application_id,
                 job_id=application["job_id"],
                 role_type=request.role_type,
@@ -90,7 +90,7 @@ async def create_interview_session(
                 {"application_id": application.get("application_id")},
                 {"$set": {
                     "status": "interview_scheduled",
-                    "interview_task_id": task.id,
+                    "interview_request_id": request_id,
                     "updated_at": datetime.utcnow(),
                     "updated_by": current_user.get("uid") if isinstance(current_user, dict) else getattr(current_user, "id", None)
                 }}
@@ -102,7 +102,7 @@ async def create_interview_session(
                     action="create_interview",
                     target_type="application",
                     target_id=request.application_id,
-                    metadata={"task_id": task.id}
+                    metadata={"request_id": request_id}
                 )
             except Exception:
                 # Best-effort audit; do not fail the main flow
@@ -110,7 +110,7 @@ async def create_interview_session(
             
             return {
                 "application_id": request.application_id,
-                "task_id": task.id,
+                "request_id": request_id,
                 "status": "scheduled"
             }
             
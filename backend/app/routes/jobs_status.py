@@ -3,6 +3,7 @@ from typing import Dict, Any, List
 import json
 import uuid
 from app.websocket_manager import websocket_manager
+from app.services.websocket_events import cached_timestamp, new_message_id
 from app.services.db_utils import DatabaseService
 import logging
 
@@ -198,7 +199,8 @@ async def websocket_endpoint(websocket: WebSocket, user_id: str = None):
                 if message.get("type") == "ping":
                     await websocket.send_text(json.dumps({
                         "type": "pong",
-                        "timestamp": str(uuid.uuid4().time)
+                        "timestamp": cached_timestamp(),
+                        "message_id": new_message_id()
                     }))
                     
                 elif message.get("type") == "subscribe_job":
@@ -7,10 +7,10 @@ from typing import Dict, Any, Optional
 from app.auth import get_current_user
 from app.websocket_manager import websocket_manager
 from app.services.websocket_events import WebSocketEventType
+from app.services.ws_messages_fast import decode_message
 from app.services.polling import polling_service
 import uuid
 import logging
-import time
 
 logger = logging.getLogger(__name__)
 
@@ -46,9 +46,10 @@ async def websocket_endpoint(
                 message = None
                 
                 try:
-                    import json
-                    message = json.loads(data)
-                except:
+                    message = decode_message(data)
+                except Exception:
+                    continue
+                if not isinstance(message, dict):
                     continue
                 
                 # Handle pong responses
@@ -125,11 +126,7 @@ async def websocket_status(current_user = Depends(get_current_user)):
         stats = websocket_manager.get_connection_stats()
         
         # Add health metrics
-        healthy_connections = sum(
-            1 for health in websocket_manager.connection_health.values()
-            if health.get("last_ping") and
-            (time.time() - health["last_ping"]) < 60  # Last ping within 60s
-        )
+        healthy_connections = websocket_manager.get_healthy_connection_count(60)  # Last ping within 60s
         
         return {
             **stats,
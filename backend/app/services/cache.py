@@ -1,24 +1,95 @@
 import json
+import time
 import hashlib
 import redis
+import msgspec
+import numpy as np
+from bson import json_util
 from typing import Optional, Dict, Any, List
 from datetime import datetime, timedelta
 from app.config import settings
 import logging
 
+try:
+    import xxhash
+except ImportError:
+    # xxhash is optional; content hashes fall back to SHA-256 without it
+    xxhash = None
+
 logger = logging.getLogger(__name__)
 
+# One SCAN step: unlink matching keys that carry no TTL; returns {next_cursor, removed}
+_SWEEP_WITHOUT_TTL_LUA = """
+local r = redis.call('SCAN', ARGV[1], 'MATCH', ARGV[2], 'COUNT', ARGV[3])
+local removed = 0
+for _, k in ipairs(r[2]) do
+    if redis.call('TTL', k) == -1 then
+        removed = removed + redis.call('UNLINK', k)
+    end
+end
+return {r[1], removed}
+"""
+
+# Pop up to ARGV[1] queued requests for one batch group and drop the group
+# from the pending set once its list is drained, atomically
+_POP_PENDING_LUA = """
+local items = redis.call('LRANGE', KEYS[1], 0, tonumber(ARGV[1]) - 1)
+if #items > 0 then
+    redis.call('LTRIM', KEYS[1], #items, -1)
+end
+if redis.call('LLEN', KEYS[1]) == 0 then
+    redis.call('SREM', KEYS[2], ARGV[2])
+end
+return items
+"""
+
+_INTERVIEW_Q_PENDING_GROUPS = "interview_q_pending_groups"
+# Held while a dispatch_interview_question_batches run is scheduled but not yet started
+_INTERVIEW_Q_DISPATCH_LOCK = "interview_q_dispatch_scheduled"
+
+
+# Hot-path score payloads are stored as JSON bytes via msgspec; both are thread-safe to share
+_JSON_ENCODER = msgspec.json.Encoder()
+_JSON_DECODER = msgspec.json.Decoder()
+
+# Most recent job-description embeddings kept per candidate resume for semantic score lookups
+SEMANTIC_SCORE_MAX_ENTRIES = 16
+
+
+# Set by backfill_application_ids.py once every application carries application_id
+APPLICATIONS_MIGRATED_FLAG = "flag:apps_migrated_v1"
+# How often an unset migration flag is re-read from Redis
+MIGRATION_FLAG_RECHECK_SECONDS = 60
+
 
 class CacheService:
     """Service for Redis caching operations."""
     
+    # Process-wide: once the flag is seen it never needs reading again
+    _apps_migrated = False
+    _apps_migrated_checked_at: Optional[float] = None
+    
     def __init__(self):
         self.redis_client = redis.from_url(settings.redis_url, decode_responses=True)
         self.default_ttl = settings.cache_ttl  # Default TTL in seconds
+        self._sweep_script = None  # Registered lazily on first sweep
+        self._pop_pending_script = None  # Registered lazily on first batch pop
+        self._binary_client = None  # Created on first binary value (decode_responses=False)
+    
+    @property
+    def binary_client(self) -> redis.Redis:
+        """Client for raw-bytes values, which the decoding client would mangle."""
+        if self._binary_client is None:
+            self._binary_client = redis.from_url(settings.redis_url)
+        return self._binary_client
     
     def hash_text(self, text: str) -> str:
-        """Generate SHA-256 hash of text for caching."""
-        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+        """Generate a content hash of text for caching (xxh3-128 when available, else SHA-256)."""
+        data = text.encode('utf-8')
+        if xxhash is not None and settings.cache_hash_algorithm == "xxh3":
+            # Prefixed so keys written under SHA-256 are simply misses, never collisions
+            return f"xxh3:{xxhash.xxh3_128_hexdigest(data)}"
+        return hashlib.sha256(data).hexdigest()
     
     def generate_score_key(self, candidate_id: str, job_description: str) -> str:
         """Generate cache key for candidate-job score."""
@@ -62,6 +133,36 @@ class CacheService:
             logger.error(f"Failed to cache embedding: {str(e)}")
             return False
     
+    def get_resume_text(self, text_hash: str) -> Optional[str]:
+        """Get the cached full text of a resume by its content hash."""
+        try:
+            return self.redis_client.get(f"resume_text:{text_hash}")
+        except Exception as e:
+            logger.error(f"Failed to get resume text from cache: {str(e)}")
+            return None
+    
+    def set_resume_text(self, text_hash: str, text: str, ttl: int = None) -> bool:
+        """Cache the full text of a resume; candidates only store an excerpt."""
+        try:
+            return self.redis_client.setex(f"resume_text:{text_hash}", ttl or self.default_ttl, text)
+        except Exception as e:
+            logger.error(f"Failed to cache resume text: {str(e)}")
+            return False
+    
+    def applications_migrated(self) -> bool:
+        """Whether every application has application_id backfilled, so lookups can use that field alone."""
+        cls = CacheService
+        if cls._apps_migrated:
+            return True
+        now = time.monotonic()
+        if cls._apps_migrated_checked_at is None or now - cls._apps_migrated_checked_at >= MIGRATION_FLAG_RECHECK_SECONDS:
+            cls._apps_migrated_checked_at = now
+            try:
+                cls._apps_migrated = bool(self.redis_client.exists(APPLICATIONS_MIGRATED_FLAG))
+            except Exception as e:
+                logger.error(f"Failed to read migration flag: {str(e)}")
+        return cls._apps_migrated
+    
     def get_score(self, score_key: str) -> Optional[Dict[str, Any]]:
         """
         Get cached score for candidate-job pair.
@@ -75,7 +176,7 @@ class CacheService:
         try:
             cached_data = self.redis_client.get(score_key)
             if cached_data:
-                return json.loads(cached_data)
+                return _JSON_DECODER.decode(cached_data)
             return None
         except Exception as e:
             logger.error(f"Failed to get score from cache: {str(e)}")
@@ -95,11 +196,231 @@ class CacheService:
         """
         try:
             ttl = ttl or self.default_ttl
-            return self.redis_client.setex(score_key, ttl, json.dumps(score_data))
+            return self.redis_client.setex(score_key, ttl, _JSON_ENCODER.encode(score_data))
         except Exception as e:
             logger.error(f"Failed to cache score: {str(e)}")
             return False
     
+    def get_jd_embedding(self, job_description: str) -> Optional[List[float]]:
+        """Get the cached embedding of a job description, keyed by its content hash."""
+        try:
+            cached = self.binary_client.get(f"jd_emb32:{self.hash_text(job_description)}")
+            return np.frombuffer(cached, dtype=np.float32).tolist() if cached else None
+        except Exception as e:
+            logger.error(f"Failed to get job description embedding from cache: {str(e)}")
+            return None
+    
+    def set_jd_embedding(self, job_description: str, embedding: List[float], ttl: int = None) -> bool:
+        """Cache the embedding of a job description (raw float32 bytes) so it isn't re-encoded."""
+        try:
+            key = f"jd_emb32:{self.hash_text(job_description)}"
+            data = np.asarray(embedding, dtype=np.float32).tobytes()
+            return self.binary_client.setex(key, ttl or self.default_ttl, data)
+        except Exception as e:
+            logger.error(f"Failed to cache job description embedding: {str(e)}")
+            return False
+    
+    def get_gemini_cached_content(self, jd_hash: str) -> Optional[str]:
+        """Get the name of the Gemini cached content holding a job description's prompt prefix."""
+        try:
+            return self.redis_client.get(f"jd_cached_content:{jd_hash}")
+        except Exception as e:
+            logger.error(f"Failed to get Gemini cached content name: {str(e)}")
+            return None
+    
+    def set_gemini_cached_content(self, jd_hash: str, name: str, ttl: int) -> bool:
+        """Share a Gemini cached content name across workers until shortly before it expires."""
+        try:
+            return self.redis_client.setex(f"jd_cached_content:{jd_hash}", ttl, name)
+        except Exception as e:
+            logger.error(f"Failed to cache Gemini cached content name: {str(e)}")
+            return False
+    
+    def get_score_semantic(
+        self, candidate_id: str, resume_hash: str, jd_embedding: List[float], threshold: float = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached score for this candidate's resume against a near-identical job description.
+        
+        Args:
+            candidate_id: Candidate the score belongs to
+            resume_hash: Content hash of the resume text that was scored
+            jd_embedding: Embedding of the job description being scored
+            threshold: Minimum cosine similarity to the scored job description
+        
+        Returns:
+            Score data of the most similar scored job description at or above threshold, None otherwise
+        """
+        threshold = settings.semantic_score_threshold if threshold is None else threshold
+        if threshold <= 0:
+            return None
+        try:
+            entries = self.redis_client.lrange(f"score_sem:{candidate_id}:{resume_hash}", 0, -1)
+            if not entries:
+                return None
+            entries = [_JSON_DECODER.decode(entry) for entry in entries]
+            scored = np.asarray([entry["emb"] for entry in entries], dtype=np.float32)
+            query = np.asarray(jd_embedding, dtype=np.float32)
+            norms = np.linalg.norm(scored, axis=1) * np.linalg.norm(query)
+            similarity = scored @ query / np.where(norms == 0, 1.0, norms)
+            best = int(np.argmax(similarity))
+            if similarity[best] >= threshold:
+                return entries[best]["score"]
+            return None
+        except Exception as e:
+            logger.error(f"Failed to get semantic score from cache: {str(e)}")
+            return None
+    
+    def set_score_semantic(
+        self, candidate_id: str, resume_hash: str, jd_embedding: List[float],
+        score_data: Dict[str, Any], ttl: int = None
+    ) -> bool:
+        """
+        Record a score for semantic lookups by later, similar job descriptions.
+        
+        Args:
+            candidate_id: Candidate the score belongs to
+            resume_hash: Content hash of the resume text that was scored
+            jd_embedding: Embedding of the job description that was scored
+            score_data: Score and rationale data
+            ttl: Time to live in seconds
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            key = f"score_sem:{candidate_id}:{resume_hash}"
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.lpush(key, _JSON_ENCODER.encode({"emb": jd_embedding, "score": score_data}))
+            pipe.ltrim(key, 0, SEMANTIC_SCORE_MAX_ENTRIES - 1)
+            pipe.expire(key, ttl or self.default_ttl)
+            pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Failed to cache semantic score: {str(e)}")
+            return False
+    
+    def generate_interview_questions_key(
+        self, job_id: str, role_type: str, time_per_question: int, resume_text: str
+    ) -> str:
+        """Generate cache key for interview questions generated from a job/resume pair."""
+        content = f"{job_id}:{role_type}:{time_per_question}:{self.hash_text(resume_text or '')}"
+        return f"interview_q:{hashlib.sha256(content.encode()).hexdigest()}"
+    
+    def get_interview_questions(self, questions_key: str) -> Optional[List[Any]]:
+        """
+        Get cached generated interview questions.
+        
+        Args:
+            questions_key: Cache key from generate_interview_questions_key
+        
+        Returns:
+            List of raw question objects if found, None otherwise
+        """
+        try:
+            cached_data = self.redis_client.get(questions_key)
+            if cached_data:
+                return json.loads(cached_data)
+            return None
+        except Exception as e:
+            logger.error(f"Failed to get interview questions from cache: {str(e)}")
+            return None
+    
+    def set_interview_questions(self, questions_key: str, questions: List[Any], ttl: int = None) -> bool:
+        """
+        Cache generated interview questions.
+        
+        Args:
+            questions_key: Cache key from generate_interview_questions_key
+            questions: Raw question objects returned by the LLM
+            ttl: Time to live in seconds
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            ttl = ttl or 3600  # 1 hour default for generated questions
+            return self.redis_client.setex(questions_key, ttl, json.dumps(questions))
+        except Exception as e:
+            logger.error(f"Failed to cache interview questions: {str(e)}")
+            return False
+    
+    def enqueue_interview_question_request(self, group: str, request: Dict[str, Any]) -> bool:
+        """
+        Queue a question-generation request for batching with others in the same group.
+        
+        Args:
+            group: Batch group (job, role type and time per question)
+            request: Request payload
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            pipe = self.redis_client.pipeline()
+            pipe.rpush(f"interview_q_pending:{group}", json.dumps(request))
+            pipe.sadd(_INTERVIEW_Q_PENDING_GROUPS, group)
+            pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Failed to queue interview question request: {str(e)}")
+            return False
+    
+    def claim_interview_question_dispatch(self, ttl: int = 60) -> bool:
+        """
+        Claim the right to schedule the next question batch dispatch.
+        
+        Args:
+            ttl: Seconds before an unreleased claim lapses (e.g. the scheduled task was lost)
+        
+        Returns:
+            True if the caller should schedule a dispatch (also on Redis errors, since an
+            extra dispatch is harmless), False if one is already pending
+        """
+        try:
+            return bool(self.redis_client.set(_INTERVIEW_Q_DISPATCH_LOCK, "1", nx=True, ex=ttl))
+        except Exception as e:
+            logger.error(f"Failed to claim interview question dispatch: {str(e)}")
+            return True
+    
+    def release_interview_question_dispatch(self) -> None:
+        """Release the dispatch claim so the next queued request schedules a new run."""
+        try:
+            self.redis_client.delete(_INTERVIEW_Q_DISPATCH_LOCK)
+        except Exception as e:
+            logger.error(f"Failed to release interview question dispatch: {str(e)}")
+    
+    def get_pending_interview_question_groups(self) -> List[str]:
+        """Return the batch groups that currently have queued question requests."""
+        try:
+            return list(self.redis_client.smembers(_INTERVIEW_Q_PENDING_GROUPS))
+        except Exception as e:
+            logger.error(f"Failed to list pending interview question groups: {str(e)}")
+            return []
+    
+    def pop_interview_question_requests(self, group: str, count: int) -> List[Dict[str, Any]]:
+        """
+        Atomically take up to `count` queued question requests for a batch group.
+        
+        Args:
+            group: Batch group
+            count: Maximum number of requests to take
+        
+        Returns:
+            List of request payloads, oldest first
+        """
+        if self._pop_pending_script is None:
+            self._pop_pending_script = self.redis_client.register_script(_POP_PENDING_LUA)
+        try:
+            items = self._pop_pending_script(
+                keys=[f"interview_q_pending:{group}", _INTERVIEW_Q_PENDING_GROUPS],
+                args=[count, group]
+            )
+            return [json.loads(item) for item in items]
+        except Exception as e:
+            logger.error(f"Failed to pop interview question requests: {str(e)}")
+            return []
+    
     def get_session_data(self, session_id: str) -> Optional[Dict[str, Any]]:
         """
         Get cached session data.
@@ -140,6 +461,54 @@ class CacheService:
             logger.error(f"Failed to cache session: {str(e)}")
             return False
     
+    def get_document(self, kind: str, doc_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached MongoDB document.
+        
+        Args:
+            kind: Key prefix for the document type (e.g. "app", "job")
+            doc_id: Document identifier
+        
+        Returns:
+            Document if found, None otherwise
+        """
+        try:
+            cached_data = self.redis_client.get(f"{kind}:{doc_id}")
+            if cached_data:
+                return json_util.loads(cached_data)
+            return None
+        except Exception as e:
+            logger.error(f"Failed to get document from cache: {str(e)}")
+            return None
+    
+    def set_document(self, kind: str, doc_id: str, doc: Dict[str, Any], ttl: int = None) -> bool:
+        """
+        Cache a MongoDB document, preserving BSON types such as ObjectId and datetime.
+        
+        Args:
+            kind: Key prefix for the document type (e.g. "app", "job")
+            doc_id: Document identifier
+            doc: Document to cache
+            ttl: Time to live in seconds
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            ttl = ttl or 600  # 10 minutes default for documents
+            return self.redis_client.setex(f"{kind}:{doc_id}", ttl, json_util.dumps(doc))
+        except Exception as e:
+            logger.error(f"Failed to cache document: {str(e)}")
+            return False
+    
+    def delete_document(self, kind: str, doc_id: str) -> bool:
+        """Drop a cached MongoDB document after it changes."""
+        try:
+            return bool(self.redis_client.delete(f"{kind}:{doc_id}"))
+        except Exception as e:
+            logger.error(f"Failed to delete document from cache: {str(e)}")
+            return False
+    
     def delete_session(self, session_id: str) -> bool:
         """
         Delete session from cache.
@@ -197,6 +566,29 @@ class CacheService:
             logger.error(f"Failed to cache job status: {str(e)}")
             return False
     
+    def _sweep_without_ttl(self, pattern: str) -> int:
+        """
+        UNLINK keys under a cache prefix that have no TTL and so would never expire.
+        
+        Each call to the server-side script runs one SCAN step and unlinks the
+        stale keys it finds, so key names never cross the socket. The cursor is
+        advanced from here rather than looping inside Lua, which keeps each
+        script invocation short and Redis responsive.
+        
+        Returns:
+            Number of keys removed
+        """
+        if self._sweep_script is None:
+            self._sweep_script = self.redis_client.register_script(_SWEEP_WITHOUT_TTL_LUA)
+        
+        cleaned_count = 0
+        cursor = "0"
+        while True:
+            cursor, removed = self._sweep_script(args=[cursor, pattern, 1000])
+            cleaned_count += int(removed)
+            if str(cursor) == "0":
+                return cleaned_count
+    
     def cleanup_expired_embeddings(self) -> int:
         """
         Clean up expired embedding cache entries.
@@ -205,17 +597,7 @@ class CacheService:
             Number of entries cleaned up
         """
         try:
-            pattern = "embedding:*"
-            keys = self.redis_client.keys(pattern)
-            
-            cleaned_count = 0
-            for key in keys:
-                # Check if key is expired
-                ttl = self.redis_client.ttl(key)
-                if ttl == -2:  # Key doesn't exist (expired)
-                    cleaned_count += 1
-            
-            return cleaned_count
+            return self._sweep_without_ttl("embedding:*")
         except Exception as e:
             logger.error(f"Failed to cleanup expired embeddings: {str(e)}")
             return 0
@@ -228,17 +610,7 @@ class CacheService:
             Number of entries cleaned up
         """
         try:
-            pattern = "score:*"
-            keys = self.redis_client.keys(pattern)
-            
-            cleaned_count = 0
-            for key in keys:
-                # Check if key is expired
-                ttl = self.redis_client.ttl(key)
-                if ttl == -2:  # Key doesn't exist (expired)
-                    cleaned_count += 1
-            
-            return cleaned_count
+            return self._sweep_without_ttl("score:*")
         except Exception as e:
             logger.error(f"Failed to cleanup expired scores: {str(e)}")
             return 0
@@ -251,21 +623,33 @@ class CacheService:
             Number of entries cleaned up
         """
         try:
-            pattern = "session:*"
-            keys = self.redis_client.keys(pattern)
-            
-            cleaned_count = 0
-            for key in keys:
-                # Check if key is expired
-                ttl = self.redis_client.ttl(key)
-                if ttl == -2:  # Key doesn't exist (expired)
-                    cleaned_count += 1
-            
-            return cleaned_count
+            return self._sweep_without_ttl("session:*")
         except Exception as e:
             logger.error(f"Failed to cleanup expired sessions: {str(e)}")
             return 0
     
+    def get_keyspace_summary(self) -> Dict[str, Any]:
+        """
+        Cheap keyspace statistics from DBSIZE and INFO keyspace (no key walks).
+        
+        Returns:
+            Dict with total keys, keys carrying a TTL, and the average TTL in ms
+        """
+        try:
+            keyspace = self.redis_client.info("keyspace")
+            db = keyspace.get(f"db{self.redis_client.connection_pool.connection_kwargs.get('db', 0)}", {})
+            total = self.redis_client.dbsize()
+            expires = db.get("expires", 0)
+            return {
+                "total_keys": total,
+                "keys_with_ttl": expires,
+                "keys_without_ttl": max(total - expires, 0),
+                "avg_ttl_ms": db.get("avg_ttl", 0)
+            }
+        except Exception as e:
+            logger.error(f"Failed to get keyspace summary: {str(e)}")
+            return {}
+    
     def get_cache_stats(self) -> Dict[str, Any]:
         """
         Get cache statistics.
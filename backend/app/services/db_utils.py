@@ -1,7 +1,9 @@
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import UpdateOne
 from app.config import settings
+from app.services.cache import CacheService
 import logging
 
 logger = logging.getLogger(__name__)
@@ -13,6 +15,7 @@ class DatabaseService:
     def __init__(self):
         self.client = AsyncIOMotorClient(settings.mongo_url)
         self.db = self.client[settings.mongo_db_name]
+        self.cache = CacheService()
     
     # Job Management
     async def create_job(self, job_data: Dict[str, Any]) -> str:
@@ -313,10 +316,13 @@ class DatabaseService:
     async def get_expired_files(self, cutoff_date: datetime) -> List[Dict[str, Any]]:
         """Get files older than cutoff date."""
         try:
-            cursor = self.db.files.find({
-                "created_at": {"$lt": cutoff_date},
-                "deleted": {"$ne": True}
-            })
+            cursor = self.db.files.find(
+                {
+                    "created_at": {"$lt": cutoff_date},
+                    "deleted": {"$ne": True}
+                },
+                projection={"_id": 1, "gcs_path": 1}
+            ).batch_size(1000)
             
             files = []
             async for file in cursor:
@@ -345,14 +351,37 @@ class DatabaseService:
             logger.error(f"Failed to mark file as deleted: {str(e)}")
             return False
     
+    async def mark_files_deleted(self, file_ids: List[Any]) -> int:
+        """Mark many files as deleted with a single update_many."""
+        if not file_ids:
+            return 0
+        try:
+            result = await self.db.files.update_many(
+                {"_id": {"$in": file_ids}},
+                {
+                    "$set": {
+                        "deleted": True,
+                        "deleted_at": datetime.utcnow()
+                    }
+                }
+            )
+            
+            return result.modified_count
+        except Exception as e:
+            logger.error(f"Failed to mark files as deleted: {str(e)}")
+            return 0
+    
     # Failed Jobs Management
     async def get_failed_jobs(self, cutoff_date: datetime) -> List[Dict[str, Any]]:
         """Get failed jobs older than cutoff date."""
         try:
-            cursor = self.db.jobs.find({
-                "status": "FAILED",
-                "updated_at": {"$lt": cutoff_date}
-            })
+            cursor = self.db.jobs.find(
+                {
+                    "status": "FAILED",
+                    "updated_at": {"$lt": cutoff_date}
+                },
+                projection={"_id": 1}
+            ).batch_size(1000)
             
             jobs = []
             async for job in cursor:
@@ -381,6 +410,27 @@ class DatabaseService:
             logger.error(f"Failed to archive failed job: {str(e)}")
             return False
     
+    async def archive_failed_jobs_bulk(self, job_ids: List[Any]) -> int:
+        """Archive many failed jobs in a single unordered bulk_write."""
+        if not job_ids:
+            return 0
+        try:
+            update = {
+                "$set": {
+                    "archived": True,
+                    "archived_at": datetime.utcnow()
+                }
+            }
+            result = await self.db.jobs.bulk_write(
+                [UpdateOne({"_id": job_id}, update) for job_id in job_ids],
+                ordered=False
+            )
+            
+            return result.modified_count
+        except Exception as e:
+            logger.error(f"Failed to archive failed jobs: {str(e)}")
+            return 0
+    
     # Application Management
     async def create_application(self, application_data: Dict[str, Any]) -> str:
         """Create a new application record."""
@@ -481,11 +531,12 @@ class DatabaseService:
     async def get_application(self, application_id: str) -> Optional[Dict[str, Any]]:
         """Get application by ID."""
         try:
-            # Try both the application_id field and _id field
-            application = await self.db.applications.find_one({"$or": [
-                {"application_id": application_id},
-                {"_id": application_id}
-            ]})
+            if self.cache.applications_migrated():
+                query = {"application_id": application_id}
+            else:
+                # Try both the application_id field and _id field, indexed branch first
+                query = {"$or": [{"application_id": application_id}, {"_id": application_id}]}
+            application = await self.db.applications.find_one(query)
             if application and application.get("_id"):
                 application["_id"] = str(application["_id"])
             return application
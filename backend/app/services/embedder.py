@@ -7,9 +7,16 @@ from app.config import settings
 import logging
 import uuid
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
+# Pinecone accepts at most 1000 IDs per delete request
+PINECONE_DELETE_BATCH = 1000
+PINECONE_DELETE_WORKERS = 8
+# Vectors per upsert request when writing in bulk
+PINECONE_UPSERT_BATCH = 100
+
 
 class EmbedderService:
     """Service for handling embeddings and Pinecone operations (Updated SDK)."""
@@ -72,6 +79,10 @@ class EmbedderService:
         else:
             logger.info("PINECONE_API_KEY not set; Pinecone client will be disabled.")
 
+    def encode(self, text: str) -> List[float]:
+        """Embed text with the local model only, without writing anything to Pinecone."""
+        return self.model.encode(text).tolist()
+
     def create_embedding(self, text: str) -> str:
         """Create embedding for given text and store it in Pinecone."""
         try:
@@ -121,20 +132,7 @@ class EmbedderService:
             # Generate embedding
             embedding = self.model.encode(text).tolist()
             
-            # Add required metadata
-            metadata = metadata.copy()  # Don't modify original
-            metadata["text"] = text
-            metadata["timestamp"] = metadata.get("timestamp", None)
-            metadata["vector_type"] = metadata.get("type", "unknown")
-            
-            # Validate metadata types (Pinecone requirement)
-            for key, value in metadata.items():
-                if isinstance(value, (bool, int, float, str, list)):
-                    continue
-                elif value is None:
-                    metadata[key] = ""  # Convert None to empty string
-                else:
-                    metadata[key] = str(value)  # Convert other types to string
+            metadata = self._prepare_metadata(text, metadata)
             
             # Upsert with validation
             if not isinstance(vector_id, str):
@@ -154,6 +152,77 @@ class EmbedderService:
             logger.error(f"❌ Failed to upsert to Pinecone: {str(e)}")
             return False
 
+    def update_metadata(self, vector_id: str, metadata: Dict[str, Any]) -> bool:
+        """Replace metadata fields on an existing vector without re-embedding or re-sending the values.
+        
+        Args:
+            vector_id: ID of a vector already in the index
+            metadata: Metadata fields to set, as for upsert_to_pinecone
+                
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            metadata = self._prepare_metadata(metadata.get("text", ""), metadata)
+            self.index.update(id=str(vector_id), set_metadata=metadata)
+            logger.info(f"✅ Updated metadata for vector {vector_id}")
+            return True
+        except Exception as e:
+            logger.error(f"❌ Failed to update vector metadata: {str(e)}")
+            return False
+
+    def upsert_to_pinecone_batch(self, items: List[Dict[str, Any]]) -> int:
+        """Embed and upsert many vectors, PINECONE_UPSERT_BATCH per request.
+        
+        Args:
+            items: Dicts with ``vector_id``, ``text`` and ``metadata`` keys, as for upsert_to_pinecone
+                
+        Returns:
+            int: Number of vectors upserted
+        """
+        if not items:
+            return 0
+        try:
+            texts = [item["text"] for item in items]
+            # One encode call for the whole batch instead of one per text
+            embeddings = self.model.encode(texts).tolist()
+            vectors = [
+                (str(item["vector_id"]), embedding, self._prepare_metadata(item["text"], item.get("metadata") or {}))
+                for item, embedding in zip(items, embeddings)
+            ]
+        except Exception as e:
+            logger.error(f"❌ Failed to embed vector batch: {str(e)}")
+            return 0
+
+        upserted = 0
+        for i in range(0, len(vectors), PINECONE_UPSERT_BATCH):
+            chunk = vectors[i:i + PINECONE_UPSERT_BATCH]
+            try:
+                self.index.upsert(vectors=chunk)
+                upserted += len(chunk)
+            except Exception as e:
+                logger.error(f"❌ Failed to upsert vector batch to Pinecone: {str(e)}")
+        logger.info(f"✅ Upserted {upserted} of {len(vectors)} vectors")
+        return upserted
+
+    @staticmethod
+    def _prepare_metadata(text: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy metadata, add the standard fields and coerce values to Pinecone-supported types."""
+        metadata = metadata.copy()  # Don't modify original
+        metadata["text"] = text
+        metadata["timestamp"] = metadata.get("timestamp", None)
+        metadata["vector_type"] = metadata.get("type", "unknown")
+        
+        # Validate metadata types (Pinecone requirement)
+        for key, value in metadata.items():
+            if isinstance(value, (bool, int, float, str, list)):
+                continue
+            elif value is None:
+                metadata[key] = ""  # Convert None to empty string
+            else:
+                metadata[key] = str(value)  # Convert other types to string
+        return metadata
+
     def query_similar(self, text_or_vector: Union[str, List[float]], top_k: int = 10,
                       filter_metadata: Dict[str, Any] = None,
                       min_score: float = 0.0,
@@ -286,16 +355,31 @@ class EmbedderService:
             logger.error(f"❌ Failed to delete vector: {str(e)}")
             return False
 
-    def delete_vectors(self, vector_ids: List[str]) -> int:
-        """Delete multiple vectors."""
+    def delete_vectors_batch(self, vector_ids: List[str]) -> int:
+        """Delete up to PINECONE_DELETE_BATCH vectors in one request."""
         try:
             self.index.delete(ids=vector_ids)
-            logger.info(f"🗑️ Deleted {len(vector_ids)} vectors")
             return len(vector_ids)
         except Exception as e:
-            logger.error(f"❌ Failed to delete multiple vectors: {str(e)}")
+            logger.error(f"❌ Failed to delete vector batch: {str(e)}")
             return 0
 
+    def delete_vectors(self, vector_ids: List[str]) -> int:
+        """Delete multiple vectors, chunked to Pinecone's per-request ID limit and sent concurrently."""
+        chunks = [
+            vector_ids[i:i + PINECONE_DELETE_BATCH]
+            for i in range(0, len(vector_ids), PINECONE_DELETE_BATCH)
+        ]
+        if not chunks:
+            return 0
+        if len(chunks) == 1:
+            deleted = self.delete_vectors_batch(chunks[0])
+        else:
+            with ThreadPoolExecutor(max_workers=min(PINECONE_DELETE_WORKERS, len(chunks))) as pool:
+                deleted = sum(pool.map(self.delete_vectors_batch, chunks))
+        logger.info(f"🗑️ Deleted {deleted} of {len(vector_ids)} vectors")
+        return deleted
+
     def get_index_stats(self) -> Dict[str, Any]:
         """Get Pinecone index statistics."""
         try:
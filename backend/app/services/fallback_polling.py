@@ -171,9 +171,9 @@ class FallbackPollingService:
             if poll_type == "interview":
                 return {
                     **base_msg,
-                    "type": WebSocketEventType.INTERVIEW_QUESTIONS_READY
+                    "type": WebSocketEventType.INTERVIEW_QUESTIONS_READY.wire
                     if doc["status"] == "ready"
-                    else WebSocketEventType.INTERVIEW_COMPLETED,
+                    else WebSocketEventType.INTERVIEW_COMPLETED.wire,
                     "session_id": doc["session_id"],
                     "job_id": doc["job_id"],
                     "status": doc["status"],
@@ -186,7 +186,7 @@ class FallbackPollingService:
             elif poll_type == "application":
                 return {
                     **base_msg,
-                    "type": WebSocketEventType.APPLICATION_STATUS_CHANGED,
+                    "type": WebSocketEventType.APPLICATION_STATUS_CHANGED.wire,
                     "application_id": str(doc["_id"]),
                     "job_id": doc["job_id"],
                     "status": doc["status"],
@@ -199,7 +199,7 @@ class FallbackPollingService:
             elif poll_type == "job":
                 return {
                     **base_msg,
-                    "type": WebSocketEventType.JOB_UPDATED,
+                    "type": WebSocketEventType.JOB_UPDATED.wire,
                     "job_id": str(doc["_id"]),
                     "status": doc["status"],
                     "data": {
@@ -211,7 +211,7 @@ class FallbackPollingService:
             elif poll_type == "system":
                 return {
                     **base_msg,
-                    "type": WebSocketEventType.SYSTEM_ANNOUNCEMENT,
+                    "type": WebSocketEventType.SYSTEM_ANNOUNCEMENT.wire,
                     "severity": doc.get("severity", "info"),
                     "title": doc.get("title"),
                     "content": doc.get("content"),
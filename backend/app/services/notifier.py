@@ -1,13 +1,19 @@
 import json
 import redis
+import redis.asyncio as aioredis
 import asyncio
 import time
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
+import msgspec
 from app.config import settings
+from app.services.ws_messages_fast import decode_message
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Events go to Redis as UTF-8 JSON bytes; Encoder.encode is safe to share across threads
+_EVENT_ENCODER = msgspec.json.Encoder()
+
 
 class NotificationService:
     """Service for WebSocket notifications and pub/sub messaging."""
@@ -61,7 +67,7 @@ class NotificationService:
                 return False
             
             # Publish to Redis channel
-            result = self.redis_client.publish("events", json.dumps(message))
+            result = self.redis_client.publish("events", _EVENT_ENCODER.encode(message))
             
             logger.info(f"Published event {event_type} for job {job_id}")
             return result > 0
@@ -70,6 +76,43 @@ class NotificationService:
             logger.error(f"Failed to publish event: {str(e)}")
             return False
     
+    def publish_events_bulk(self, events: List[Tuple[str, str, Dict[str, Any]]]) -> List[bool]:
+        """
+        Publish several events to Redis pub/sub in one pipelined round trip.
+        
+        Args:
+            events: (event_type, job_id, payload) tuples, as for publish_event
+        
+        Returns:
+            Per-event success flags, in order
+        """
+        if not events:
+            return []
+        try:
+            ts = str(time.time())
+            if not self.redis_client:
+                if settings.environment == "development":
+                    logger.info(f"Development mode: {len(events)} events")
+                    return [True] * len(events)
+                return [False] * len(events)
+            
+            with self.redis_client.pipeline(transaction=False) as pipe:
+                for event_type, job_id, payload in events:
+                    pipe.publish("events", _EVENT_ENCODER.encode({
+                        "event_type": event_type,
+                        "job_id": job_id,
+                        "payload": payload,
+                        "timestamp": ts
+                    }))
+                results = pipe.execute()
+            
+            logger.info(f"Published {len(events)} events")
+            return [result > 0 for result in results]
+            
+        except Exception as e:
+            logger.error(f"Failed to publish events: {str(e)}")
+            return [False] * len(events)
+    
     def publish_user_notification(self, user_id: str, notification: Dict[str, Any]) -> bool:
         """
         Publish a user-specific notification.
@@ -95,7 +138,7 @@ class NotificationService:
             }
             
             channel = f"user_notifications:{user_id}"
-            result = self.redis_client.publish(channel, json.dumps(message))
+            result = self.redis_client.publish(channel, _EVENT_ENCODER.encode(message))
             
             logger.info(f"Published notification for user {user_id}")
             return result > 0
@@ -129,7 +172,7 @@ class NotificationService:
             }
             
             channel = "broadcast_notifications"
-            result = self.redis_client.publish(channel, json.dumps(message))
+            result = self.redis_client.publish(channel, _EVENT_ENCODER.encode(message))
             
             logger.info(f"Published broadcast notification")
             return result > 0
@@ -138,32 +181,33 @@ class NotificationService:
             logger.error(f"Failed to publish broadcast notification: {str(e)}")
             return False
     
-    def subscribe_to_events(self, callback):
+    async def subscribe_to_events(self):
         """
-        Subscribe to all events and call callback function.
+        Subscribe to all events on the running event loop.
         
-        Args:
-            callback: Function to call when events are received
+        Yields:
+            Parsed event dicts as they arrive on the "events" channel
         """
+        client = aioredis.from_url(settings.redis_url)
+        pubsub = client.pubsub(ignore_subscribe_messages=True)
         try:
-            self.pubsub.subscribe("events")
+            await pubsub.subscribe("events")
 
-            for message in self.pubsub.listen():
-                if message.get('type') == 'message':
-                    try:
-                        event_data = json.loads(message['data'])
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Failed to parse event data: {str(e)}")
-                        continue
-
-                    # Invoke callback but guard against exceptions so the listener loop continues
-                    try:
-                        callback(event_data)
-                    except Exception as cb_err:
-                        logger.error(f"Event callback raised an exception: {cb_err}")
+            async for message in pubsub.listen():
+                if message.get('type') != 'message':
+                    continue
+                try:
+                    yield decode_message(message['data'])
+                except msgspec.DecodeError as e:
+                    logger.error(f"Failed to parse event data: {str(e)}")
 
-        except Exception as e:
-            logger.error(f"Failed to subscribe to events: {str(e)}")
+        finally:
+            try:
+                await pubsub.unsubscribe("events")
+                await pubsub.aclose()
+                await client.aclose()
+            except Exception as e:
+                logger.error(f"Failed to close event subscription: {str(e)}")
     
     def subscribe_to_user_notifications(self, user_id: str, callback):
         """
@@ -3,6 +3,7 @@ import os
 import spacy
 from pdfminer.high_level import extract_text
 import re
+from typing import BinaryIO
 
 class ResumeParser:
     @staticmethod
@@ -17,74 +18,86 @@ class ResumeParser:
 
         try:
             # Extract text from PDF
-            text = extract_text(temp_path)
+            return ResumeParser._parse_text(extract_text(temp_path))
 
-            # Basic parsing using spaCy
+        finally:
             try:
-                nlp = spacy.load("en_core_web_sm")
+                os.remove(temp_path)
             except OSError:
-                # Fallback if model not available
-                return {"text": text, "name": None, "email": None, "skills": [], "total_experience": 0, "degree": None}
+                pass
 
-            doc = nlp(text)
+    @staticmethod
+    def parse_stream(fileobj: BinaryIO) -> dict:
+        """Parse a resume from a seekable binary file object, without copying it to bytes first."""
+        return ResumeParser._parse_text(extract_text(fileobj))
 
-            # Extract basic info
-            name = None
-            email = None
-            skills = []
+    @staticmethod
+    def _parse_text(text: str) -> dict:
+        """Extract name, email, skills and experience from resume text."""
+        # Basic parsing using spaCy
+        try:
+            nlp = spacy.load("en_core_web_sm")
+        except OSError:
+            # Fallback if model not available
+            return {"text": text, "name": None, "email": None, "skills": [], "total_experience": 0, "degree": None}
 
-            # Find email
-            email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-            email_match = re.search(email_pattern, text)
-            if email_match:
-                email = email_match.group()
+        doc = nlp(text)
 
-            # Find potential name (first proper noun)
-            for token in doc:
-                if token.pos_ == "PROPN" and len(token.text) > 2:
-                    name = token.text
-                    break
+        # Extract basic info
+        name = None
+        email = None
+        skills = []
 
-            # Extract skills (simple keyword matching)
-            skill_keywords = [
-                "python", "java", "javascript", "react", "node", "sql", "machine learning", "ai",
-                "data science", "web development", "mobile development", "cloud", "aws", "azure",
-                "docker", "kubernetes", "fastapi", "django", "flask", "vue", "angular",
-                "typescript", "html", "css", "git", "github"
-            ]
-            for token in doc:
-                if token.text.lower() in skill_keywords:
-                    skills.append(token.text.lower())
+        # Find email
+        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+        email_match = re.search(email_pattern, text)
+        if email_match:
+            email = email_match.group()
 
-            # Estimate experience (look for years)
-            experience = 0
-            experience_pattern = r'(\d+)\s*(?:years?|yrs?)\s*(?:of\s*)?(?:experience|exp)'
-            exp_match = re.search(experience_pattern, text.lower())
-            if exp_match:
-                experience = int(exp_match.group(1))
-            else:
-                # Fallback: look for any number that could be years
-                for token in doc:
-                    if token.text.isdigit() and int(token.text) in range(1, 50):
-                        experience = int(token.text)
-                        break
+        # Find potential name (first proper noun)
+        for token in doc:
+            if token.pos_ == "PROPN" and len(token.text) > 2:
+                name = token.text
+                break
 
-            return {
-                "text": text,
-                "name": name,
-                "email": email,
-                "skills": list(set(skills)),
-                "total_experience": experience,
-                "degree": None
-            }
+        # Extract skills (simple keyword matching)
+        skill_keywords = [
+            "python", "java", "javascript", "react", "node", "sql", "machine learning", "ai",
+            "data science", "web development", "mobile development", "cloud", "aws", "azure",
+            "docker", "kubernetes", "fastapi", "django", "flask", "vue", "angular",
+            "typescript", "html", "css", "git", "github"
+        ]
+        for token in doc:
+            if token.text.lower() in skill_keywords:
+                skills.append(token.text.lower())
 
-        finally:
-            try:
-                os.remove(temp_path)
-            except OSError:
-                pass
+        # Estimate experience (look for years)
+        experience = 0
+        experience_pattern = r'(\d+)\s*(?:years?|yrs?)\s*(?:of\s*)?(?:experience|exp)'
+        exp_match = re.search(experience_pattern, text.lower())
+        if exp_match:
+            experience = int(exp_match.group(1))
+        else:
+            # Fallback: look for any number that could be years
+            for token in doc:
+                if token.text.isdigit() and int(token.text) in range(1, 50):
+                    experience = int(token.text)
+                    break
+
+        return {
+            "text": text,
+            "name": name,
+            "email": email,
+            "skills": list(set(skills)),
+            "total_experience": experience,
+            "degree": None
+        }
 
     # Backwards-compatible wrapper used by Celery worker
     def parse_resume_bytes(self, uploaded_bytes: bytes) -> dict:
         """Compatibility wrapper: older callers expect parse_resume_bytes()."""
         return ResumeParser.parse(uploaded_bytes)
+
+    def parse_resume_stream(self, fileobj: BinaryIO) -> dict:
+        """Worker entry point for resumes streamed from storage into a file object."""
+        return ResumeParser.parse_stream(fileobj)
@@ -215,6 +215,70 @@ Return a JSON array in this exact format:
 Generate exactly {total_questions} questions. Do not include any text outside the JSON array."""
         return prompt
     
+    @staticmethod
+    def get_batch_interview_question_generator_prompt(
+        job_description: str,
+        candidate_resumes: List[str],
+        role_type: str,
+        time_per_question: int = 60,
+        total_questions: int = 5
+    ) -> str:
+        """
+        Prompt for generating timed interview questions for several candidates of one job in a single call.
+        
+        Args:
+            job_description: Full job description
+            candidate_resumes: Resume texts, one per candidate, in output order
+            role_type: Type of role (technical, non-technical, leadership)
+            time_per_question: Time in seconds for each answer (default 60)
+            total_questions: Number of questions to generate per candidate (default 5)
+            
+        Returns:
+            Formatted prompt for batched question generation
+        """
+        candidates = "\n\n".join(
+            f"CANDIDATE {i} RESUME:\n{resume}" for i, resume in enumerate(candidate_resumes)
+        )
+        prompt = f"""
+You are an expert technical interviewer. For EACH of the {len(candidate_resumes)} candidates below, generate {total_questions} targeted interview questions for a {role_type} role.
+Each question should be precisely answerable within the time limit of {time_per_question} seconds.
+Tailor every candidate's questions to their own resume; do not reuse questions across candidates.
+
+JOB DESCRIPTION:
+{job_description}
+
+{candidates}
+
+Question Requirements:
+1. Each question must target ONE specific skill/concept from the job description or resume
+2. Questions must require specific, measurable examples
+3. Each question MUST be completely answerable in {time_per_question} seconds
+4. Questions should progress from basic screening to complex assessment
+5. Include a balanced mix of technical and behavioral questions based on role type
+
+Return a JSON array with exactly {len(candidate_resumes)} elements, where element i is the JSON array of questions for CANDIDATE i:
+[
+  [
+    {{
+      "id": "Q1",
+      "question": "Question text here",
+      "type": "technical|behavioral",
+      "target_skill": "Specific skill being tested",
+      "difficulty_level": "basic|intermediate|advanced",
+      "time_limit": {time_per_question},
+      "scoring_criteria": {{
+        "technical_accuracy": {{"weight": 40}},
+        "communication": {{"weight": 30}},
+        "problem_solving": {{"weight": 30}},
+        "time_management": {{"penalty_per_second": 1, "grace_period": 5}}
+      }}
+    }}
+  ]
+]
+
+Generate exactly {total_questions} questions per candidate. Do not include any text outside the JSON array."""
+        return prompt
+    
     @staticmethod
     def get_resume_parsing_prompt(resume_text: str) -> str:
         """Prompt for structured resume parsing."""
@@ -1,90 +1,265 @@
 import google.generativeai as genai
-from typing import Dict, Any, Tuple
+from google.api_core import exceptions as google_exceptions
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+from typing import Dict, Any, Tuple, AsyncIterator, List, Optional
+from datetime import datetime, timedelta, timezone
 from app.config import settings
+from app.services.cache import CacheService
+import json
 import logging
 import re
 import hashlib
 
+try:
+    from google.generativeai import caching as genai_caching
+except ImportError:
+    # Older SDKs have no context caching; job-match prompts are then always sent whole
+    genai_caching = None
+
 logger = logging.getLogger(__name__)
 
 genai.configure(api_key=settings.gemini_api_key)
 
+# Transient Gemini errors that usually clear within a retry or two; anything
+# else (or exhausting the attempts) falls through to the keyword fallbacks.
+_TRANSIENT_GEMINI_ERRORS = (
+    google_exceptions.ResourceExhausted,
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.DeadlineExceeded,
+)
+
+# Bound on per-process cached-prefix models, and how long a failed cache creation
+# is remembered before the same job description tries again
+JOB_MATCH_MODELS_MAX = 256
+CONTEXT_CACHE_RETRY_SECONDS = 300
+
+_gemini_retry = retry(
+    retry=retry_if_exception_type(_TRANSIENT_GEMINI_ERRORS),
+    wait=wait_exponential(multiplier=0.2, max=2.0),
+    stop=stop_after_attempt(3),
+    reraise=True
+)
+
+
+# Prompt templates. Each is a static instruction prefix followed by a dynamic
+# suffix carrying the request data, so the shared leading tokens are identical
+# across calls. Render with ``str.format_map``; literal braces are escaped.
+_EXPERT_HR_PREAMBLE = """
+You are an expert HR evaluator assisting with candidate assessment.
+Be objective, specific and constructive.
+"""
 
-class ScorerService:
-    """Service for LLM-based scoring and analysis."""
-    
-    def __init__(self):
-        self.model = genai.GenerativeModel('gemini-2.5-flash')
-        # Scoring prompt templates
-        self.templates = {
-            "interview_scoring": """
-You are an expert HR evaluator. Score these interview answers based on the job requirements and resume.
+_RESPONSE_FORMAT_INSTRUCTION = "Provide your response in exactly this format:\n"
+
+_JOB_MATCH_PREFIX_TEMPLATE = _EXPERT_HR_PREAMBLE + """
+TASK: Evaluate how well the resume matches the job description.
+Provide a comprehensive analysis with a numerical score from 0-100.
+
+Focus on:
+1. Technical skills alignment
+2. Experience relevance
+3. Education background
+4. Overall fit for the role
+
+""" + _RESPONSE_FORMAT_INSTRUCTION + """SCORE: [number from 0-100]
+RATIONALE: [detailed explanation in 2-3 sentences explaining the match quality, key strengths, and any gaps]
 
 JOB DESCRIPTION:
 {job_description}
+"""
 
-RESUME SUMMARY:
+# Per-candidate part of the job-match prompt; sent alone when the prefix is cached
+_JOB_MATCH_SUFFIX_TEMPLATE = """
+RESUME:
 {resume_text}
+"""
 
-QUESTIONS & ANSWERS:
-{qa_pairs}
+_JOB_MATCH_TEMPLATE = _JOB_MATCH_PREFIX_TEMPLATE + _JOB_MATCH_SUFFIX_TEMPLATE
+
+_COMM_TEMPLATE = _EXPERT_HR_PREAMBLE + """
+TASK: Analyze the interview transcript for communication skills.
+Evaluate the following aspects and provide scores from 1-10:
+
+1. CLARITY: How clear and articulate is the candidate's speech?
+2. CONFIDENCE: How confident does the candidate sound?
+3. STRUCTURE: How well-organized are the responses?
+4. ENGAGEMENT: How engaging and personable is the candidate?
+5. TECHNICAL_ACCURACY: How accurate is the technical information shared?
+
+""" + _RESPONSE_FORMAT_INSTRUCTION + """CLARITY: [score]/10 - [brief explanation]
+CONFIDENCE: [score]/10 - [brief explanation]
+STRUCTURE: [score]/10 - [brief explanation]
+ENGAGEMENT: [score]/10 - [brief explanation]
+TECHNICAL_ACCURACY: [score]/10 - [brief explanation]
+
+OVERALL_SUMMARY: [2-3 sentence summary of communication strengths and areas for improvement]
+
+TRANSCRIPT:
+{transcript}
+"""
+
+_QGEN_TEMPLATE = _EXPERT_HR_PREAMBLE + """
+TASK: Generate relevant interview questions that can be answered in 1 minute each.
+
+Generate concise questions that:
+1. Test specific technical skills mentioned in the resume
+2. Evaluate problem-solving with real scenarios
+3. Assess communication and cultural fit
+4. Can be answered thoughtfully in 1 minute
+
+For each question:
+1. Focus on one clear concept
+2. Require specific examples
+3. Keep it concise (1-2 sentences)
+
+Format each as: "QUESTION: [question text]"
+
+NUMBER OF QUESTIONS: {num_questions}
+
+JOB DESCRIPTION:
+{job_description}
+
+CANDIDATE RESUME:
+{resume_text}
+"""
+
+_RESPONSE_TEMPLATE = _EXPERT_HR_PREAMBLE + """
+TASK: Review a 1-minute response to a technical interview question.
+
+Evaluate the response from 0-10 points on:
+1. Question Understanding (0-2)
+   - Addresses the core question
+   - Stays focused and relevant
+
+2. Technical Accuracy (0-3)
+   - Demonstrates knowledge
+   - Uses correct terminology
+   - Shows depth of understanding
 
+3. Communication (0-3)
+   - Clear and concise
+   - Well-structured
+   - Professional tone
+
+4. Practical Application (0-2)
+   - Provides real examples
+   - Shows problem-solving ability
+
+""" + _RESPONSE_FORMAT_INSTRUCTION + """SCORE: [0-10]
+RATIONALE: [2-3 sentences with specific examples from their response]
+
+QUESTION:
+{question}
+
+CANDIDATE RESPONSE:
+{response}
+
+JOB CONTEXT:
+{job_description}
+{context}"""
+
+_MULTI_RESPONSE_TEMPLATE = _EXPERT_HR_PREAMBLE + """
+TASK: Review a 1-minute response to a technical interview question.
+
+Score the response from 0-10 on each of these criteria:
+{criteria}
+
+Respond with ONLY a JSON object, one key per criterion, in this shape:
+{{"<criterion>": {{"score": <0-10>, "feedback": "<1-2 sentences with specific examples from their response>"}}}}
+
+QUESTION:
+{question}
+
+CANDIDATE RESPONSE:
+{response}
+
+JOB CONTEXT:
+{job_description}
+{context}"""
+
+_DEFAULT_RESPONSE_CRITERIA = ("technical_accuracy", "communication", "problem_solving")
+
+_INTERVIEW_SCORING_TEMPLATE = _EXPERT_HR_PREAMBLE + """
+TASK: Score the interview answers based on the job requirements and resume.
 Evaluate technical skills and communication ability. For expired answers, score as 0.
 
+Consider:
+1. Accuracy and depth of technical responses
+2. Problem-solving approach
+3. Communication clarity and structure
+4. Overall alignment with role
+
 Return a JSON response with:
-{
+{{
   "technical": 0-100 score for technical knowledge and skills
   "communication": 0-100 score for clarity and articulation
   "final_score": weighted average (60% technical, 40% communication)
   "rationale": 2-3 sentence explanation of the scores
-}
+}}
 
-Consider:
-1. Accuracy and depth of technical responses
-2. Problem-solving approach
-3. Communication clarity and structure
-4. Overall alignment with role
+JOB DESCRIPTION:
+{job_description}
+
+RESUME SUMMARY:
+{resume_text}
+
+QUESTIONS & ANSWERS:
+{qa_pairs}
 """
+
+
+class ScorerService:
+    """Service for LLM-based scoring and analysis."""
+    
+    def __init__(self):
+        # Cap output size to bound worst-case latency; gemini-2.5-flash counts
+        # thinking tokens against this limit, so leave headroom over the answer
+        self.model = genai.GenerativeModel(
+            'gemini-2.5-flash',
+            generation_config=genai.GenerationConfig(candidate_count=1, max_output_tokens=2048)
+        )
+        # Scoring prompt templates
+        self.templates = {
+            "interview_scoring": _INTERVIEW_SCORING_TEMPLATE
         }
+        # Job description hash -> (model bound to its cached prefix, local expiry)
+        self._job_match_models: Dict[str, Tuple[Any, datetime]] = {}
+        self._cache = None  # Created on first context-cache lookup
     
-    def score_candidate(self, resume_text: str, job_description: str) -> Dict[str, Any]:
+    def score_candidate(self, resume_text: str, job_description: str, fallback: bool = True) -> Dict[str, Any]:
         """
         Score candidate against job description using LLM.
         
         Args:
             resume_text: Candidate's resume text
             job_description: Job description text
+            fallback: Keyword-score on LLM failure; if False the error is raised so the
+                caller can batch fallbacks through fallback_score_batch
         
         Returns:
             Dict with score and rationale
         """
         try:
-            prompt = f"""
-You are an expert HR AI assistant specializing in candidate evaluation.
-
-TASK: Evaluate how well this resume matches the job description.
-Provide a comprehensive analysis with a numerical score from 0-100.
-
-JOB DESCRIPTION:
-{job_description}
-
-RESUME:
-{resume_text}
-
-Please provide your evaluation in the following format:
-SCORE: [number from 0-100]
-RATIONALE: [detailed explanation in 2-3 sentences explaining the match quality, key strengths, and any gaps]
-
-Focus on:
-1. Technical skills alignment
-2. Experience relevance
-3. Education background
-4. Overall fit for the role
-
-Be objective and provide constructive feedback.
-"""
-            
-            response = self.model.generate_content(prompt)
+            response = None
+            cached_model = self._job_match_model(job_description)
+            if cached_model is not None:
+                try:
+                    response = self._generate(
+                        _JOB_MATCH_SUFFIX_TEMPLATE.format_map({"resume_text": resume_text}),
+                        model=cached_model
+                    )
+                except Exception as e:
+                    # Expired or evicted cache: forget it and send the whole prompt
+                    logger.warning(f"Cached job description prompt failed, sending full prompt: {str(e)}")
+                    self._job_match_models = {
+                        k: v for k, v in self._job_match_models.items() if v[0] is not cached_model
+                    }
+            if response is None:
+                prompt = _JOB_MATCH_TEMPLATE.format_map({
+                    "job_description": job_description,
+                    "resume_text": resume_text
+                })
+                response = self._generate(prompt)
             output = getattr(response, 'text', '') or ''
             
             # Parse score and rationale
@@ -99,6 +274,8 @@ Be objective and provide constructive feedback.
             
         except Exception as e:
             logger.error(f"LLM scoring failed: {str(e)}")
+            if not fallback:
+                raise
             # Fallback scoring
             return self._fallback_scoring(resume_text, job_description)
     
@@ -113,31 +290,9 @@ Be objective and provide constructive feedback.
             Dict with communication analysis
         """
         try:
-            prompt = f"""
-You are an expert communication analyst. Analyze this interview transcript for communication skills.
-
-TRANSCRIPT:
-{transcript}
-
-Please evaluate the following aspects and provide scores from 1-10:
-
-1. CLARITY: How clear and articulate is the candidate's speech?
-2. CONFIDENCE: How confident does the candidate sound?
-3. STRUCTURE: How well-organized are the responses?
-4. ENGAGEMENT: How engaging and personable is the candidate?
-5. TECHNICAL_ACCURACY: How accurate is the technical information shared?
-
-Provide your analysis in this format:
-CLARITY: [score]/10 - [brief explanation]
-CONFIDENCE: [score]/10 - [brief explanation]
-STRUCTURE: [score]/10 - [brief explanation]
-ENGAGEMENT: [score]/10 - [brief explanation]
-TECHNICAL_ACCURACY: [score]/10 - [brief explanation]
-
-OVERALL_SUMMARY: [2-3 sentence summary of communication strengths and areas for improvement]
-"""
+            prompt = _COMM_TEMPLATE.format_map({"transcript": transcript})
             
-            response = self.model.generate_content(prompt)
+            response = self._generate(prompt)
             output = getattr(response, 'text', '') or ''
             
             # Parse scores and summary
@@ -172,30 +327,13 @@ OVERALL_SUMMARY: [2-3 sentence summary of communication strengths and areas for
             List of questions with IDs
         """
         try:
-            prompt = f"""
-You are an expert interviewer. Generate {num_questions} relevant interview questions that can be answered in 1 minute each.
-
-JOB DESCRIPTION:
-{job_description}
-
-CANDIDATE RESUME:
-{resume_text}
-
-Generate concise questions that:
-1. Test specific technical skills mentioned in the resume
-2. Evaluate problem-solving with real scenarios
-3. Assess communication and cultural fit
-4. Can be answered thoughtfully in 1 minute
-
-For each question:
-1. Focus on one clear concept
-2. Require specific examples
-3. Keep it concise (1-2 sentences)
-
-Format each as: "QUESTION: [question text]"
-"""
+            prompt = _QGEN_TEMPLATE.format_map({
+                "num_questions": num_questions,
+                "job_description": job_description,
+                "resume_text": resume_text
+            })
             
-            response = self.model.generate_content(prompt)
+            response = self._generate(prompt)
             output = getattr(response, 'text', '') or ''
             
             # Parse questions
@@ -207,6 +345,82 @@ Format each as: "QUESTION: [question text]"
             logger.error(f"Question generation failed: {str(e)}")
             return self._fallback_questions()
     
+    @_gemini_retry
+    def _generate(self, prompt: str, model=None):
+        """Call Gemini, retrying transient quota and availability errors."""
+        return (model or self.model).generate_content(prompt)
+    
+    def _job_match_model(self, job_description: str) -> Optional[Any]:
+        """
+        Model whose Gemini cached content holds the job-match prompt prefix for this job description.
+        
+        The prefix (instructions and job description) is uploaded once per description and
+        shared across workers through Redis, so each candidate only sends its resume.
+        
+        Args:
+            job_description: Job description text
+        
+        Returns:
+            GenerativeModel bound to the cached prefix, or None to send the full prompt
+        """
+        min_chars = settings.gemini_context_cache_min_chars
+        if genai_caching is None or not min_chars or len(job_description) < min_chars:
+            return None
+        if self._cache is None:
+            self._cache = CacheService()
+        jd_hash = self._cache.hash_text(job_description)
+        now = datetime.now(timezone.utc)
+        entry = self._job_match_models.get(jd_hash)
+        if entry and entry[1] > now:
+            return entry[0]
+        if len(self._job_match_models) >= JOB_MATCH_MODELS_MAX:
+            self._job_match_models = {k: v for k, v in self._job_match_models.items() if v[1] > now}
+        
+        try:
+            cached = None
+            name = self._cache.get_gemini_cached_content(jd_hash)
+            if name:
+                try:
+                    cached = genai_caching.CachedContent.get(name)
+                except Exception:
+                    cached = None
+            if cached is None:
+                prefix = _JOB_MATCH_PREFIX_TEMPLATE.format_map({"job_description": job_description})
+                cached = genai_caching.CachedContent.create(
+                    model=self.model.model_name,
+                    contents=[prefix],
+                    ttl=timedelta(seconds=settings.gemini_context_cache_ttl)
+                )
+            
+            # Stop using it a minute early so requests never race its expiry
+            expires = cached.expire_time - timedelta(seconds=60)
+            remaining = int((expires - now).total_seconds())
+            if remaining <= 0:
+                return None
+            self._cache.set_gemini_cached_content(jd_hash, cached.name, remaining)
+            model = genai.GenerativeModel.from_cached_content(
+                cached_content=cached,
+                generation_config=genai.GenerationConfig(candidate_count=1, max_output_tokens=2048)
+            )
+            self._job_match_models[jd_hash] = (model, expires)
+            return model
+        except Exception as e:
+            # Too short for Gemini's cache minimum, quota, etc.: the full prompt still works,
+            # and the next attempt for this description waits a while
+            logger.warning(f"Gemini context cache unavailable for job description: {str(e)}")
+            self._job_match_models[jd_hash] = (None, now + timedelta(seconds=CONTEXT_CACHE_RETRY_SECONDS))
+            return None
+    
+    @_gemini_retry
+    async def _generate_async(self, prompt: str):
+        """Await a Gemini response on the event loop, retrying transient errors."""
+        return await self.model.generate_content_async(prompt)
+    
+    @_gemini_retry
+    async def _generate_stream(self, prompt: str):
+        """Open a streaming Gemini response, retrying transient errors on connect."""
+        return await self.model.generate_content_async(prompt, stream=True)
+    
     def _parse_llm_response(self, output: str) -> Tuple[int, str]:
         """Parse LLM response to extract score and rationale."""
         try:
@@ -312,6 +526,36 @@ Format each as: "QUESTION: [question text]"
                 "timestamp": None
             }
     
+    def fallback_score_batch(self, job_description: str, resumes: List[str]) -> List[Dict[str, Any]]:
+        """
+        Keyword-match fallback scoring for many resumes against one job description.
+        
+        Same scores as ``_fallback_scoring``, but the job description is tokenized once.
+        
+        Args:
+            job_description: Job description text
+            resumes: List of resume texts
+        
+        Returns:
+            List of score dicts, one per resume, in input order
+        """
+        job_keywords = set(job_description.lower().split())
+        total_keywords = len(job_keywords)
+        results = []
+        for resume_text in resumes:
+            matches = len(job_keywords.intersection(resume_text.lower().split()))
+            if total_keywords > 0:
+                score = min(100, int((matches / total_keywords) * 100))
+            else:
+                score = 50
+            results.append({
+                "score": score,
+                "rationale": f"Fallback score based on keyword matching: {matches} matching keywords out of {total_keywords} total job keywords.",
+                "model": "fallback",
+                "timestamp": None
+            })
+        return results
+    
     def _fallback_communication_analysis(self, transcript: str) -> Dict[str, Any]:
         """Fallback communication analysis."""
         try:
@@ -372,21 +616,10 @@ Format each as: "QUESTION: [question text]"
             Dict with technical score, communication score, final score and rationale
         """
         try:
-            # Format QA pairs for prompt
-            qa_text = "\n\n".join([
-                f"Q: {qa['question']}\nA: {qa['answer']}\nExpired: {qa['expired']}"
-                for qa in scoring_data['qa_pairs']
-            ])
-            
-            # Build full prompt
-            prompt = self.templates["interview_scoring"].format(
-                job_description=scoring_data['job_description'],
-                resume_text=scoring_data['resume_text'],
-                qa_pairs=qa_text
-            )
+            prompt = self._build_interview_scoring_prompt(scoring_data)
             
             # Get LLM response
-            response = self.model.generate_content(prompt)
+            response = self._generate(prompt)
             output = getattr(response, 'text', '') or ''
             
             # Parse scores and rationale from response
@@ -402,6 +635,58 @@ Format each as: "QUESTION: [question text]"
         except Exception as e:
             logger.error(f"Interview scoring failed: {str(e)}")
             return self._fallback_interview_scoring(scoring_data)
+
+    async def score_interview_answers_stream(
+        self,
+        scoring_data: Dict[str, Any],
+        prompt_hash: str = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream interview scoring so callers can surface partial feedback.
+
+        Yields ``{"type": "chunk", "text": ...}`` events as Gemini generates
+        output, followed by a single ``{"type": "result", "scores": ...}`` event
+        once the full response has been parsed. Falls back to completion-based
+        scoring if the stream fails.
+
+        Args:
+            scoring_data: Same shape as for ``score_interview_answers``
+            prompt_hash: Optional hash of prompt template used
+        """
+        buffer = []
+        try:
+            prompt = self._build_interview_scoring_prompt(scoring_data)
+            response = await self._generate_stream(prompt)
+
+            async for chunk in response:
+                text = getattr(chunk, 'text', '') or ''
+                if text:
+                    buffer.append(text)
+                    yield {"type": "chunk", "text": text}
+
+            # The parser only needs the final JSON, so parse once the stream completes
+            scores = self._parse_interview_scores("".join(buffer))
+            scores["model_version"] = "gemini-2.5-flash"
+            if prompt_hash:
+                scores["prompt_hash"] = prompt_hash
+
+        except Exception as e:
+            logger.error(f"Streaming interview scoring failed: {str(e)}")
+            scores = self._fallback_interview_scoring(scoring_data)
+
+        yield {"type": "result", "scores": scores}
+
+    def _build_interview_scoring_prompt(self, scoring_data: Dict[str, Any]) -> str:
+        """Render the interview scoring prompt from job, resume and QA pairs."""
+        qa_text = "\n\n".join([
+            f"Q: {qa['question']}\nA: {qa['answer']}\nExpired: {qa['expired']}"
+            for qa in scoring_data['qa_pairs']
+        ])
+
+        return self.templates["interview_scoring"].format_map({
+            "job_description": scoring_data['job_description'],
+            "resume_text": scoring_data['resume_text'],
+            "qa_pairs": qa_text
+        })
     
     def _parse_interview_scores(self, output: str) -> Dict[str, Any]:
         """Parse interview scoring response from LLM."""
@@ -494,50 +779,15 @@ Format each as: "QUESTION: [question text]"
         Returns:
             Tuple[float, str]: Score (0-10) and feedback
         """
-        context = f"""
-Full Interview Context:
-{transcript if transcript else 'No additional context available'}
-"""
-
-        prompt = f"""
-You are an expert interviewer reviewing a 1-minute response to a technical question.
-
-QUESTION:
-{question}
-
-CANDIDATE RESPONSE:
-{response}
-
-JOB CONTEXT:
-{job_description}
-
-{context if transcript else ''}
-
-Evaluate this 1-minute response from 0-10 points on:
-1. Question Understanding (0-2)
-   - Addresses the core question
-   - Stays focused and relevant
-   
-2. Technical Accuracy (0-3)
-   - Demonstrates knowledge
-   - Uses correct terminology
-   - Shows depth of understanding
-
-3. Communication (0-3)
-   - Clear and concise
-   - Well-structured
-   - Professional tone
-
-4. Practical Application (0-2)
-   - Provides real examples
-   - Shows problem-solving ability
-
-Provide your response as:
-SCORE: [0-10]
-FEEDBACK: [2-3 sentences with specific examples from their response]
-"""
+        context = f"\nFULL INTERVIEW CONTEXT:\n{transcript}\n" if transcript else ""
+        prompt = _RESPONSE_TEMPLATE.format_map({
+            "question": question,
+            "response": response,
+            "job_description": job_description,
+            "context": context
+        })
         try:
-            response = self.model.generate_content(prompt)
+            response = self._generate(prompt)
             output = getattr(response, 'text', '') or ''
             
             # Parse score and feedback
@@ -548,6 +798,105 @@ FEEDBACK: [2-3 sentences with specific examples from their response]
             logger.error(f"Response scoring failed: {str(e)}")
             return 5.0, "Unable to score response due to technical error."
 
+    def score_response_multi(
+        self,
+        question: str,
+        response: str,
+        job_description: str,
+        transcript: str = None,
+        criteria: Tuple[str, ...] = _DEFAULT_RESPONSE_CRITERIA
+    ) -> Dict[str, Tuple[float, str]]:
+        """Score a response on several criteria with a single LLM call.
+
+        Args:
+            question (str): The interview question
+            response (str): The candidate's response
+            job_description (str): The job description
+            transcript (str, optional): Full interview transcript for context
+            criteria: Criterion names to score
+
+        Returns:
+            Dict[str, Tuple[float, str]]: criterion -> (score 0-10, feedback)
+        """
+        prompt = self._build_multi_response_prompt(question, response, job_description, transcript, criteria)
+        try:
+            result = self._generate(prompt)
+            return self._parse_multi_response_scores(getattr(result, 'text', '') or '', criteria)
+
+        except Exception as e:
+            logger.error(f"Multi-criterion response scoring failed: {str(e)}")
+            return self._fallback_multi_response_scores(criteria)
+
+    async def score_response_multi_async(
+        self,
+        question: str,
+        response: str,
+        job_description: str,
+        transcript: str = None,
+        criteria: Tuple[str, ...] = _DEFAULT_RESPONSE_CRITERIA
+    ) -> Dict[str, Tuple[float, str]]:
+        """Async counterpart of score_response_multi using the native Gemini async client.
+
+        Returns:
+            Dict[str, Tuple[float, str]]: criterion -> (score 0-10, feedback)
+        """
+        prompt = self._build_multi_response_prompt(question, response, job_description, transcript, criteria)
+        try:
+            result = await self._generate_async(prompt)
+            return self._parse_multi_response_scores(getattr(result, 'text', '') or '', criteria)
+
+        except Exception as e:
+            logger.error(f"Multi-criterion response scoring failed: {str(e)}")
+            return self._fallback_multi_response_scores(criteria)
+
+    def _build_multi_response_prompt(
+        self,
+        question: str,
+        response: str,
+        job_description: str,
+        transcript: str,
+        criteria: Tuple[str, ...]
+    ) -> str:
+        """Render the multi-criterion scoring prompt."""
+        context = f"\nFULL INTERVIEW CONTEXT:\n{transcript}\n" if transcript else ""
+        return _MULTI_RESPONSE_TEMPLATE.format_map({
+            "criteria": "\n".join(f"- {name}" for name in criteria),
+            "question": question,
+            "response": response,
+            "job_description": job_description,
+            "context": context
+        })
+
+    def _parse_multi_response_scores(self, output: str, criteria: Tuple[str, ...]) -> Dict[str, Tuple[float, str]]:
+        """Map the LLM's JSON object onto (score, feedback) per criterion."""
+        parsed = self._parse_json_object(output)
+        scores = {}
+        for name in criteria:
+            entry = parsed.get(name) or {}
+            scores[name] = (
+                float(entry.get("score", 5.0)),
+                str(entry.get("feedback", ""))
+            )
+        return scores
+
+    def _fallback_multi_response_scores(self, criteria: Tuple[str, ...]) -> Dict[str, Tuple[float, str]]:
+        """Neutral scores used when the LLM call or parsing fails."""
+        return {
+            name: (5.0, "Unable to score response due to technical error.")
+            for name in criteria
+        }
+
+    def _parse_json_object(self, output: str) -> Dict[str, Any]:
+        """Parse a JSON object from LLM output, falling back to the outermost {...} block."""
+        try:
+            return json.loads(output)
+        except ValueError:
+            start = output.find('{')
+            end = output.rfind('}')
+            if start == -1 or end <= start:
+                raise ValueError("No JSON object found in LLM response")
+            return json.loads(output[start:end + 1])
+
 
 # Legacy function for backward compatibility
 def llm_score(job_desc: str, resume_text: str) -> Tuple[int, str]:
@@ -2,9 +2,11 @@ import os
 import uuid
 import logging
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, BinaryIO
 from google.cloud import storage
 from google.cloud.exceptions import NotFound
+from pdfminer.high_level import extract_text
+from tempfile import SpooledTemporaryFile
 from app.config import settings
 
 logger = logging.getLogger(__name__)
@@ -15,6 +17,9 @@ class StorageService:
     Handles upload, download, delete, and signed URLs for files.
     """
 
+    # GCS JSON API batch requests accept at most 100 calls
+    DELETE_BATCH_SIZE = 100
+
     def __init__(self):
         """Initialize storage service with proper development mode support."""
         self.client = None
@@ -25,6 +30,7 @@ class StorageService:
         if settings.is_development and not settings.has_gcs_config:
             logger.info("Running in development mode with mock storage")
             self.bucket_name = "mock-development-bucket"
+            self._bucket_prefix = f"gs://{self.bucket_name}/"
             return
 
         # Attempt to initialize GCS client
@@ -52,6 +58,17 @@ class StorageService:
                 logger.error(f"GCS initialization failed in production: {e}")
                 raise
 
+        self._bucket_prefix = f"gs://{self.bucket_name}/"
+
+    # ----------------------------------------------------------------------
+    def _blob_path(self, gcs_path: str) -> str:
+        """Strip the gs://bucket/ prefix from a GCS path, returning the blob name."""
+        if gcs_path.startswith(self._bucket_prefix):
+            return gcs_path[len(self._bucket_prefix):]
+        if gcs_path.startswith("gs://"):
+            return gcs_path[5:].partition("/")[2]
+        return gcs_path
+
     # ----------------------------------------------------------------------
     def upload_to_gcs(self, file_content: bytes, file_name: str, folder: str = None) -> str:
         """
@@ -126,12 +143,7 @@ class StorageService:
         try:
             if not self.bucket:
                 raise RuntimeError("Google Cloud Storage client not configured. Set credentials or GCS bucket name.")
-            # Extract path from gs:// URL if needed
-            if gcs_path.startswith("gs://"):
-                path_parts = gcs_path.split("/", 3)
-                blob_path = path_parts[3] if len(path_parts) >= 4 else None
-            else:
-                blob_path = gcs_path
+            blob_path = self._blob_path(gcs_path)
 
             if not blob_path:
                 raise ValueError("Invalid GCS path format")
@@ -148,6 +160,54 @@ class StorageService:
             print(f"❌ Error downloading file: {e}")
             raise
 
+    # ----------------------------------------------------------------------
+    def download_file_to(self, gcs_path: str, fileobj: BinaryIO) -> int:
+        """
+        Stream a file from Google Cloud Storage into a writable file object.
+
+        Args:
+            gcs_path: GCS path (gs://bucket/path or just path)
+            fileobj: Binary file object to write into; left positioned at the end
+
+        Returns:
+            Number of bytes written
+        """
+        try:
+            if not self.bucket:
+                raise RuntimeError("Google Cloud Storage client not configured. Set credentials or GCS bucket name.")
+            blob_path = self._blob_path(gcs_path)
+
+            if not blob_path:
+                raise ValueError("Invalid GCS path format")
+
+            start = fileobj.tell()
+            self.bucket.blob(blob_path).download_to_file(fileobj)
+            print(f"📥 Downloaded file successfully: {blob_path}")
+            return fileobj.tell() - start
+
+        except NotFound:
+            print(f"⚠️ File not found in GCS: {gcs_path}")
+            raise FileNotFoundError(f"File not found: {gcs_path}")
+        except Exception as e:
+            print(f"❌ Error downloading file: {e}")
+            raise
+
+    # ----------------------------------------------------------------------
+    def download_text(self, gcs_path: str) -> str:
+        """
+        Download a PDF resume from Google Cloud Storage and extract its text.
+
+        Args:
+            gcs_path: GCS path (gs://bucket/path or just path)
+
+        Returns:
+            Extracted text
+        """
+        with SpooledTemporaryFile(max_size=2 * 1024 * 1024) as fileobj:
+            self.download_file_to(gcs_path, fileobj)
+            fileobj.seek(0)
+            return extract_text(fileobj)
+
     # ----------------------------------------------------------------------
     def delete_file(self, gcs_path: str) -> bool:
         """
@@ -163,11 +223,7 @@ class StorageService:
             if not self.bucket:
                 raise RuntimeError("Google Cloud Storage client not configured. Set credentials or GCS bucket name.")
             # Extract blob path
-            if gcs_path.startswith("gs://"):
-                path_parts = gcs_path.split("/", 3)
-                blob_path = path_parts[3] if len(path_parts) >= 4 else None
-            else:
-                blob_path = gcs_path
+            blob_path = self._blob_path(gcs_path)
 
             if not blob_path:
                 raise ValueError("Invalid GCS path format")
@@ -184,6 +240,41 @@ class StorageService:
             print(f"❌ Error deleting file: {e}")
             return False
 
+    # ----------------------------------------------------------------------
+    def delete_files(self, gcs_paths: List[str]) -> Dict[str, str]:
+        """
+        Delete many files using GCS batch requests (up to 100 deletes per HTTP call).
+
+        Args:
+            gcs_paths: Full GCS paths to delete
+
+        Returns:
+            Dict of gcs_path -> error message for paths that could not be deleted.
+            Paths that were already missing count as deleted.
+        """
+        if not self.bucket:
+            raise RuntimeError("Google Cloud Storage client not configured. Set credentials or GCS bucket name.")
+
+        failures: Dict[str, str] = {}
+        for start in range(0, len(gcs_paths), self.DELETE_BATCH_SIZE):
+            chunk = gcs_paths[start:start + self.DELETE_BATCH_SIZE]
+            try:
+                with self.client.batch():
+                    for gcs_path in chunk:
+                        self.bucket.delete_blob(self._blob_path(gcs_path))
+            except Exception:
+                # A batch reports only its first failure; redo the chunk one by one to pinpoint them
+                for gcs_path in chunk:
+                    try:
+                        self.bucket.delete_blob(self._blob_path(gcs_path))
+                    except NotFound:
+                        pass
+                    except Exception as e:
+                        failures[gcs_path] = str(e)
+
+        print(f"🗑️ Deleted {len(gcs_paths) - len(failures)} of {len(gcs_paths)} files")
+        return failures
+
     # ----------------------------------------------------------------------
     def get_file_info(self, gcs_path: str) -> Optional[Dict[str, Any]]:
         """
@@ -199,11 +290,7 @@ class StorageService:
             if not self.bucket:
                 raise RuntimeError("Google Cloud Storage client not configured. Set credentials or GCS bucket name.")
             # Extract path
-            if gcs_path.startswith("gs://"):
-                path_parts = gcs_path.split("/", 3)
-                blob_path = path_parts[3] if len(path_parts) >= 4 else None
-            else:
-                blob_path = gcs_path
+            blob_path = self._blob_path(gcs_path)
 
             if not blob_path:
                 raise ValueError("Invalid GCS path format")
@@ -243,11 +330,7 @@ class StorageService:
             Signed URL (string)
         """
         try:
-            if gcs_path.startswith("gs://"):
-                path_parts = gcs_path.split("/", 3)
-                blob_path = path_parts[3] if len(path_parts) >= 4 else None
-            else:
-                blob_path = gcs_path
+            blob_path = self._blob_path(gcs_path)
 
             if not blob_path:
                 raise ValueError("Invalid GCS path format")
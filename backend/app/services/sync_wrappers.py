@@ -1,78 +1,214 @@
 """Synchronous wrappers around async services for Celery workers."""
 
 import asyncio
-import logging
 import functools
+import logging
+import os
+import threading
 import uuid
 
 # Configure logging
 logger = logging.getLogger(__name__)
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 from datetime import datetime, timedelta
-from .db_utils import DatabaseService
 from app.config import settings
-from pymongo import MongoClient
+from app.services.cache import CacheService
+from pymongo import MongoClient, ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 from bson.objectid import ObjectId
+from celery.signals import worker_process_init, worker_process_shutdown
+
+try:
+    import uvloop
+except ImportError:
+    # uvloop is optional (installed with uvicorn[standard]); fall back to asyncio's loop
+    uvloop = None
+
+# Shared pymongo client, created lazily once per process. Celery's prefork
+# pool forks after import, so the owning PID is tracked and a forked child
+# builds its own client instead of reusing the parent's sockets.
+_CLIENT = None
+_CLIENT_PID = None
+
+# Connection settings bound once at import
+_MONGO_URL = settings.mongo_url
+_MONGO_DB = settings.mongo_db_name
+
+# Documents per getMore on the cleanup cursors; keeps memory at O(batch)
+CLEANUP_CURSOR_BATCH_SIZE = 1000
 
 
 def _get_sync_db():
-    client = MongoClient(settings.mongo_url)
-    return client[settings.mongo_db_name]
+    global _CLIENT, _CLIENT_PID
+    pid = os.getpid()
+    if _CLIENT is None or _CLIENT_PID != pid:
+        # Transient errors are retried in-driver; reads go to a secondary only when no primary is up
+        _CLIENT = MongoClient(
+            _MONGO_URL, maxPoolSize=50, minPoolSize=5, connect=False,
+            retryReads=True, retryWrites=True,
+            readPreference="primaryPreferred", readConcernLevel="local",
+            socketTimeoutMS=settings.mongo_socket_timeout_ms
+        )
+        _CLIENT_PID = pid
+    return _CLIENT[_MONGO_DB]
 
 
-def run_async(coro):
-    """Helper to run coroutine in sync context."""
-    # Create a fresh event loop and run the coroutine to avoid reusing/closing the global loop.
-    loop = asyncio.new_event_loop()
-    try:
+@functools.lru_cache(maxsize=4096)
+def _oid(value: str) -> Optional[ObjectId]:
+    """Parse a hex id into an ObjectId (None if it is not one), cached for repeated lookups."""
+    return ObjectId(value) if ObjectId.is_valid(value) else None
+
+
+_CACHE: Optional[CacheService] = None
+
+
+def _applications_migrated() -> bool:
+    """Whether every application carries application_id (see backfill_application_ids.py)."""
+    global _CACHE
+    if _CACHE is None:
+        _CACHE = CacheService()
+    return _CACHE.applications_migrated()
+
+
+def _application_lookup(application_id: str) -> Dict[str, Any]:
+    """Query for one application: application_id alone once backfilled, else the $or fallback."""
+    if _applications_migrated():
+        return {"application_id": application_id}
+    # The indexed branch first
+    return {"$or": [{"application_id": application_id}, {"_id": application_id}]}
+
+
+@worker_process_init.connect
+def _reset_sync_client(**kwargs):
+    """Drop the inherited client so each forked worker opens its own pool."""
+    global _CLIENT, _CLIENT_PID
+    _CLIENT = None
+    _CLIENT_PID = None
+
+
+def _close_sync_client():
+    """Close the shared client's pool; the next _get_sync_db() call reopens one."""
+    global _CLIENT, _CLIENT_PID
+    if _CLIENT is not None:
+        _CLIENT.close()
+        _CLIENT = None
+        _CLIENT_PID = None
+
+
+@worker_process_shutdown.connect
+def _shutdown_sync_client(**kwargs):
+    _close_sync_client()
+
+
+# One long-lived event loop per worker thread, reused by run_async
+_tls = threading.local()
+
+
+def _get_worker_loop() -> asyncio.AbstractEventLoop:
+    loop = getattr(_tls, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+        # Bind once at creation; run_async then never touches asyncio's TLS
         asyncio.set_event_loop(loop)
-        return loop.run_until_complete(coro)
-    finally:
-        try:
-            loop.run_until_complete(loop.shutdown_asyncgens())
-        except Exception:
-            pass
-        asyncio.set_event_loop(None)
-        loop.close()
+        _tls.loop = loop
+    return loop
 
 
-class SyncDatabaseService:
-    """Sync wrapper for DatabaseService to be used in Celery tasks."""
+def _close_worker_loop():
+    loop = getattr(_tls, "loop", None)
+    _tls.loop = None
+    if loop is None or loop.is_closed():
+        return
+    try:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+    except Exception:
+        pass
+    loop.close()
+
 
-    def __init__(self):
-        # Do not create DatabaseService here; instantiate it inside the event loop for each call
-        self._async_service = None
+@worker_process_init.connect
+def _reset_worker_loop(**kwargs):
+    """Forget any loop inherited from the parent; its selector is not fork-safe."""
+    _tls.loop = None
+
+
+@worker_process_shutdown.connect
+def _shutdown_worker_loop(**kwargs):
+    _close_worker_loop()
+
+
+def run_async(coro):
+    """Helper to run coroutine in sync context.
 
-    def _call(self, method_name: str, *args, **kwargs):
-        """Run a DatabaseService method inside a fresh event loop to avoid 'Event loop is closed' errors."""
-        async def _inner():
-            svc = DatabaseService()
-            method = getattr(svc, method_name)
-            return await method(*args, **kwargs)
+    Runs on a persistent per-thread event loop instead of creating and
+    tearing down a loop for every call.
+    """
+    return _get_worker_loop().run_until_complete(coro)
 
-        return run_async(_inner())
+
+class SyncDatabaseService:
+    """Synchronous pymongo counterpart of DatabaseService for Celery tasks.
+
+    Mirrors DatabaseService's collections and queries, but talks to MongoDB
+    through the shared process-wide pymongo client instead of spinning up an
+    event loop and a Motor client for every call.
+    """
 
     # Job Management
     def create_job(self, job_data: Dict[str, Any]) -> str:
-        """Sync wrapper for create_job."""
-        return self._call('create_job', job_data)
+        """Create a new job record."""
+        try:
+            db = _get_sync_db()
+            now = datetime.utcnow()
+            job_data.update({
+                "created_at": now,
+                "updated_at": now,
+                "status": "PENDING"
+            })
+            result = db.jobs.insert_one(job_data)
+            return str(result.inserted_id)
+        except Exception as e:
+            logger.error(f"Sync create_job failed: {str(e)}")
+            raise
 
     def update_job_status(self, job_id: str, status: str, metadata: Dict[str, Any] = None) -> bool:
-        """Sync wrapper for update_job_status."""
-        return self._call('update_job_status', job_id, status, metadata)
+        """Update job status."""
+        try:
+            db = _get_sync_db()
+            update_data = {
+                "status": status,
+                "updated_at": datetime.utcnow()
+            }
+            if metadata:
+                update_data["metadata"] = metadata
+
+            result = db.jobs.update_one({"_id": job_id}, {"$set": update_data})
+            return result.modified_count > 0
+        except Exception as e:
+            logger.error(f"Sync update_job_status failed: {str(e)}")
+            return False
 
     def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
-        """Sync wrapper for get_job."""
-        return self._call('get_job', job_id)
+        """Get job by job_id, falling back to _id."""
+        try:
+            db = _get_sync_db()
+            job = db.jobs.find_one({"job_id": job_id})
+            if not job:
+                job = db.jobs.find_one({"_id": job_id})
+            if job and job.get("_id"):
+                job["_id"] = str(job["_id"])
+            return job
+        except Exception as e:
+            logger.error(f"Sync get_job failed: {str(e)}")
+            return None
 
     # Candidate Management
     def save_candidate(self, candidate_data: Dict[str, Any]) -> str:
         """Sync wrapper for save_candidate.
 
         Use a synchronous pymongo path to avoid AsyncIO loop issues in Celery workers.
-        Will update existing candidate if email already exists.
+        Upserts on email, so an existing candidate with the same email is updated.
         """
-        existing = None
         try:
             db = _get_sync_db()
             email = candidate_data.get('email')
@@ -84,95 +220,416 @@ class SyncDatabaseService:
                 # persist placeholder back into candidate_data so downstream code sees it
                 candidate_data['email'] = email
 
-            # Try to find existing candidate by email
-            existing = db.candidates.find_one({"email": email})
-
-            if existing:
-                # Update existing candidate
-                update_data = candidate_data.copy()
-                update_data["updated_at"] = datetime.utcnow()
-
-                # Don't overwrite created_at if it exists
-                if "created_at" in update_data and existing.get("created_at"):
-                    del update_data["created_at"]
-
-                result = db.candidates.find_one_and_update(
-                    {"_id": existing["_id"]},
-                    {"$set": update_data},
-                    return_document=True
+            now = datetime.utcnow()
+            update_fields = {k: v for k, v in candidate_data.items() if k not in ("_id", "created_at")}
+            update_fields["updated_at"] = now
+            on_insert = {"created_at": now}
+            if "stage" not in update_fields:
+                on_insert["stage"] = "Profile Created"
+
+            # Single upsert keyed on the unique email index: no find-then-write race
+            def _upsert():
+                return db.candidates.find_one_and_update(
+                    {"email": email},
+                    {"$set": update_fields, "$setOnInsert": on_insert},
+                    upsert=True,
+                    return_document=ReturnDocument.AFTER,
+                    projection={"_id": 1}
                 )
-                return str(result["_id"])
-            else:
-                # Insert new candidate
-                candidate_data.update({
-                    "created_at": datetime.utcnow(),
-                    "updated_at": datetime.utcnow(),
-                    "stage": "Profile Created"
-                })
-                res = db.candidates.insert_one(candidate_data)
-                return str(res.inserted_id)
-        except Exception as e:
-            logger.error(f"Error saving candidate: {str(e)}")
-            # Return existing ID even if update fails
-            if existing:
-                return str(existing["_id"])
+
+            try:
+                result = _upsert()
+            except DuplicateKeyError:
+                # Two workers upserted the same new email concurrently; the loser now matches
+                result = _upsert()
+            return str(result["_id"])
+        except Exception as e:
+            logger.error("Error saving candidate: %s", e, exc_info=True)
             raise
 
     def create_candidate_profile(self, candidate_data: Dict[str, Any], user_id: str) -> str:
-        """Sync wrapper for create_candidate_profile."""
-        return self._call('create_candidate_profile', candidate_data, user_id)
+        """Create a new candidate profile."""
+        try:
+            db = _get_sync_db()
+            now = datetime.utcnow()
+            candidate_data.update({
+                "user_id": user_id,
+                "created_at": now,
+                "updated_at": now,
+                "stage": "Profile Created",
+                "latest_score": None
+            })
+            result = db.candidates.insert_one(candidate_data)
+            return str(result.inserted_id)
+        except Exception as e:
+            logger.error(f"Sync create_candidate_profile failed: {str(e)}")
+            raise
 
-    def get_candidate(self, candidate_id: str) -> Optional[Dict[str, Any]]:
-        """Sync wrapper for get_candidate."""
-        return self._call('get_candidate', candidate_id)
+    def get_candidate(self, candidate_id: str, projection: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """Get candidate by ObjectId, string _id or candidate_id field; projection limits the returned fields."""
+        try:
+            db = _get_sync_db()
+            candidate = None
+            oid = _oid(candidate_id)
+            if oid is not None:
+                candidate = db.candidates.find_one({"_id": oid}, projection)
+            if not candidate:
+                candidate = db.candidates.find_one({"_id": candidate_id}, projection)
+            if not candidate:
+                candidate = db.candidates.find_one({"candidate_id": candidate_id}, projection)
+            if candidate and candidate.get("_id") is not None:
+                candidate["_id"] = str(candidate["_id"])
+            return candidate
+        except Exception as e:
+            logger.error(f"Sync get_candidate failed: {str(e)}")
+            return None
 
     def update_candidate_score(self, candidate_id: str, score_data: Dict[str, Any], job_id: str = None) -> bool:
-        """Sync wrapper for update_candidate_score."""
-        return self._call('update_candidate_score', candidate_id, score_data, job_id)
+        """Update candidate with score data."""
+        try:
+            db = _get_sync_db()
+            now = datetime.utcnow()
+            update_data = {
+                "updated_at": now,
+                "latest_score": score_data
+            }
+            if job_id:
+                update_data["latest_job_score"] = {
+                    "job_id": job_id,
+                    "score": score_data.get("score"),
+                    "rationale": score_data.get("rationale"),
+                    "timestamp": now
+                }
+
+            # Candidates are upserted with ObjectId _ids; string ids are the legacy fallback
+            result = db.candidates.update_one({"_id": _oid(candidate_id) or candidate_id}, {"$set": update_data})
+            return result.modified_count > 0
+        except Exception as e:
+            logger.error(f"Sync update_candidate_score failed: {str(e)}")
+            return False
+
+    def bulk_update_candidate_scores(self, entries: List[Tuple[str, Dict[str, Any], Optional[str]]]) -> int:
+        """Apply many update_candidate_score calls in a single bulk_write.
+
+        Args:
+            entries: (candidate_id, score_data, job_id) tuples; job_id may be None
+
+        Returns:
+            Number of modified candidate documents
+        """
+        if not entries:
+            return 0
+        try:
+            db = _get_sync_db()
+            now = datetime.utcnow()
+            ops = []
+            for candidate_id, score_data, job_id in entries:
+                update_data = {
+                    "updated_at": now,
+                    "latest_score": score_data
+                }
+                if job_id:
+                    update_data["latest_job_score"] = {
+                        "job_id": job_id,
+                        "score": score_data.get("score"),
+                        "rationale": score_data.get("rationale"),
+                        "timestamp": now
+                    }
+                key = _oid(candidate_id) or candidate_id
+                ops.append(UpdateOne({"_id": key}, {"$set": update_data}))
+
+            result = db.candidates.bulk_write(ops, ordered=False)
+            return result.modified_count
+        except Exception as e:
+            logger.error(f"Sync bulk_update_candidate_scores failed: {str(e)}")
+            return 0
 
     def get_candidates_for_matching(self, limit: int = 10) -> List[Dict[str, Any]]:
-        """Sync wrapper for get_candidates_for_matching."""
-        return self._call('get_candidates_for_matching', limit)
+        """Get candidates for job matching."""
+        try:
+            db = _get_sync_db()
+            return list(db.candidates.find({"stage": "Profile Created"}, limit=limit))
+        except Exception as e:
+            logger.error(f"Sync get_candidates_for_matching failed: {str(e)}")
+            return []
 
     # Interview Management
     def save_interview(self, interview_data: Dict[str, Any]) -> str:
-        """Sync wrapper for save_interview."""
-        return self._call('save_interview', interview_data)
+        """Save interview data."""
+        try:
+            db = _get_sync_db()
+            now = datetime.utcnow()
+            interview_data.update({
+                "created_at": now,
+                "updated_at": now
+            })
+            result = db.interviews.insert_one(interview_data)
+            return str(result.inserted_id)
+        except Exception as e:
+            logger.error(f"Sync save_interview failed: {str(e)}")
+            raise
 
     def get_interview(self, interview_id: str) -> Optional[Dict[str, Any]]:
-        """Sync wrapper for get_interview."""
-        return self._call('get_interview', interview_id)
+        """Get interview by ID."""
+        try:
+            db = _get_sync_db()
+            return db.interviews.find_one({"_id": interview_id})
+        except Exception as e:
+            logger.error(f"Sync get_interview failed: {str(e)}")
+            return None
 
     # Job Matching 
     def store_job_matches(self, job_id: str, matches: List[Dict[str, Any]]) -> bool:
-        """Sync wrapper for store_job_matches."""
-        return self._call('store_job_matches', job_id, matches)
+        """Store job matching results."""
+        try:
+            db = _get_sync_db()
+            now = datetime.utcnow()
+            logger.info(f"Job matching complete: job_id={job_id}, num_matches={len(matches)}")
+            result = db.job_matches.insert_one({
+                "job_id": job_id,
+                "matches": matches,
+                "created_at": now,
+                "updated_at": now
+            })
+            return result.inserted_id is not None
+        except Exception as e:
+            logger.error(f"Sync store_job_matches failed: {str(e)}")
+            return False
 
     def get_job_matches(self, job_id: str) -> Optional[Dict[str, Any]]:
-        """Sync wrapper for get_job_matches."""
-        return self._call('get_job_matches', job_id)
+        """Get job matching results."""
+        try:
+            db = _get_sync_db()
+            return db.job_matches.find_one({"job_id": job_id})
+        except Exception as e:
+            logger.error(f"Sync get_job_matches failed: {str(e)}")
+            return None
 
     # File Management
-    def get_expired_files(self, cutoff_date: datetime) -> List[Dict[str, Any]]:
-        """Sync wrapper for get_expired_files."""
-        return self._call('get_expired_files', cutoff_date)
+    def get_expired_files(self, cutoff_date: datetime) -> Iterable[Dict[str, Any]]:
+        """Stream files older than cutoff date (only _id and gcs_path)."""
+        try:
+            db = _get_sync_db()
+            return db.files.find(
+                {
+                    "created_at": {"$lt": cutoff_date},
+                    "deleted": {"$ne": True}
+                },
+                projection={"_id": 1, "gcs_path": 1}
+            ).batch_size(CLEANUP_CURSOR_BATCH_SIZE)
+        except Exception as e:
+            logger.error(f"Sync get_expired_files failed: {str(e)}")
+            return []
+
+    def get_expired_file_batches(self, cutoff_date: datetime, batch_size: int) -> Iterable[Dict[str, Any]]:
+        """Stream expired files pre-grouped server-side as {"ids": [...], "paths": [...]} batches."""
+        try:
+            db = _get_sync_db()
+            return db.files.aggregate([
+                {"$match": {
+                    "created_at": {"$lt": cutoff_date},
+                    "deleted": {"$ne": True},
+                    "gcs_path": {"$nin": [None, ""]}
+                }},
+                {"$project": {"_id": 1, "gcs_path": 1}},
+                {"$setWindowFields": {
+                    "sortBy": {"_id": 1},
+                    "output": {"n": {"$documentNumber": {}}}
+                }},
+                {"$group": {
+                    "_id": {"$floor": {"$divide": [{"$subtract": ["$n", 1]}, batch_size]}},
+                    "ids": {"$push": "$_id"},
+                    "paths": {"$push": "$gcs_path"}
+                }}
+            ], allowDiskUse=True, batchSize=1)
+        except Exception as e:
+            logger.error(f"Sync get_expired_file_batches failed: {str(e)}")
+            return []
 
     def mark_file_deleted(self, file_id: str) -> bool:
-        """Sync wrapper for mark_file_deleted."""
-        return self._call('mark_file_deleted', file_id)
+        """Mark file as deleted."""
+        try:
+            db = _get_sync_db()
+            result = db.files.update_one(
+                {"_id": file_id},
+                {"$set": {"deleted": True, "deleted_at": datetime.utcnow()}}
+            )
+            return result.modified_count > 0
+        except Exception as e:
+            logger.error(f"Sync mark_file_deleted failed: {str(e)}")
+            return False
+
+    def mark_files_deleted(self, file_ids: List[Any]) -> int:
+        """Mark many files as deleted with a single update_many."""
+        if not file_ids:
+            return 0
+        try:
+            db = _get_sync_db()
+            result = db.files.update_many(
+                {"_id": {"$in": file_ids}},
+                {"$set": {"deleted": True, "deleted_at": datetime.utcnow()}}
+            )
+            return result.modified_count
+        except Exception as e:
+            logger.error(f"Sync mark_files_deleted failed: {str(e)}")
+            return 0
+
+    # Failed Jobs Management
+    def get_failed_jobs(self, cutoff_date: datetime) -> Iterable[Dict[str, Any]]:
+        """Stream failed jobs older than cutoff date (only _id)."""
+        try:
+            db = _get_sync_db()
+            return db.jobs.find(
+                {
+                    "status": "FAILED",
+                    "updated_at": {"$lt": cutoff_date}
+                },
+                projection={"_id": 1}
+            ).batch_size(CLEANUP_CURSOR_BATCH_SIZE)
+        except Exception as e:
+            logger.error(f"Sync get_failed_jobs failed: {str(e)}")
+            return []
+
+    def archive_failed_job(self, job_id: Any) -> bool:
+        """Archive failed job."""
+        try:
+            db = _get_sync_db()
+            result = db.jobs.update_one(
+                {"_id": job_id},
+                {"$set": {"archived": True, "archived_at": datetime.utcnow()}}
+            )
+            return result.modified_count > 0
+        except Exception as e:
+            logger.error(f"Sync archive_failed_job failed: {str(e)}")
+            return False
+
+    def archive_failed_jobs_bulk(self, job_ids: List[Any]) -> Tuple[int, List[Dict[str, Any]]]:
+        """Archive many failed jobs in a single unordered bulk_write.
+
+        Returns:
+            (modified count, per-job errors as {"job_id", "error"} dicts)
+        """
+        if not job_ids:
+            return 0, []
+        db = _get_sync_db()
+        update = {"$set": {"archived": True, "archived_at": datetime.utcnow()}}
+        try:
+            result = db.jobs.bulk_write([UpdateOne({"_id": _id}, update) for _id in job_ids], ordered=False)
+            return result.modified_count, []
+        except BulkWriteError as e:
+            details = e.details
+            errors = [
+                {"job_id": job_ids[err["index"]], "error": err.get("errmsg", "")}
+                for err in details.get("writeErrors", [])
+            ]
+            return details.get("nModified", 0), errors
 
     # Application Management
     def create_application(self, application_data: Dict[str, Any]) -> str:
-        """Sync wrapper for create_application."""
-        return self._call('create_application', application_data)
+        """Create a new application record, returning the existing one on duplicates."""
+        try:
+            db = _get_sync_db()
+            now = datetime.utcnow()
+            application_data.update({
+                "created_at": now,
+                "updated_at": now,
+                "gemini_questions": [],
+                "gemini_answers": [],
+                "audit_trail": [],
+                "needs_human_review": False,
+                "fairness_flagged": False,
+                "resume_text": None,
+                "resume_vector_id": None,
+                "ai_match_score": None,
+                "gcs_resume_uri": None,
+                "pinecone_metadata": None
+            })
+
+            try:
+                result = db.applications.insert_one(application_data)
+                return str(result.inserted_id)
+            except DuplicateKeyError:
+                existing = db.applications.find_one({
+                    "job_id": application_data["job_id"],
+                    "candidate_id": application_data["candidate_id"]
+                }, projection={"_id": 1})
+                if existing:
+                    return str(existing["_id"])
+                raise
+        except Exception as e:
+            logger.error(f"Sync create_application failed: {str(e)}")
+            raise
 
-    def get_application(self, application_id: str) -> Optional[Dict[str, Any]]:
-        """Sync wrapper for get_application."""
-        return self._call('get_application', application_id)
+    def get_application(self, application_id: str, projection: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """Get application by application_id or _id; projection limits the returned fields."""
+        try:
+            db = _get_sync_db()
+            application = db.applications.find_one(_application_lookup(application_id), projection)
+            if application and application.get("_id"):
+                application["_id"] = str(application["_id"])
+            return application
+        except Exception as e:
+            logger.error(f"Sync get_application failed: {str(e)}")
+            return None
 
-    def get_application_by_job_and_candidate(self, job_id: str, candidate_id: str) -> Optional[Dict[str, Any]]:
-        """Sync wrapper for get_application_by_job_and_candidate."""
-        return self._call('get_application_by_job_and_candidate', job_id, candidate_id)
+    def get_application_by_job_and_candidate(
+        self, job_id: str, candidate_id: str, projection: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Get application by job_id and candidate_id combination; projection limits the returned fields."""
+        try:
+            db = _get_sync_db()
+            return db.applications.find_one({"job_id": job_id, "candidate_id": candidate_id}, projection)
+        except Exception as e:
+            logger.error(f"Sync get_application_by_job_and_candidate failed: {str(e)}")
+            return None
+
+    def get_applications_bulk(
+        self, application_ids: Iterable[str], projection: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Fetch many applications in one query, keyed by each id they can be looked up by.
+
+        Every returned document is keyed by its application_id and by its string _id,
+        matching what get_application resolves. A projection must keep both fields.
+        """
+        ids = [a for a in set(application_ids) if a]
+        if not ids:
+            return {}
+        try:
+            db = _get_sync_db()
+            if _applications_migrated():
+                query = {"application_id": {"$in": ids}}
+            else:
+                query = {"$or": [{"application_id": {"$in": ids}}, {"_id": {"$in": ids}}]}
+            by_id = {}
+            for application in db.applications.find(query, projection):
+                application["_id"] = str(application["_id"])
+                by_id[application["_id"]] = application
+                if application.get("application_id"):
+                    by_id[application["application_id"]] = application
+            return by_id
+        except Exception as e:
+            logger.error(f"Sync get_applications_bulk failed: {str(e)}")
+            return {}
+
+    def get_applications_by_job_and_candidates_bulk(
+        self, job_id: str, candidate_ids: Iterable[str], projection: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Fetch a job's applications for many candidates in one query, keyed by candidate_id.
+
+        A projection must keep candidate_id.
+        """
+        ids = [c for c in set(candidate_ids) if c]
+        if not ids:
+            return {}
+        try:
+            db = _get_sync_db()
+            return {
+                application["candidate_id"]: application
+                for application in db.applications.find({"job_id": job_id, "candidate_id": {"$in": ids}}, projection)
+            }
+        except Exception as e:
+            logger.error(f"Sync get_applications_by_job_and_candidates_bulk failed: {str(e)}")
+            return {}
 
     def update_application(self, application_id: str, update_data: Dict[str, Any]) -> bool:
         """Sync wrapper for update_application."""
@@ -182,28 +639,114 @@ class SyncDatabaseService:
             result = db.applications.update_one({"application_id": application_id}, {"$set": update_data})
             return result.modified_count > 0
         except Exception as e:
-            logger = logging.getLogger(__name__)
-            logger.error(f"Sync update_application failed: {str(e)}")
+            logger.error("Sync update_application failed: %s", e, exc_info=True)
+            return False
+
+    def start_application_processing(self, application_id: str, update_data: Dict[str, Any]) -> bool:
+        """Apply update_data unless the application already has a completed resume.
+
+        Combines the "already processed?" read and the PROCESSING write into one
+        round trip. Returns False when nothing was updated (already completed, or
+        no application with that application_id).
+        """
+        try:
+            db = _get_sync_db()
+            update_data["updated_at"] = datetime.utcnow()
+            result = db.applications.update_one(
+                {
+                    "application_id": application_id,
+                    "$or": [
+                        {"status": {"$ne": "COMPLETED"}},
+                        {"resume_vector_id": {"$in": [None, ""]}}
+                    ]
+                },
+                {"$set": update_data}
+            )
+            return result.matched_count > 0
+        except Exception as e:
+            logger.error("Sync start_application_processing failed: %s", e, exc_info=True)
             return False
 
+    def bulk_update_applications(self, updates: List[Tuple[str, Dict[str, Any]]]) -> int:
+        """Apply many update_application calls in a single bulk_write.
+
+        Args:
+            updates: (application_id, update_data) tuples
+
+        Returns:
+            Number of modified application documents
+        """
+        if not updates:
+            return 0
+        try:
+            db = _get_sync_db()
+            now = datetime.utcnow()
+            ops = []
+            for application_id, update_data in updates:
+                # Stamp in place, as update_application does, rather than copying each payload
+                update_data["updated_at"] = now
+                ops.append(UpdateOne({"application_id": application_id}, {"$set": update_data}))
+            result = db.applications.bulk_write(ops, ordered=False)
+            return result.modified_count
+        except Exception as e:
+            logger.error(f"Sync bulk_update_applications failed: {str(e)}")
+            return 0
+
     # System Stats
     def get_system_stats(self) -> Dict[str, Any]:
-        """Sync wrapper for get_system_stats."""
-        return self._call('get_system_stats')
+        """Get system statistics."""
+        try:
+            db = _get_sync_db()
+            yesterday = datetime.utcnow() - timedelta(days=1)
+            return {
+                "total_candidates": db.candidates.count_documents({}),
+                "total_jobs": db.jobs.count_documents({}),
+                "total_interviews": db.interviews.count_documents({}),
+                "active_jobs": db.jobs.count_documents({"status": {"$in": ["PENDING", "PROCESSING", "MATCHING"]}}),
+                "completed_jobs": db.jobs.count_documents({"status": "COMPLETED"}),
+                "failed_jobs": db.jobs.count_documents({"status": "FAILED"}),
+                "recent_candidates": db.candidates.count_documents({"created_at": {"$gte": yesterday}}),
+                "recent_jobs": db.jobs.count_documents({"created_at": {"$gte": yesterday}}),
+                "recent_interviews": db.interviews.count_documents({"created_at": {"$gte": yesterday}})
+            }
+        except Exception as e:
+            logger.error(f"Sync get_system_stats failed: {str(e)}")
+            return {}
 
     # User Management
     def save_user(self, user_data: Dict[str, Any]) -> str:
-        """Sync wrapper for save_user."""
-        return self._call('save_user', user_data)
+        """Save user data."""
+        try:
+            db = _get_sync_db()
+            now = datetime.utcnow()
+            user_data.update({
+                "created_at": now,
+                "updated_at": now
+            })
+            result = db.users.insert_one(user_data)
+            return str(result.inserted_id)
+        except Exception as e:
+            logger.error(f"Sync save_user failed: {str(e)}")
+            raise
 
     def get_user(self, user_id: str) -> Optional[Dict[str, Any]]:
-        """Sync wrapper for get_user."""
-        return self._call('get_user', user_id)
+        """Get user by ID."""
+        try:
+            db = _get_sync_db()
+            return db.users.find_one({"_id": user_id})
+        except Exception as e:
+            logger.error(f"Sync get_user failed: {str(e)}")
+            return None
 
     def get_user_by_email(self, email: str) -> Optional[Dict[str, Any]]:
-        """Sync wrapper for get_user_by_email."""
-        return self._call('get_user_by_email', email)
+        """Get user by email."""
+        try:
+            db = _get_sync_db()
+            return db.users.find_one({"email": email})
+        except Exception as e:
+            logger.error(f"Sync get_user_by_email failed: {str(e)}")
+            return None
 
     def close(self):
-        """Close database connection."""
-        return self._call('close')
\ No newline at end of file
+        """Close the shared MongoDB client pool."""
+        _close_sync_client()
@@ -2,53 +2,181 @@
 Defines WebSocket event types and message structures for consistent real-time updates.
 """
 
-from enum import Enum
-from typing import Dict, Any, TypedDict, List, Optional, Union
+import base64
+import itertools
+import os
+import struct
+import time
+from enum import IntEnum
+from typing import Annotated, Dict, Any, FrozenSet, TypedDict, List, Literal, Optional, Union
 from datetime import datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, Discriminator, Tag, field_serializer, field_validator
 
 
-class WebSocketEventType(str, Enum):
-    """Defines all possible WebSocket event types."""
+class WebSocketEventType(IntEnum):
+    """Defines all possible WebSocket event types.
+
+    Members are ints internally; the snake_case wire string is looked up in
+    ``_WIRE`` only when a message is serialized.
+    """
     
     # Connection Events
-    CONNECTION_ESTABLISHED = "connection_established"
-    CONNECTION_ERROR = "connection_error"
-    RECONNECT_ATTEMPT = "reconnect_attempt"
-    PING = "ping"
-    PONG = "pong"
+    CONNECTION_ESTABLISHED = 1
+    CONNECTION_ERROR = 2
+    RECONNECT_ATTEMPT = 3
+    PING = 4
+    PONG = 5
     
     # Interview Events
-    INTERVIEW_QUESTIONS_READY = "interview_questions_ready"
-    INTERVIEW_STARTED = "interview_started"
-    INTERVIEW_QUESTION_TIMER = "interview_question_timer"
-    INTERVIEW_RESPONSE_EVALUATED = "interview_response_evaluated"
-    INTERVIEW_COMPLETED = "interview_completed"
-    INTERVIEW_ERROR = "interview_error"
+    INTERVIEW_QUESTIONS_READY = 6
+    INTERVIEW_STARTED = 7
+    INTERVIEW_QUESTION_TIMER = 8
+    INTERVIEW_RESPONSE_EVALUATED = 9
+    INTERVIEW_COMPLETED = 10
+    INTERVIEW_ERROR = 11
     
     # Application Events
-    APPLICATION_SUBMITTED = "application_submitted"
-    APPLICATION_STATUS_CHANGED = "application_status_changed"
-    APPLICATION_SCORED = "application_scored"
-    APPLICATION_FEEDBACK = "application_feedback"
+    APPLICATION_SUBMITTED = 12
+    APPLICATION_STATUS_CHANGED = 13
+    APPLICATION_SCORED = 14
+    APPLICATION_FEEDBACK = 15
     
     # Job Events
-    JOB_POSTED = "job_posted"
-    JOB_UPDATED = "job_updated"
-    JOB_CLOSED = "job_closed"
-    JOB_MATCHED = "job_matched"
+    JOB_POSTED = 16
+    JOB_UPDATED = 17
+    JOB_CLOSED = 18
+    JOB_MATCHED = 19
     
     # Processing Events
-    RESUME_PROCESSING_STARTED = "resume_processing_started"
-    RESUME_PROCESSING_COMPLETED = "resume_processing_completed"
-    VIDEO_PROCESSING_STARTED = "video_processing_started"
-    VIDEO_PROCESSING_COMPLETED = "video_processing_completed"
+    RESUME_PROCESSING_STARTED = 20
+    RESUME_PROCESSING_COMPLETED = 21
+    VIDEO_PROCESSING_STARTED = 22
+    VIDEO_PROCESSING_COMPLETED = 23
     
     # System Events
-    SYSTEM_ANNOUNCEMENT = "system_announcement"
-    SYSTEM_ERROR = "system_error"
-    SYSTEM_MAINTENANCE = "system_maintenance"
-    SYSTEM_STATUS = "system_status"
+    SYSTEM_ANNOUNCEMENT = 24
+    SYSTEM_ERROR = 25
+    SYSTEM_MAINTENANCE = 26
+    SYSTEM_STATUS = 27
+
+    @property
+    def wire(self) -> str:
+        """Wire-format string for this event type."""
+        return _WIRE[self]
+
+    @classmethod
+    def from_wire(cls, value: str) -> Optional["WebSocketEventType"]:
+        """Resolve a wire-format string back to its event type (None if unknown)."""
+        return _FROM_WIRE.get(value)
+
+
+# int -> wire string table, used only at serialize time
+_WIRE: Dict[WebSocketEventType, str] = {event: event.name.lower() for event in WebSocketEventType}
+_FROM_WIRE: Dict[str, WebSocketEventType] = {wire: event for event, wire in _WIRE.items()}
+
+# Event categories for O(1) membership checks in dispatchers
+CONNECTION_EVENTS: FrozenSet[WebSocketEventType] = frozenset({
+    WebSocketEventType.CONNECTION_ESTABLISHED,
+    WebSocketEventType.CONNECTION_ERROR,
+    WebSocketEventType.RECONNECT_ATTEMPT,
+    WebSocketEventType.PING,
+    WebSocketEventType.PONG
+})
+INTERVIEW_EVENTS: FrozenSet[WebSocketEventType] = frozenset({
+    WebSocketEventType.INTERVIEW_QUESTIONS_READY,
+    WebSocketEventType.INTERVIEW_STARTED,
+    WebSocketEventType.INTERVIEW_QUESTION_TIMER,
+    WebSocketEventType.INTERVIEW_RESPONSE_EVALUATED,
+    WebSocketEventType.INTERVIEW_COMPLETED,
+    WebSocketEventType.INTERVIEW_ERROR
+})
+APPLICATION_EVENTS: FrozenSet[WebSocketEventType] = frozenset({
+    WebSocketEventType.APPLICATION_SUBMITTED,
+    WebSocketEventType.APPLICATION_STATUS_CHANGED,
+    WebSocketEventType.APPLICATION_SCORED,
+    WebSocketEventType.APPLICATION_FEEDBACK
+})
+JOB_EVENTS: FrozenSet[WebSocketEventType] = frozenset({
+    WebSocketEventType.JOB_POSTED,
+    WebSocketEventType.JOB_UPDATED,
+    WebSocketEventType.JOB_CLOSED,
+    WebSocketEventType.JOB_MATCHED
+})
+PROCESSING_EVENTS: FrozenSet[WebSocketEventType] = frozenset({
+    WebSocketEventType.RESUME_PROCESSING_STARTED,
+    WebSocketEventType.RESUME_PROCESSING_COMPLETED,
+    WebSocketEventType.VIDEO_PROCESSING_STARTED,
+    WebSocketEventType.VIDEO_PROCESSING_COMPLETED
+})
+SYSTEM_EVENTS: FrozenSet[WebSocketEventType] = frozenset({
+    WebSocketEventType.SYSTEM_ANNOUNCEMENT,
+    WebSocketEventType.SYSTEM_ERROR,
+    WebSocketEventType.SYSTEM_MAINTENANCE,
+    WebSocketEventType.SYSTEM_STATUS
+})
+
+
+# Message ids: time_ns + worker id + per-process counter, packed to 14 bytes
+_COUNTER = itertools.count()
+_WORKER_ID = os.getpid() & 0xFFFF
+
+
+def _refresh_worker_id():
+    global _WORKER_ID
+    _WORKER_ID = os.getpid() & 0xFFFF
+
+
+# Forked workers (uvicorn/gunicorn) must not share the parent's worker id
+os.register_at_fork(after_in_child=_refresh_worker_id)
+
+
+def new_message_id(now_ns: Optional[int] = None) -> str:
+    """Generate a compact, per-process collision-free WebSocket message id.
+
+    Args:
+        now_ns: Optional ``time.time_ns()`` value to reuse for the message timestamp
+    """
+    if now_ns is None:
+        now_ns = time.time_ns()
+    packed = struct.pack(">QHI", now_ns, _WORKER_ID, next(_COUNTER) & 0xFFFFFFFF)
+    return base64.urlsafe_b64encode(packed).rstrip(b"=").decode()
+
+
+# WebSocket timestamps only need ~ms resolution: reuse the formatted value
+# until the clock has moved by at least 1 ms.
+_NOW_CACHE: str = datetime.now().isoformat()
+_NOW_CACHE_NS = 0
+
+
+def cached_timestamp(now_ns: Optional[int] = None) -> str:
+    """ISO timestamp for outgoing messages, recomputed at most once per millisecond.
+
+    Args:
+        now_ns: Optional ``time.time_ns()`` value already read by the caller
+    """
+    global _NOW_CACHE, _NOW_CACHE_NS
+    if now_ns is None:
+        now_ns = time.time_ns()
+    if now_ns - _NOW_CACHE_NS >= 1_000_000 or now_ns < _NOW_CACHE_NS:
+        _NOW_CACHE = datetime.fromtimestamp(now_ns / 1e9).isoformat()
+        _NOW_CACHE_NS = now_ns
+    return _NOW_CACHE
+
+
+def make_message(type_: Union[WebSocketEventType, str], **fields: Any) -> Dict[str, Any]:
+    """Build a WebSocket message envelope stamped with an id and cached timestamp.
+
+    Args:
+        type_: Event type, or a raw wire string for legacy envelope types
+        **fields: Remaining message fields
+    """
+    now_ns = time.time_ns()
+    return {
+        "type": type_.wire if isinstance(type_, WebSocketEventType) else type_,
+        "timestamp": cached_timestamp(now_ns),
+        "message_id": new_message_id(now_ns),
+        **fields
+    }
 
 
 class BaseWSMessage(BaseModel):
@@ -57,9 +185,29 @@ class BaseWSMessage(BaseModel):
     timestamp: datetime
     message_id: str
 
+    @field_validator("type", mode="before")
+    @classmethod
+    def _parse_type(cls, value: Any) -> Any:
+        if isinstance(value, str):
+            # Unknown strings pass through and fail the enum check as a ValidationError
+            return _FROM_WIRE.get(value, value)
+        return value
+
+    @field_serializer("type")
+    def _serialize_type(self, value: WebSocketEventType) -> str:
+        return _WIRE[value]
+
 
 class InterviewMessage(BaseWSMessage):
     """Model for interview-related messages."""
+    type: Literal[
+        WebSocketEventType.INTERVIEW_QUESTIONS_READY,
+        WebSocketEventType.INTERVIEW_STARTED,
+        WebSocketEventType.INTERVIEW_QUESTION_TIMER,
+        WebSocketEventType.INTERVIEW_RESPONSE_EVALUATED,
+        WebSocketEventType.INTERVIEW_COMPLETED,
+        WebSocketEventType.INTERVIEW_ERROR
+    ]
     job_id: str
     session_id: str
     status: str
@@ -85,6 +233,12 @@ class InterviewMessage(BaseWSMessage):
 
 class ApplicationMessage(BaseWSMessage):
     """Model for application-related messages."""
+    type: Literal[
+        WebSocketEventType.APPLICATION_SUBMITTED,
+        WebSocketEventType.APPLICATION_STATUS_CHANGED,
+        WebSocketEventType.APPLICATION_SCORED,
+        WebSocketEventType.APPLICATION_FEEDBACK
+    ]
     application_id: str
     job_id: str
     status: str
@@ -109,6 +263,12 @@ class ApplicationMessage(BaseWSMessage):
 
 class SystemMessage(BaseWSMessage):
     """Model for system-wide messages."""
+    type: Literal[
+        WebSocketEventType.SYSTEM_ANNOUNCEMENT,
+        WebSocketEventType.SYSTEM_ERROR,
+        WebSocketEventType.SYSTEM_MAINTENANCE,
+        WebSocketEventType.SYSTEM_STATUS
+    ]
     severity: str
     title: str
     content: str
@@ -132,6 +292,13 @@ class SystemMessage(BaseWSMessage):
 
 class ConnectionMessage(BaseWSMessage):
     """Model for connection-related messages."""
+    type: Literal[
+        WebSocketEventType.CONNECTION_ESTABLISHED,
+        WebSocketEventType.CONNECTION_ERROR,
+        WebSocketEventType.RECONNECT_ATTEMPT,
+        WebSocketEventType.PING,
+        WebSocketEventType.PONG
+    ]
     connection_id: str
     user_id: Optional[str]
     reconnect_token: Optional[str]
@@ -151,4 +318,30 @@ class ConnectionMessage(BaseWSMessage):
         }
 
 
-WSMessage = Union[InterviewMessage, ApplicationMessage, SystemMessage, ConnectionMessage]
\ No newline at end of file
+# Event type -> message model tag, so parsing picks the model in one lookup
+_MESSAGE_TAG: Dict[WebSocketEventType, str] = {
+    **dict.fromkeys(INTERVIEW_EVENTS, "interview"),
+    **dict.fromkeys(APPLICATION_EVENTS, "application"),
+    **dict.fromkeys(SYSTEM_EVENTS, "system"),
+    **dict.fromkeys(CONNECTION_EVENTS, "connection")
+}
+
+
+def _ws_message_tag(value: Any) -> Optional[str]:
+    """Resolve the model tag from a raw dict or model instance's ``type``."""
+    event = value.get("type") if isinstance(value, dict) else getattr(value, "type", None)
+    if isinstance(event, str):
+        event = _FROM_WIRE.get(event)
+    # IntEnum members hash like their int values, so raw ints resolve too
+    return _MESSAGE_TAG.get(event)
+
+
+WSMessage = Annotated[
+    Union[
+        Annotated[InterviewMessage, Tag("interview")],
+        Annotated[ApplicationMessage, Tag("application")],
+        Annotated[SystemMessage, Tag("system")],
+        Annotated[ConnectionMessage, Tag("connection")]
+    ],
+    Discriminator(_ws_message_tag)
+]
\ No newline at end of file
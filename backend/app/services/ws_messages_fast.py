@@ -0,0 +1,101 @@
+"""
+msgspec counterparts of the WebSocket message models, used on the send path.
+
+The Pydantic models in ``websocket_events`` stay the schema of record for the
+HTTP API and OpenAPI docs; these Structs carry the same fields and are encoded
+with a single module-level msgspec encoder when messages go out over a socket.
+"""
+
+from typing import Dict, Any, Optional, Union
+from datetime import datetime
+import msgspec
+
+
+class InterviewMessage(msgspec.Struct):
+    """Interview-related message."""
+    type: str
+    timestamp: datetime
+    message_id: str
+    job_id: str
+    session_id: str
+    status: str
+    data: Dict[str, Any]
+    candidate_id: Optional[str] = None
+
+
+class ApplicationMessage(msgspec.Struct):
+    """Application-related message."""
+    type: str
+    timestamp: datetime
+    message_id: str
+    application_id: str
+    job_id: str
+    status: str
+    data: Dict[str, Any]
+
+
+class SystemMessage(msgspec.Struct):
+    """System-wide message."""
+    type: str
+    timestamp: datetime
+    message_id: str
+    severity: str
+    title: str
+    content: str
+    action_required: bool = False
+    expires_at: Optional[datetime] = None
+
+
+class ConnectionMessage(msgspec.Struct):
+    """Connection-related message."""
+    type: str
+    timestamp: datetime
+    message_id: str
+    connection_id: str
+    user_id: Optional[str] = None
+    reconnect_token: Optional[str] = None
+    latency_ms: Optional[float] = None
+
+
+class JobUpdateMessage(msgspec.Struct):
+    """Job status update broadcast to every connection."""
+    job_id: str
+    status: str
+    data: Dict[str, Any]
+    timestamp: float
+    type: str = "job_update"
+
+
+class SystemAnnouncementMessage(msgspec.Struct):
+    """System-wide announcement broadcast to every connection."""
+    announcement: Dict[str, Any]
+    timestamp: float
+    type: str = "system_announcement"
+
+
+FastWSMessage = Union[
+    InterviewMessage, ApplicationMessage, SystemMessage, ConnectionMessage,
+    JobUpdateMessage, SystemAnnouncementMessage
+]
+
+_ENC = msgspec.json.Encoder()
+_DEC = msgspec.json.Decoder()
+
+
+def encode_message(message: Union[FastWSMessage, Dict[str, Any]]) -> str:
+    """Encode a Struct or plain dict message to a JSON text frame."""
+    return _ENC.encode(message).decode()
+
+
+def decode_message(data: Union[str, bytes]) -> Any:
+    """Decode an inbound JSON frame; raises msgspec.DecodeError on malformed input."""
+    return _DEC.decode(data)
+
+
+# Fixed-shape heartbeat frame, pre-encoded once; only the timestamp and id vary
+_PING_TEMPLATE = '{"type":"ping","timestamp":__TS__,"message_id":"__ID__"}'
+
+
+def make_ping(ts: float, mid: str) -> str:
+    """Render a ping frame from the pre-encoded template without a JSON encode."""
+    return _PING_TEMPLATE.replace("__TS__", repr(float(ts))).replace("__ID__", mid)
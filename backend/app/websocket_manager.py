@@ -1,47 +1,109 @@
-import json
 import asyncio
-import uuid
+import base64
+import os
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Set, Optional
+from typing import Deque, Dict, Any, List, Set, Optional, Tuple, Union
 from fastapi import WebSocket, WebSocketDisconnect
 from app.services.notifier import NotificationService
 from app.services.websocket_events import (
     WebSocketEventType,
+    INTERVIEW_EVENTS,
+    APPLICATION_EVENTS,
+    JOB_EVENTS,
+    SYSTEM_EVENTS,
+    new_message_id,
+    cached_timestamp,
+    make_message,
     WSMessage,
     InterviewMessage,
     ApplicationMessage,
     SystemMessage,
     ConnectionMessage
 )
+from app.services.ws_messages_fast import (
+    FastWSMessage,
+    JobUpdateMessage,
+    SystemAnnouncementMessage,
+    encode_message,
+    make_ping
+)
 from app.services.fallback_polling import polling_service
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class ConnState:
+    """Everything tracked for one live connection, behind a single dict lookup."""
+    websocket: WebSocket
+    send_queue: asyncio.Queue
+    connected_at: float
+    tokens: float
+    user_id: Optional[str] = None
+    role: Optional[str] = None
+    relay: Optional[asyncio.Task] = None
+    
+    # Health monitoring
+    last_ping: Optional[float] = None
+    ping_count: int = 0
+    latency_ms: Deque[float] = field(default_factory=lambda: deque(maxlen=10))  # Last 10 latency measurements
+    
+    # Rate limiting (token bucket)
+    last_update: float = 0.0
+    warnings: int = 0
+    
+    # Recent messages (ring buffer, sized by the manager)
+    history: Optional[Deque[Dict[str, Any]]] = None
+
+
 class WebSocketManager:
     """Manager for WebSocket connections and real-time notifications."""
     
     def __init__(self):
         # Connection management
-        self.active_connections: Dict[str, WebSocket] = {}
-        self.user_connections: Dict[str, Set[str]] = {}  # user_id -> set of connection_ids
-        self.connection_roles: Dict[str, str] = {}  # connection_id -> role
-        self.connection_health: Dict[str, Dict[str, Any]] = {}  # connection_id -> health data
+        self.conns: Dict[str, ConnState] = {}  # connection_id -> connection state
+        # Empty sets are left in place on disconnect and pruned by the cleanup loop
+        self.user_connections: Dict[str, Set[str]] = defaultdict(set)  # user_id -> set of connection_ids
+        self.role_connections: Dict[str, Set[str]] = defaultdict(set)  # role -> set of connection_ids
         
         # Message handling
-        self.message_queue: Dict[str, List[Dict[str, Any]]] = {}  # user_id -> queued messages
-        self.message_history: Dict[str, List[Dict[str, Any]]] = {}  # connection_id -> recent messages
+        self.message_queue: Dict[str, Deque[Tuple[float, Dict[str, Any]]]] = {}  # user_id -> (queued_at, message), oldest first
+        self.queue_ttl = 24 * 60 * 60  # Drop queued messages after 24 hours
+        self.queue_cleanup_interval = 60
         self.history_limit = 100  # Keep last 100 messages per connection
         
         # Connection recovery
         self.reconnect_tokens: Dict[str, str] = {}  # user_id -> token
         self.session_state: Dict[str, Dict[str, Any]] = {}  # connection_id -> session state
         self.reconnect_window = timedelta(hours=24)  # Time window for reconnection
+        self._rand_pool = b""  # Pre-read urandom bytes, sliced into reconnect tokens
+        self._rand_off = 0
         
         # Rate limiting
-        self.rate_limits: Dict[str, Dict[str, Any]] = {}  # connection_id -> rate limit data
         self.max_messages_per_minute = 120
+        self._refill_per_sec = self.max_messages_per_minute / 60.0
+        
+        # Fan-out: sends per gather batch before yielding to the event loop
+        self.broadcast_batch_size = 50
+        
+        # Per-connection outbound queues drained by a relay task, so one slow
+        # client never stalls fan-out to the others
+        self.send_queue_size = 256
+        self.max_concurrent_sends = 256  # Socket writes in flight across all relays
+        self._send_sem = asyncio.Semaphore(self.max_concurrent_sends)
+        
+        # Clock: bound to the running loop's time() once the listener starts.
+        # The default asyncio loop clock is time.monotonic, so readings stay comparable.
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._now = time.monotonic
+        self._redis_task: Optional[asyncio.Task] = None
+        self._cleanup_task: Optional[asyncio.Task] = None
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self.heartbeat_interval = 30  # Seconds between heartbeat sweeps
         
         # Services
         self.notifier = NotificationService()
@@ -53,16 +115,24 @@ class WebSocketManager:
             if hasattr(self.notifier, 'unsubscribe_all') and callable(self.notifier.unsubscribe_all):
                 self.notifier.unsubscribe_all()
             
-            # Clear all active connections
-            self.active_connections.clear()
+            # Stop background loops
+            for task in (self._redis_task, self._cleanup_task, self._heartbeat_task):
+                if task is not None:
+                    task.cancel()
+            self._redis_task = None
+            self._cleanup_task = None
+            self._heartbeat_task = None
+            
+            # Stop relays and clear all active connections
+            for state in self.conns.values():
+                if state.relay is not None:
+                    state.relay.cancel()
+            self.conns.clear()
             self.user_connections.clear()
-            self.connection_roles.clear()
-            self.connection_health.clear()
+            self.role_connections.clear()
             self.message_queue.clear()
-            self.message_history.clear()
             self.reconnect_tokens.clear()
             self.session_state.clear()
-            self.rate_limits.clear()
             
             logger.info("WebSocketManager shutdown complete")
         except Exception as e:
@@ -72,49 +142,46 @@ class WebSocketManager:
         """Accept WebSocket connection and register it."""
         try:
             await websocket.accept()
-            self.active_connections[connection_id] = websocket
+            now = self._now()
+            state = ConnState(
+                websocket=websocket,
+                send_queue=asyncio.Queue(maxsize=self.send_queue_size),
+                connected_at=now,
+                tokens=float(self.max_messages_per_minute),
+                user_id=user_id,
+                role=role,
+                last_update=now
+            )
+            self.conns[connection_id] = state
+            state.relay = asyncio.create_task(self._relay(connection_id))
             
             if user_id:
-                if user_id not in self.user_connections:
-                    self.user_connections[user_id] = set()
                 self.user_connections[user_id].add(connection_id)
                 
                 # Restore queued messages
                 if user_id in self.message_queue:
                     queued_messages = self.message_queue[user_id]
                     del self.message_queue[user_id]
-                    for msg in queued_messages:
+                    for _, msg in queued_messages:
                         await self.send_personal_message(msg, connection_id)
             
             # Store role for targeted broadcasts
             if role:
-                self.connection_roles[connection_id] = role
-            
-            # Initialize health monitoring
-            self.connection_health[connection_id] = {
-                "connected_at": asyncio.get_event_loop().time(),
-                "last_ping": None,
-                "ping_count": 0,
-                "latency_ms": []
-            }
+                self.role_connections[role].add(connection_id)
             
             # Generate reconnect token
             if user_id:
-                import secrets
-                self.reconnect_tokens[user_id] = secrets.token_urlsafe(32)
+                self.reconnect_tokens[user_id] = self._token()
             
             logger.info(f"WebSocket connected: {connection_id} for user: {user_id} role: {role}")
             
             # Send welcome message with reconnect token
-            await self.send_personal_message({
-                "type": "connection_established",
-                "connection_id": connection_id,
-                "reconnect_token": self.reconnect_tokens.get(user_id),
-                "message": "Connected to real-time updates"
-            }, connection_id)
-            
-            # Start heartbeat for this connection
-            asyncio.create_task(self._connection_heartbeat(connection_id))
+            await self.send_personal_message(make_message(
+                WebSocketEventType.CONNECTION_ESTABLISHED,
+                connection_id=connection_id,
+                reconnect_token=self.reconnect_tokens.get(user_id),
+                message="Connected to real-time updates"
+            ), connection_id)
             
         except Exception as e:
             logger.error(f"Failed to connect WebSocket: {str(e)}")
@@ -123,13 +190,21 @@ class WebSocketManager:
     def disconnect(self, connection_id: str, user_id: str = None):
         """Remove WebSocket connection."""
         try:
-            if connection_id in self.active_connections:
-                del self.active_connections[connection_id]
+            state = self.conns.pop(connection_id, None)
+            role = None
+            if state is not None:
+                role = state.role
+                user_id = user_id or state.user_id
+                
+                # Stop the relay; frames still queued for a dead socket are dropped
+                if state.relay and state.relay is not asyncio.current_task():
+                    state.relay.cancel()
+            
+            if role:
+                self.role_connections.get(role, set()).discard(connection_id)
             
-            if user_id and user_id in self.user_connections:
-                self.user_connections[user_id].discard(connection_id)
-                if not self.user_connections[user_id]:
-                    del self.user_connections[user_id]
+            if user_id:
+                self.user_connections.get(user_id, set()).discard(connection_id)
             
             logger.info(f"WebSocket disconnected: {connection_id}")
             
@@ -140,7 +215,9 @@ class WebSocketManager:
         self,
         message: Dict[str, Any],
         connection_id: str,
-        retry_fallback: bool = True
+        retry_fallback: bool = True,
+        prepared: Optional[str] = None,
+        rate_limited: bool = True
     ):
         """
         Send message to specific connection with retry and fallback.
@@ -149,35 +226,32 @@ class WebSocketManager:
             message: Message to send
             connection_id: Target connection ID
             retry_fallback: Whether to attempt fallback on failure
+            prepared: Already-encoded frame for ``message`` (shared across a fan-out)
+            rate_limited: Apply the per-connection token bucket; server fan-out passes False
         """
         try:
+            state = self.conns.get(connection_id)
+            
             # Check rate limits
-            if not self._check_rate_limit(connection_id):
+            if rate_limited and state is not None and not self._check_rate_limit(connection_id, state):
                 logger.warning(f"Rate limit exceeded for {connection_id}")
                 return
                 
-            if connection_id in self.active_connections:
+            if state is not None:
                 try:
-                    websocket = self.active_connections[connection_id]
+                    # Encode once unless the caller already did for a fan-out
+                    if prepared is None:
+                        self._stamp(message)
+                        prepared = encode_message(message)
                     
-                    # Add message ID and timestamp if not present
-                    if "message_id" not in message:
-                        message["message_id"] = str(uuid.uuid4())
-                    if "timestamp" not in message:
-                        message["timestamp"] = datetime.now().isoformat()
-                    
-                    # Send message
-                    await websocket.send_text(json.dumps(message))
+                    # Hand off to the connection's relay; a full queue means a stuck client
+                    if not self._enqueue(connection_id, prepared, state):
+                        raise WebSocketDisconnect()
                     
                     # Store in history
-                    if connection_id not in self.message_history:
-                        self.message_history[connection_id] = []
-                    self.message_history[connection_id].append(message)
-                    
-                    # Trim history if needed
-                    if len(self.message_history[connection_id]) > self.history_limit:
-                        self.message_history[connection_id] = \
-                            self.message_history[connection_id][-self.history_limit:]
+                    if state.history is None:
+                        state.history = deque(maxlen=self.history_limit)
+                    state.history.append(message)
                     
                     logger.debug(f"Sent message to {connection_id}: {message.get('type', 'unknown')}")
                     
@@ -200,13 +274,97 @@ class WebSocketManager:
             if retry_fallback:
                 await self._handle_disconnect_with_fallback(connection_id, message)
     
+    @staticmethod
+    def _stamp(message: Dict[str, Any]) -> Dict[str, Any]:
+        """Add message ID and timestamp if not present, from a single clock read."""
+        now_ns = time.time_ns()
+        if "message_id" not in message:
+            message["message_id"] = new_message_id(now_ns)
+        if "timestamp" not in message:
+            message["timestamp"] = cached_timestamp(now_ns)
+        return message
+    
+    def _token(self, nbytes: int = 32) -> str:
+        """URL-safe reconnect token cut from a pooled 4 KB urandom read."""
+        if len(self._rand_pool) - self._rand_off < nbytes:
+            self._rand_pool = os.urandom(4096)
+            self._rand_off = 0
+        off = self._rand_off
+        self._rand_off = off + nbytes
+        return base64.urlsafe_b64encode(self._rand_pool[off:off + nbytes]).rstrip(b"=").decode()
+    
+    def _enqueue(self, connection_id: str, text: str, state: Optional[ConnState] = None) -> bool:
+        """Queue an encoded frame for a connection's relay without awaiting the socket.
+        
+        Slow-consumer policy: when the queue is full the connection is dropped.
+        """
+        if state is None:
+            state = self.conns.get(connection_id)
+            if state is None:
+                return False
+        try:
+            state.send_queue.put_nowait(text)
+            return True
+        except asyncio.QueueFull:
+            logger.warning(f"Send queue full for {connection_id}; disconnecting slow client")
+            self.disconnect(connection_id)
+            return False
+    
+    async def _relay(self, connection_id: str):
+        """Drain a connection's send queue onto its socket."""
+        state = self.conns.get(connection_id)
+        if state is None:
+            return
+        queue = state.send_queue
+        websocket = state.websocket
+        sem = self._send_sem
+        try:
+            while True:
+                text = await queue.get()
+                async with sem:
+                    await websocket.send_text(text)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            if not isinstance(e, WebSocketDisconnect):
+                logger.error(f"Relay to {connection_id} failed: {str(e)}")
+            self.disconnect(connection_id)
+    
+    async def _send_batched(self, message: Dict[str, Any], connection_ids: List[str]):
+        """Send via send_personal_message in concurrent batches, yielding between batches.
+        
+        The message is stamped and encoded once and the frame shared by every recipient.
+        """
+        if not connection_ids:
+            return
+        prepared = encode_message(self._stamp(message))
+        await self._fan_out([(cid, message, prepared) for cid in connection_ids])
+    
+    async def _fan_out(self, targets: List[Tuple[str, Dict[str, Any], str]]):
+        """Deliver (connection_id, message, frame) targets in concurrent batches."""
+        batch_size = self.broadcast_batch_size
+        for i in range(0, len(targets), batch_size):
+            await asyncio.gather(
+                *(self.send_personal_message(message, cid, prepared=prepared, rate_limited=False)
+                  for cid, message, prepared in targets[i:i + batch_size]),
+                return_exceptions=True
+            )
+            await asyncio.sleep(0)
+    
+    async def _send_to_user_and_role(self, message: Dict[str, Any], user_id: str, role: str):
+        """Send one frame to a user's connections and a role's connections in a single pass."""
+        user_ids = self.user_connections.get(user_id, ())
+        if not user_ids:
+            logger.warning(f"No connections found for user {user_id}")
+        # Union: a connection that is both the user and in the role gets the frame once
+        await self._send_batched(message, list(set(user_ids).union(self.role_connections.get(role, ()))))
+    
     async def send_to_user(self, message: Dict[str, Any], user_id: str):
         """Send message to all connections of a specific user."""
         try:
-            if user_id in self.user_connections:
-                connection_ids = list(self.user_connections[user_id])
-                for connection_id in connection_ids:
-                    await self.send_personal_message(message, connection_id)
+            connection_ids = list(self.user_connections.get(user_id, ()))
+            if connection_ids:
+                await self._send_batched(message, connection_ids)
                 
                 logger.info(f"Sent message to user {user_id} via {len(connection_ids)} connections")
             else:
@@ -215,22 +373,17 @@ class WebSocketManager:
         except Exception as e:
             logger.error(f"Failed to send message to user: {str(e)}")
     
-    async def broadcast(self, message: Dict[str, Any], exclude_connections: List[str] = None):
+    async def broadcast(self, message: Union[Dict[str, Any], FastWSMessage], exclude_connections: List[str] = None):
         """Broadcast message to all active connections."""
         try:
-            exclude_connections = exclude_connections or []
+            exclude = set(exclude_connections or ())
+            payload = encode_message(message)
             sent_count = 0
             
-            for connection_id, websocket in self.active_connections.items():
-                if connection_id not in exclude_connections:
-                    try:
-                        await websocket.send_text(json.dumps(message))
-                        sent_count += 1
-                    except WebSocketDisconnect:
-                        self.disconnect(connection_id)
-                    except Exception as e:
-                        logger.error(f"Failed to broadcast to {connection_id}: {str(e)}")
-                        self.disconnect(connection_id)
+            # Snapshot: slow-client disconnects below mutate conns
+            for connection_id, state in list(self.conns.items()):
+                if connection_id not in exclude and self._enqueue(connection_id, payload, state):
+                    sent_count += 1
             
             logger.info(f"Broadcasted message to {sent_count} connections")
             
@@ -240,13 +393,12 @@ class WebSocketManager:
     async def handle_job_update(self, job_id: str, status: str, data: Dict[str, Any]):
         """Handle job status updates."""
         try:
-            message = {
-                "type": "job_update",
-                "job_id": job_id,
-                "status": status,
-                "data": data,
-                "timestamp": asyncio.get_event_loop().time()
-            }
+            message = JobUpdateMessage(
+                job_id=job_id,
+                status=status,
+                data=data,
+                timestamp=self._now()
+            )
             
             # Broadcast to all connections
             await self.broadcast(message)
@@ -262,7 +414,7 @@ class WebSocketManager:
             message = {
                 "type": "notification",
                 "notification": notification,
-                "timestamp": asyncio.get_event_loop().time()
+                "timestamp": self._now()
             }
             
             await self.send_to_user(message, user_id)
@@ -273,11 +425,10 @@ class WebSocketManager:
     async def handle_system_announcement(self, announcement: Dict[str, Any]):
         """Handle system-wide announcements."""
         try:
-            message = {
-                "type": "system_announcement",
-                "announcement": announcement,
-                "timestamp": asyncio.get_event_loop().time()
-            }
+            message = SystemAnnouncementMessage(
+                announcement=announcement,
+                timestamp=self._now()
+            )
             
             await self.broadcast(message)
             
@@ -286,7 +437,7 @@ class WebSocketManager:
     
     def get_connection_count(self) -> int:
         """Get total number of active connections."""
-        return len(self.active_connections)
+        return len(self.conns)
     
     def get_user_connection_count(self, user_id: str) -> int:
         """Get number of connections for a specific user."""
@@ -295,41 +446,47 @@ class WebSocketManager:
     def get_connection_stats(self) -> Dict[str, Any]:
         """Get connection statistics."""
         return {
-            "total_connections": len(self.active_connections),
-            "unique_users": len(self.user_connections),
-            "user_connections": {user_id: len(conns) for user_id, conns in self.user_connections.items()}
+            "total_connections": len(self.conns),
+            "unique_users": sum(1 for conns in self.user_connections.values() if conns),
+            "user_connections": {user_id: len(conns) for user_id, conns in self.user_connections.items() if conns}
         }
     
+    def get_healthy_connection_count(self, window: float = 60.0) -> int:
+        """Count connections pinged within ``window`` seconds."""
+        cutoff = self._now() - window
+        return sum(
+            1 for state in self.conns.values()
+            if state.last_ping is not None and state.last_ping > cutoff
+        )
+    
     async def start_event_listener(self):
         """Start listening to Redis pub/sub events."""
         try:
-            # Capture the main event loop so subscriber thread can schedule coroutines
-            main_loop = asyncio.get_event_loop()
+            main_loop = asyncio.get_running_loop()
+            self._loop = main_loop
+            self._now = main_loop.time
 
-            def event_callback(event_data):
-                try:
-                    # Schedule the coroutine safely from a different thread
-                    asyncio.run_coroutine_threadsafe(self._handle_redis_event(event_data), main_loop)
-                except Exception as e:
-                    logger.error(f"Failed to schedule redis event on main loop: {e}")
-            
-            # Subscribe to events in a separate thread
-            import threading
-            
-            def run_subscriber():
-                try:
-                    self.notifier.subscribe_to_events(event_callback)
-                except Exception as e:
-                    logger.error(f"Redis subscriber error: {str(e)}")
-            
-            subscriber_thread = threading.Thread(target=run_subscriber, daemon=True)
-            subscriber_thread.start()
+            # Subscribe on the event loop itself; no subscriber thread or cross-thread hop
+            self._redis_task = asyncio.create_task(self._redis_loop())
+            self._cleanup_task = asyncio.create_task(self._cleanup_loop())
+            self._heartbeat_task = asyncio.create_task(self._heartbeat_sweeper())
             
             logger.info("Started Redis event listener")
             
         except Exception as e:
             logger.error(f"Failed to start event listener: {str(e)}")
     
+    async def _redis_loop(self):
+        """Consume Redis pub/sub events and dispatch them in-loop."""
+        try:
+            async for event_data in self.notifier.subscribe_to_events():
+                if isinstance(event_data, dict):
+                    await self._handle_redis_event(event_data)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Redis subscriber error: {str(e)}")
+    
     async def _handle_redis_event(self, event_data: Dict[str, Any]):
         """Handle events from Redis pub/sub with message queuing."""
         try:
@@ -344,7 +501,7 @@ class WebSocketManager:
                 "event_type": event_type,
                 "job_id": job_id,
                 "data": payload,
-                "timestamp": asyncio.get_event_loop().time()
+                "timestamp": self._now()
             }
             
             # Interview events
@@ -398,123 +555,123 @@ class WebSocketManager:
                 
             # User-specific messages
             elif target_user:
-                if target_user in self.user_connections:
+                if self.user_connections.get(target_user):
                     await self.send_to_user(message, target_user)
                 else:
                     # Queue message for offline user
                     if target_user not in self.message_queue:
-                        self.message_queue[target_user] = []
-                    self.message_queue[target_user].append(message)
+                        self.message_queue[target_user] = deque()
+                    self.message_queue[target_user].append((self._now(), message))
                     
             # Global broadcasts
             else:
                 await self.broadcast(message)
                 
-            # Cleanup old queued messages
-            await self._cleanup_message_queue()
-                
         except Exception as e:
             logger.error(f"Failed to handle Redis event: {str(e)}")
             
-    async def _connection_heartbeat(self, connection_id: str):
-        """Maintain connection health with periodic pings."""
-        try:
-            while connection_id in self.active_connections:
-                await asyncio.sleep(30)  # Heartbeat every 30 seconds
-                
-                try:
-                    # Send ping and measure latency
-                    start_time = asyncio.get_event_loop().time()
-                    await self.send_personal_message({
-                        "type": "ping",
-                        "timestamp": start_time
-                    }, connection_id)
-                    
-                    # Update health metrics
-                    health = self.connection_health[connection_id]
-                    health["last_ping"] = start_time
-                    health["ping_count"] += 1
-                    
-                except Exception:
-                    # Connection likely dead
-                    logger.warning(f"Heartbeat failed for {connection_id}")
-                    self.disconnect(connection_id)
-                    break
-                    
-        except Exception as e:
-            logger.error(f"Heartbeat error for {connection_id}: {str(e)}")
+    async def _heartbeat_sweeper(self):
+        """Ping every connection from one shared task instead of a task per connection."""
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                states = list(self.conns.items())
+                batch_size = self.broadcast_batch_size
+                for i in range(0, len(states), batch_size):
+                    for connection_id, state in states[i:i + batch_size]:
+                        self._ping(connection_id, state)
+                    await asyncio.sleep(0)
+            except Exception as e:
+                logger.error(f"Heartbeat sweep error: {str(e)}")
+    
+    def _ping(self, connection_id: str, state: ConnState):
+        """Queue a ping for a connection and record it in the health metrics."""
+        if self.conns.get(connection_id) is not state:
+            return
+        
+        # Send ping and measure latency
+        start_time = self._now()
+        if not self._enqueue(connection_id, make_ping(start_time, new_message_id()), state):
+            # Connection likely dead
+            logger.warning(f"Heartbeat failed for {connection_id}")
+            self.disconnect(connection_id)
+            return
+        
+        # Update health metrics
+        state.last_ping = start_time
+        state.ping_count += 1
             
     async def handle_pong(self, connection_id: str, ping_timestamp: float):
         """Handle pong response to calculate latency."""
         try:
-            if connection_id in self.connection_health:
-                latency = (asyncio.get_event_loop().time() - ping_timestamp) * 1000
-                self.connection_health[connection_id]["latency_ms"].append(round(latency, 2))
-                
-                # Keep only last 10 latency measurements
-                self.connection_health[connection_id]["latency_ms"] = \
-                    self.connection_health[connection_id]["latency_ms"][-10:]
+            state = self.conns.get(connection_id)
+            if state is not None:
+                latency = (self._now() - ping_timestamp) * 1000
+                state.latency_ms.append(round(latency, 2))
                     
         except Exception as e:
             logger.error(f"Failed to handle pong: {str(e)}")
             
+    async def _cleanup_loop(self):
+        """Periodically expire queued offline messages."""
+        while True:
+            await asyncio.sleep(self.queue_cleanup_interval)
+            await self._cleanup_message_queue()
+            self._prune_empty_indexes()
+    
+    def _prune_empty_indexes(self):
+        """Drop user/role entries whose connection sets emptied since the last sweep."""
+        for index in (self.user_connections, self.role_connections):
+            for key in [key for key, conns in index.items() if not conns]:
+                del index[key]
+    
     async def _cleanup_message_queue(self):
         """Clean up old queued messages (older than 24 hours)."""
         try:
-            current_time = asyncio.get_event_loop().time()
-            expiry_time = current_time - (24 * 60 * 60)  # 24 hours
+            expiry_time = self._now() - self.queue_ttl
             
             for user_id in list(self.message_queue.keys()):
-                self.message_queue[user_id] = [
-                    msg for msg in self.message_queue[user_id]
-                    if msg.get("timestamp", current_time) > expiry_time
-                ]
+                # Queues are appended in time order, so expired entries sit at the head
+                queue = self.message_queue[user_id]
+                while queue and queue[0][0] <= expiry_time:
+                    queue.popleft()
                 
-                if not self.message_queue[user_id]:
+                if not queue:
                     del self.message_queue[user_id]
                     
         except Exception as e:
             logger.error(f"Failed to cleanup message queue: {str(e)}")
             
-    def _check_rate_limit(self, connection_id: str) -> bool:
+    def _check_rate_limit(self, connection_id: str, state: Optional[ConnState] = None) -> bool:
         """
         Check if connection has exceeded rate limits.
         Implements token bucket algorithm.
         """
         try:
-            now = datetime.now()
-            
-            if connection_id not in self.rate_limits:
-                self.rate_limits[connection_id] = {
-                    "tokens": self.max_messages_per_minute,
-                    "last_update": now,
-                    "warnings": 0
-                }
-                return True
-                
-            rate_data = self.rate_limits[connection_id]
+            if state is None:
+                state = self.conns.get(connection_id)
+                if state is None:
+                    return True
             
-            # Calculate token refill
-            time_passed = (now - rate_data["last_update"]).total_seconds()
-            tokens_to_add = int(time_passed * (self.max_messages_per_minute / 60))
+            now = self._now()
             
-            # Update tokens
-            rate_data["tokens"] = min(
-                self.max_messages_per_minute,
-                rate_data["tokens"] + tokens_to_add
+            # Refill continuously from monotonic clock floats; no datetime allocations
+            state.tokens = min(
+                float(self.max_messages_per_minute),
+                state.tokens + (now - state.last_update) * self._refill_per_sec
             )
-            rate_data["last_update"] = now
+            state.last_update = now
             
             # Check if we have tokens
-            if rate_data["tokens"] > 0:
-                rate_data["tokens"] -= 1
+            if state.tokens >= 1.0:
+                state.tokens -= 1.0
                 return True
                 
             # Increment warnings
-            rate_data["warnings"] += 1
+            state.warnings += 1
             
             # Disconnect if too many warnings
-            if rate_data["warnings"] > 3:
+            if state.warnings > 3:
                 logger.warning(f"Disconnecting {connection_id} due to rate limiting")
                 self.disconnect(connection_id)
                 
@@ -532,11 +689,8 @@ class WebSocketManager:
         """Handle disconnection with fallback to polling."""
         try:
             # Get user ID and role
-            user_id = next(
-                (uid for uid, conns in self.user_connections.items()
-                if connection_id in conns),
-                None
-            )
+            state = self.conns.get(connection_id)
+            user_id = state.user_id if state is not None else None
             
             if not user_id:
                 return
@@ -546,7 +700,7 @@ class WebSocketManager:
                 "last_message": message,
                 "disconnected_at": datetime.now(),
                 "user_id": user_id,
-                "role": self.connection_roles.get(connection_id)
+                "role": state.role if state is not None else None
             }
             
             # Start fallback polling
@@ -589,9 +743,9 @@ class WebSocketManager:
         """Handle updates from fallback polling."""
         try:
             for update in updates:
-                event_type = update.get("type")
+                event = WebSocketEventType.from_wire(update.get("type"))
                 
-                if event_type.startswith("interview"):
+                if event in INTERVIEW_EVENTS:
                     await self.handle_interview_update(
                         update.get("job_id"),
                         update.get("user_id"),
@@ -599,7 +753,7 @@ class WebSocketManager:
                         update.get("data", {})
                     )
                     
-                elif event_type.startswith("application"):
+                elif event in APPLICATION_EVENTS:
                     await self.handle_application_update(
                         update.get("job_id"),
                         update.get("user_id"),
@@ -607,14 +761,14 @@ class WebSocketManager:
                         update.get("data", {})
                     )
                     
-                elif event_type.startswith("job"):
+                elif event in JOB_EVENTS:
                     await self.handle_job_update(
                         update.get("job_id"),
                         update.get("status"),
                         update.get("data", {})
                     )
                     
-                elif event_type.startswith("system"):
+                elif event in SYSTEM_EVENTS:
                     await self.handle_system_announcement(update)
                     
         except Exception as e:
@@ -623,16 +777,10 @@ class WebSocketManager:
     async def broadcast_to_role(self, message: Dict[str, Any], role: str):
         """Broadcast message to all connections with specific role."""
         try:
-            sent_count = 0
-            for conn_id, conn_role in self.connection_roles.items():
-                if conn_role == role and conn_id in self.active_connections:
-                    try:
-                        await self.send_personal_message(message, conn_id)
-                        sent_count += 1
-                    except Exception:
-                        self.disconnect(conn_id)
+            connection_ids = list(self.role_connections.get(role, ()))
+            await self._send_batched(message, connection_ids)
                         
-            logger.info(f"Broadcasted to {sent_count} {role} connections")
+            logger.info(f"Broadcasted to {len(connection_ids)} {role} connections")
             
         except Exception as e:
             logger.error(f"Failed to broadcast to role {role}: {str(e)}")
@@ -643,19 +791,14 @@ class WebSocketManager:
             message = {
                 "type": "interview_update",
                 "job_id": job_id,
+                "candidate_id": user_id,
                 "status": status,
                 "data": data,
-                "timestamp": asyncio.get_event_loop().time()
+                "timestamp": self._now()
             }
             
-            # Send to candidate
-            await self.send_to_user(message, user_id)
-            
-            # Notify recruiters/HR
-            await self.broadcast_to_role({
-                **message,
-                "candidate_id": user_id
-            }, "recruiter")
+            # Send to candidate and notify recruiters/HR in a single fan-out
+            await self._send_to_user_and_role(message, user_id, "recruiter")
             
         except Exception as e:
             logger.error(f"Failed to handle interview update: {str(e)}")
@@ -666,19 +809,14 @@ class WebSocketManager:
             message = {
                 "type": "application_update",
                 "job_id": job_id,
+                "candidate_id": user_id,
                 "status": status,
                 "data": data,
-                "timestamp": asyncio.get_event_loop().time()
+                "timestamp": self._now()
             }
             
-            # Send to candidate
-            await self.send_to_user(message, user_id)
-            
-            # Notify recruiters
-            await self.broadcast_to_role({
-                **message,
-                "candidate_id": user_id
-            }, "recruiter")
+            # Send to candidate and notify recruiters in a single fan-out
+            await self._send_to_user_and_role(message, user_id, "recruiter")
             
         except Exception as e:
             logger.error(f"Failed to handle application update: {str(e)}")
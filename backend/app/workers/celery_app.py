@@ -1,4 +1,17 @@
 from celery import Celery
+from celery.schedules import crontab
+
+# Under `-P gevent` (the llm_io worker) celery monkey-patches before importing
+# this module; gRPC's C core does not yield to the hub on its own, so hook it in
+# before any Gemini client opens a channel or every call blocks all greenlets
+try:
+    from gevent import monkey
+    if monkey.is_module_patched("socket"):
+        from grpc.experimental import gevent as grpc_gevent
+        grpc_gevent.init_gevent()
+except ImportError:
+    pass
+
 from app.config import settings
 from app.services.parser import ResumeParser  # Now valid
 import logging
@@ -12,8 +25,19 @@ celery = Celery(
 
 # Celery configuration
 celery.conf.update(
-    # Task routing - temporarily route all to default queue
-    task_routes={},  # Empty dict = all tasks go to default queue
+    # Task routing - cleanup runs on its own low-priority queue/worker pool;
+    # the network-bound LLM/DB scoring tasks go to llm_io, served by a gevent
+    # pool (-P gevent -c 64) so one process keeps many calls in flight;
+    # everything else still goes to the default queue
+    task_routes={
+        'app.workers.cleanup_worker.*': {'queue': 'cleanup'},
+        'app.workers.scoring_worker.score_candidate': {'queue': 'llm_io'},
+        'app.workers.scoring_worker.match_job_candidates': {'queue': 'llm_io'},
+        'app.workers.scoring_worker.process_match_chunk': {'queue': 'llm_io'},
+        'app.workers.scoring_worker.finalize_job_matches': {'queue': 'llm_io'},
+        'app.workers.scoring_worker.score_interview': {'queue': 'llm_io'},
+        'app.workers.scoring_worker.batch_score_candidates': {'queue': 'llm_io'},
+    },
 
     # Task execution settings
     task_default_retry_delay=30,
@@ -36,6 +60,20 @@ celery.conf.update(
     # Monitoring
     worker_send_task_events=True,
     task_send_sent_event=True,
+
+    # Periodic tasks (run by `celery beat`)
+    beat_schedule={
+        'daily-cleanup': {
+            'task': 'app.workers.cleanup_worker.daily_cleanup',
+            'schedule': crontab(hour=3, minute=0),
+        },
+        # Backstop only; request_interview_questions schedules the dispatcher itself
+        'dispatch-interview-question-batches': {
+            'task': 'app.workers.interview_worker.dispatch_interview_question_batches',
+            'schedule': 2.0,
+            'options': {'expires': 2},
+        },
+    },
 )
 
 # Import all task modules
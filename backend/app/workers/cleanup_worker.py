@@ -1,13 +1,88 @@
+import functools
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
-from typing import Dict, Any
+from itertools import islice
+from typing import Dict, Any, List
+from celery import chord, group
+from celery.exceptions import Retry
 from app.workers.celery_app import celery
-from app.services.db_utils import DatabaseService
+from app.services.sync_wrappers import SyncDatabaseService
 from app.services.storage import StorageService
 from app.services.cache import CacheService
 from app.config import settings
 
+# Expired file records handled per GCS batch delete + Mongo update_many
+FILE_DELETE_CHUNK_SIZE = 1000
 
-@celery.task(name="app.workers.cleanup_worker.cleanup_expired_files", bind=True)
+# Service clients are built once per worker process and reused across tasks
+@functools.lru_cache(maxsize=1)
+def _db_service() -> SyncDatabaseService:
+    return SyncDatabaseService()
+
+
+@functools.lru_cache(maxsize=1)
+def _cache_service() -> CacheService:
+    return CacheService()
+
+
+@functools.lru_cache(maxsize=1)
+def _embedder():
+    from app.services.embedder import EmbedderService
+    return EmbedderService()
+
+
+_thread_storage = threading.local()
+
+
+def _delete_chunk(gcs_paths: List[str]) -> Dict[str, str]:
+    """Batch-delete paths on this thread's own StorageService.
+
+    GCS batches are tracked on the client, so each pool thread needs its own client.
+    """
+    storage_service = getattr(_thread_storage, "service", None)
+    if storage_service is None:
+        storage_service = _thread_storage.service = StorageService()
+    return storage_service.delete_files(gcs_paths)
+
+
+class _SweepTask(celery.Task):
+    """Sweep task that reports its final failure as a result instead of raising.
+
+    daily_cleanup runs the sweeps as a chord, and one raising branch would fail
+    the chord and lose the other branches' results.
+    """
+
+    def __call__(self, *args, **kwargs):
+        try:
+            return super().__call__(*args, **kwargs)
+        except Retry:
+            raise
+        except Exception as e:
+            # autoretry_for covers every exception, so reaching here means retries are exhausted
+            return {
+                "error": str(e),
+                "status": "failed"
+            }
+
+
+# Decorator-level retries for the sweep tasks; replaces hand-rolled self.retry
+_RETRY_OPTIONS = dict(
+    base=_SweepTask,
+    autoretry_for=(Exception,),
+    retry_backoff=60,
+    retry_backoff_max=900,
+    retry_jitter=True,
+    max_retries=3,
+    acks_late=True,
+    reject_on_worker_lost=True,
+)
+
+# Failed jobs archived per bulk_write
+JOB_ARCHIVE_CHUNK_SIZE = 500
+
+
+@celery.task(name="app.workers.cleanup_worker.cleanup_expired_files", bind=True, **_RETRY_OPTIONS)
 def cleanup_expired_files(self, days_old: int = 30) -> Dict[str, Any]:
     """
     Clean up expired files from Google Cloud Storage.
@@ -18,76 +93,89 @@ def cleanup_expired_files(self, days_old: int = 30) -> Dict[str, Any]:
     Returns:
         Dict with cleanup results
     """
-    try:
-        storage_service = StorageService()
-        db_service = DatabaseService()
-        
-        # Get files older than specified days
-        cutoff_date = datetime.utcnow() - timedelta(days=days_old)
-        expired_files = db_service.get_expired_files(cutoff_date)
-        
-        deleted_count = 0
-        errors = []
-        
-        for file_record in expired_files:
-            try:
-                gcs_path = file_record.get('gcs_path')
-                if gcs_path:
-                    # Delete from GCS
-                    storage_service.delete_file(gcs_path)
-                    
-                    # Update database record
-                    db_service.mark_file_deleted(file_record['_id'])
-                    deleted_count += 1
-                    
-            except Exception as e:
-                errors.append({
-                    "file_id": file_record.get('_id'),
-                    "error": str(e)
-                })
+    db_service = _db_service()
+    
+    # Get files older than specified days, grouped into delete batches by Mongo
+    cutoff_date = datetime.utcnow() - timedelta(days=days_old)
+    batches = iter(db_service.get_expired_file_batches(cutoff_date, FILE_DELETE_CHUNK_SIZE))
+    
+    deleted_count = 0
+    errors = []
+    
+    def finish(future, batch):
+        nonlocal deleted_count
+        try:
+            failures = future.result()
+        except Exception as e:
+            errors.extend({"file_id": file_id, "error": str(e)} for file_id in batch["ids"])
+            return
         
-        return {
-            "deleted_count": deleted_count,
-            "errors": errors,
-            "status": "completed"
-        }
+        deleted_ids = []
+        for file_id, gcs_path in zip(batch["ids"], batch["paths"]):
+            error = failures.get(gcs_path)
+            if error:
+                errors.append({"file_id": file_id, "error": error})
+            else:
+                deleted_ids.append(file_id)
         
-    except Exception as e:
-        raise self.retry(exc=e, countdown=300, max_retries=3)
+        # Update database records in one round-trip
+        if deleted_ids:
+            db_service.mark_files_deleted(deleted_ids)
+            deleted_count += len(deleted_ids)
+    
+    workers = max(1, settings.gcs_delete_concurrency)
+    pending = {}
+    
+    # Overlap batch deletes across threads; at most 2x workers batches are
+    # in flight so the cursor is still consumed incrementally
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        try:
+            while True:
+                batch = next(batches, None)
+                if batch is not None:
+                    future = pool.submit(_delete_chunk, batch["paths"])
+                    pending[future] = batch
+                    if len(pending) < 2 * workers:
+                        continue
+                if not pending:
+                    break
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    finish(future, pending.pop(future))
+        finally:
+            # The deleted flag is the checkpoint: the query skips marked files,
+            # so record chunks already sent to GCS before a retry restarts the sweep
+            for future in list(pending):
+                finish(future, pending.pop(future))
+    
+    return {
+        "deleted_count": deleted_count,
+        "errors": errors,
+        "status": "completed"
+    }
 
 
-@celery.task(name="app.workers.cleanup_worker.cleanup_cache", bind=True)
+@celery.task(name="app.workers.cleanup_worker.cleanup_cache", bind=True, **_RETRY_OPTIONS)
 def cleanup_cache(self) -> Dict[str, Any]:
     """
-    Clean up expired cache entries from Redis.
+    Report Redis cache keyspace health.
+    
+    Every cache writer sets its TTL atomically (SETEX), so Redis expires
+    entries itself and no periodic sweep is needed. The cleanup_expired_*
+    sweeps remain on CacheService for one-off repair of keys without a TTL.
     
     Returns:
-        Dict with cleanup results
+        Dict with keyspace statistics
     """
-    try:
-        cache_service = CacheService()
-        
-        # Clean up expired embeddings cache
-        embeddings_cleaned = cache_service.cleanup_expired_embeddings()
-        
-        # Clean up expired scores cache
-        scores_cleaned = cache_service.cleanup_expired_scores()
-        
-        # Clean up expired session data
-        sessions_cleaned = cache_service.cleanup_expired_sessions()
-        
-        return {
-            "embeddings_cleaned": embeddings_cleaned,
-            "scores_cleaned": scores_cleaned,
-            "sessions_cleaned": sessions_cleaned,
-            "status": "completed"
-        }
-        
-    except Exception as e:
-        raise self.retry(exc=e, countdown=300, max_retries=3)
+    cache_service = _cache_service()
+    
+    return {
+        **cache_service.get_keyspace_summary(),
+        "status": "completed"
+    }
 
 
-@celery.task(name="app.workers.cleanup_worker.cleanup_failed_jobs", bind=True)
+@celery.task(name="app.workers.cleanup_worker.cleanup_failed_jobs", bind=True, **_RETRY_OPTIONS)
 def cleanup_failed_jobs(self, days_old: int = 7) -> Dict[str, Any]:
     """
     Clean up old failed job records from database.
@@ -98,36 +186,35 @@ def cleanup_failed_jobs(self, days_old: int = 7) -> Dict[str, Any]:
     Returns:
         Dict with cleanup results
     """
-    try:
-        db_service = DatabaseService()
-        
-        # Get failed jobs older than specified days
-        cutoff_date = datetime.utcnow() - timedelta(days=days_old)
-        failed_jobs = db_service.get_failed_jobs(cutoff_date)
-        
-        cleaned_count = 0
-        errors = []
-        
-        for job in failed_jobs:
-            try:
-                # Archive or delete failed job
-                db_service.archive_failed_job(job['_id'])
-                cleaned_count += 1
-                
-            except Exception as e:
-                errors.append({
-                    "job_id": job.get('_id'),
-                    "error": str(e)
-                })
-        
-        return {
-            "cleaned_count": cleaned_count,
-            "errors": errors,
-            "status": "completed"
-        }
+    db_service = _db_service()
+    
+    # Get failed jobs older than specified days
+    cutoff_date = datetime.utcnow() - timedelta(days=days_old)
+    failed_jobs = db_service.get_failed_jobs(cutoff_date)
+    
+    cleaned_count = 0
+    errors = []
+    
+    jobs = iter(failed_jobs)
+    while True:
+        job_ids = [job['_id'] for job in islice(jobs, JOB_ARCHIVE_CHUNK_SIZE)]
+        if not job_ids:
+            break
         
-    except Exception as e:
-        raise self.retry(exc=e, countdown=300, max_retries=3)
+        try:
+            # Archive the chunk in one round-trip
+            _, chunk_errors = db_service.archive_failed_jobs_bulk(job_ids)
+            cleaned_count += len(job_ids) - len(chunk_errors)
+            errors.extend(chunk_errors)
+            
+        except Exception as e:
+            errors.extend({"job_id": job_id, "error": str(e)} for job_id in job_ids)
+    
+    return {
+        "cleaned_count": cleaned_count,
+        "errors": errors,
+        "status": "completed"
+    }
 
 
 @celery.task(name="app.workers.cleanup_worker.optimize_index")
@@ -139,9 +226,7 @@ def optimize_index() -> Dict[str, Any]:
         Dict with optimization results
     """
     try:
-        from app.services.embedder import EmbedderService
-
-        embedder = EmbedderService()
+        embedder = _embedder()
 
         # Get stale vectors (application-specific logic)
         stale_vectors = embedder.find_stale_vectors()
@@ -170,38 +255,48 @@ def optimize_index() -> Dict[str, Any]:
 
 
 # Periodic cleanup tasks
-@celery.task(name="app.workers.cleanup_worker.daily_cleanup")
-def daily_cleanup() -> Dict[str, Any]:
+_DAILY_RESULT_KEYS = ("files", "cache", "failed_jobs", "index")
+
+
+@celery.task(name="app.workers.cleanup_worker.collect_cleanup_results")
+def collect_cleanup_results(results: List[Any]) -> Dict[str, Any]:
     """
-    Run daily cleanup tasks.
+    Chord callback for daily_cleanup: label each branch's result.
+    
+    Args:
+        results: Results of the cleanup group, in _DAILY_RESULT_KEYS order
     
     Returns:
         Dict with all cleanup results
     """
-    results = {}
-    
-    try:
-        # Clean up expired files (30 days old)
-        results['files'] = cleanup_expired_files.delay(30).get()
-    except Exception as e:
-        results['files'] = {"error": str(e)}
-    
-    try:
-        # Clean up cache
-        results['cache'] = cleanup_cache.delay().get()
-    except Exception as e:
-        results['cache'] = {"error": str(e)}
+    return dict(zip(_DAILY_RESULT_KEYS, results))
+
+
+@celery.task(name="app.workers.cleanup_worker.daily_cleanup")
+def daily_cleanup() -> Dict[str, Any]:
+    """
+    Run daily cleanup tasks.
     
-    try:
-        # Clean up failed jobs (7 days old)
-        results['failed_jobs'] = cleanup_failed_jobs.delay(7).get()
-    except Exception as e:
-        results['failed_jobs'] = {"error": str(e)}
+    The four cleanups run in parallel as a chord; results are gathered by
+    collect_cleanup_results rather than by blocking this task on .get().
     
+    Returns:
+        Dict with the id of the chord callback holding all cleanup results
+    """
     try:
-        # Optimize index (Vertex-aware)
-        results['index'] = optimize_index.delay().get()
+        result = chord(group(
+            cleanup_expired_files.s(30),   # Expired files (30 days old)
+            cleanup_cache.s(),
+            cleanup_failed_jobs.s(7),      # Failed jobs (7 days old)
+            optimize_index.s()
+        ))(collect_cleanup_results.s())
+        
+        return {
+            "results_task_id": result.id,
+            "status": "scheduled"
+        }
     except Exception as e:
-        results['index'] = {"error": str(e)}
-    
-    return results
+        return {
+            "error": str(e),
+            "status": "failed"
+        }
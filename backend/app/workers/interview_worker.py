@@ -5,9 +5,14 @@ Handles question generation, timing, response evaluation, and retry logic.
 
 import time
 import json
+import functools
+import uuid
 import asyncio
 import logging
-from typing import Dict, Any, List, Optional
+import msgspec
+from collections import defaultdict
+import numpy as np
+from typing import Dict, Any, List, Optional, Set, Tuple
 from datetime import datetime, timedelta
 from app.workers.celery_app import celery
 import google.generativeai as genai
@@ -18,7 +23,12 @@ from app.services.scorer import LLMScoringService
 from app.services.notifier import NotificationService
 from app.services.embedder import EmbedderService
 from app.services.cache import CacheService
-from app.database import AsyncMongoClient
+from app.services.sync_wrappers import run_async
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import OperationFailure
+from bson import ObjectId
+from celery.signals import worker_process_init, worker_process_shutdown
 
 # Initialize services
 audit_service = AuditService()
@@ -33,6 +43,205 @@ logger = logging.getLogger(__name__)
 genai.configure(api_key=settings.gemini_api_key)
 model = genai.GenerativeModel('gemini-2.5-flash')
 
+# Question requests for the same job are coalesced into one Gemini call of up to this many candidates
+INTERVIEW_QUESTION_BATCH_SIZE = 8
+# How long queued requests wait for others of the same job before a dispatch drains them
+INTERVIEW_QUESTION_BATCH_WINDOW = 2
+
+# Hedged Gemini calls: if an attempt hasn't answered within the hedge delay
+# (roughly the p95 of question generation) another is started alongside it,
+# up to the attempt cap; the first good response wins and the rest are cancelled
+GEMINI_HEDGE_DELAY = 8.0
+GEMINI_MAX_ATTEMPTS = 3
+GEMINI_TOTAL_DEADLINE = 90.0
+
+# Trailing slice of the interview transcript sent as scoring context; the
+# current question/answer pair is passed separately
+TRANSCRIPT_WINDOW_CHARS = 4096
+
+# Sessions per bulk write when rebuilding interview statistics
+STATS_REBUILD_BATCH_SIZE = 500
+
+# Shared Motor client, created lazily and reused across tasks in this process
+_mongo_client: Optional[AsyncIOMotorClient] = None
+
+
+def get_db():
+    """Return the interview database on the process-wide pooled Motor client."""
+    global _mongo_client
+    if _mongo_client is None:
+        _mongo_client = AsyncIOMotorClient(settings.mongo_url, maxPoolSize=50)
+    return _mongo_client[settings.mongo_db_name]
+
+
+@worker_process_init.connect
+def _reset_mongo_client(**kwargs):
+    """Drop the inherited client so each forked worker opens its own pool."""
+    global _mongo_client
+    _mongo_client = None
+
+
+@worker_process_shutdown.connect
+def _close_mongo_client(**kwargs):
+    """Close this worker's pool on exit instead of leaving sockets to the OS."""
+    global _mongo_client
+    if _mongo_client is not None:
+        _mongo_client.close()
+        _mongo_client = None
+
+
+# Interview QA vectors are queued and upserted in batches by a per-loop flusher
+PINECONE_FLUSH_MAX_ITEMS = 100
+PINECONE_FLUSH_INTERVAL = 0.25
+
+_pinecone_queue: Optional[asyncio.Queue] = None
+_pinecone_flusher: Optional[asyncio.Task] = None
+
+
+async def _flush_pinecone_queue(queue: asyncio.Queue) -> None:
+    """Drain queued vectors into batched upserts: up to PINECONE_FLUSH_MAX_ITEMS or every PINECONE_FLUSH_INTERVAL."""
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await queue.get()]
+        deadline = loop.time() + PINECONE_FLUSH_INTERVAL
+        while len(batch) < PINECONE_FLUSH_MAX_ITEMS:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+        try:
+            await asyncio.to_thread(embedder.upsert_to_pinecone_batch, batch)
+        except Exception as e:
+            logger.error(f"Failed to upsert batch of {len(batch)} vectors: {e}")
+        finally:
+            for _ in batch:
+                queue.task_done()
+
+
+def _get_pinecone_queue() -> asyncio.Queue:
+    """Return the running loop's upsert queue, starting its flusher on first use."""
+    global _pinecone_queue, _pinecone_flusher
+    loop = asyncio.get_running_loop()
+    if _pinecone_flusher is None or _pinecone_flusher.done() or _pinecone_flusher.get_loop() is not loop:
+        _pinecone_queue = asyncio.Queue()
+        _pinecone_flusher = loop.create_task(_flush_pinecone_queue(_pinecone_queue))
+    return _pinecone_queue
+
+
+async def _join_pinecone_queue(timeout: float) -> None:
+    """Wait for queued vectors on the running loop to be upserted."""
+    if _pinecone_flusher is None or _pinecone_flusher.done() or _pinecone_flusher.get_loop() is not asyncio.get_running_loop():
+        return
+    try:
+        await asyncio.wait_for(_pinecone_queue.join(), timeout=timeout)
+    except asyncio.TimeoutError:
+        logger.warning(f"Timed out waiting for {_pinecone_queue.qsize()} queued vector upserts")
+
+
+# Fire-and-forget publishes/audit writes still in flight; drained before a task returns
+_background_tasks: Set[asyncio.Task] = set()
+
+
+def _background_done(task: asyncio.Task) -> None:
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"Background side effect failed: {task.exception()}")
+
+
+def _fire_and_forget(func, *args, **kwargs) -> None:
+    """Run a side effect (event publish, audit write) without awaiting it; blocking calls go to a thread."""
+    if asyncio.iscoroutinefunction(func):
+        task = asyncio.create_task(func(*args, **kwargs))
+    else:
+        task = asyncio.create_task(asyncio.to_thread(func, *args, **kwargs))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_done)
+
+
+async def _run_and_drain(coro, timeout: float = 5.0):
+    """Await a task body, then give its background side effects a bounded time to finish."""
+    try:
+        return await coro
+    finally:
+        # The loop only runs while a task does, so flush queued vectors before handing it back
+        await _join_pinecone_queue(timeout)
+        if _background_tasks:
+            await asyncio.wait(list(_background_tasks), timeout=timeout)
+
+
+def _publish_interview_ready(job_key: str, application_id: str, payload: Dict[str, Any]) -> None:
+    """Publish interview_ready, auditing a failed publish."""
+    try:
+        published = notifier.publish_event("interview_ready", job_key, payload)
+    except Exception as e:
+        logger.error(f"Failed to publish interview_ready event for {application_id}: {e}")
+        published = False
+    if not published:
+        audit_service.log_error(
+            operation="publish_interview_ready",
+            entity_id=application_id,
+            error="failed to publish interview_ready"
+        )
+
+
+def _publish_interview_ready_bulk(events: List[Tuple[str, str, Dict[str, Any]]]) -> None:
+    """Publish interview_ready for several applications in one pipeline, auditing failed publishes."""
+    published = notifier.publish_events_bulk([("interview_ready", job_key, payload) for job_key, _, payload in events])
+    for (_, application_id, _), ok in zip(events, published):
+        if not ok:
+            audit_service.log_error(
+                operation="publish_interview_ready",
+                entity_id=application_id,
+                error="failed to publish interview_ready"
+            )
+
+
+def _transcript_window(transcript: Optional[str]) -> Optional[str]:
+    """Keep only the most recent part of a transcript, starting at a line boundary when possible."""
+    if not transcript or len(transcript) <= TRANSCRIPT_WINDOW_CHARS:
+        return transcript
+    window = transcript[-TRANSCRIPT_WINDOW_CHARS:]
+    newline = window.find("\n")
+    if 0 <= newline < 256:
+        window = window[newline + 1:]
+    return window
+
+
+@functools.lru_cache(maxsize=4096)
+def _resolve_object_id(id_str: str) -> Optional[ObjectId]:
+    """Parse an id string as an ObjectId once; None if it is a business id."""
+    return ObjectId(id_str) if ObjectId.is_valid(id_str) else None
+
+
+def _application_filter(application_id) -> Dict[str, Any]:
+    """Single-key filter for an application given its Mongo `_id` or business `application_id`.
+
+    Business ids (APL-xxxxxxxx) are never valid ObjectIds, so the id's shape
+    picks one indexed field instead of making MongoDB plan an `$or` over both.
+    """
+    oid = _resolve_object_id(str(application_id))
+    return {"_id": oid} if oid else {"application_id": application_id}
+
+
+def _job_filter(job_id) -> Dict[str, Any]:
+    """Single-key filter for a job given its Mongo `_id` or business `job_id`."""
+    oid = _resolve_object_id(str(job_id)) if job_id else None
+    return {"_id": oid} if oid else {"job_id": job_id}
+
+
+def _application_id_from_session_id(session_id: str) -> Optional[str]:
+    """Recover the application id from an `interview_<application_id>_<ts>` session id."""
+    if not session_id.startswith("interview_"):
+        return None
+    application_id, sep, ts = session_id[len("interview_"):].rpartition("_")
+    if not sep or not application_id or not ts.isdigit():
+        return None
+    return application_id
+
+
 class InterviewSession:
     """Manages state for a single interview session."""
     
@@ -40,6 +249,7 @@ class InterviewSession:
         self.session_id = session_id
         self.application_id = application_id
         self.questions: List[Dict[str, Any]] = []
+        self.questions_by_id: Dict[str, Dict[str, Any]] = {}
         self.current_question = 0
         self.start_time: Optional[datetime] = None
         self.responses: Dict[str, Any] = {}
@@ -48,21 +258,32 @@ class InterviewSession:
         self.retries = 0
         self.max_retries = 3
         self.time_limit_per_question = 60  # Default 60 seconds
-        self.question_start_time: Optional[datetime] = None
+        self.question_start_time: Optional[datetime] = None  # Wall clock, kept for audit
+        self.question_start_ts: Optional[float] = None  # Epoch seconds, used for timing
         self.timer_warnings = []
         
     def start_question_timer(self):
         """Start timer for current question."""
+        self.question_start_ts = time.time()
         self.question_start_time = datetime.utcnow()
         self.timer_warnings = []
         
+    def _elapsed_seconds(self) -> Optional[float]:
+        """Seconds since the question timer started, or None if it hasn't."""
+        if self.question_start_ts is not None:
+            return time.time() - self.question_start_ts
+        if self.question_start_time:
+            # Sessions stored before question_start_ts existed
+            return (datetime.utcnow() - self.question_start_time).total_seconds()
+        return None
+        
     def check_time_remaining(self) -> Dict[str, Any]:
         """Check remaining time for current question."""
         # Always return the same keys so callers don't KeyError
-        if not self.question_start_time:
+        elapsed = self._elapsed_seconds()
+        if elapsed is None:
             return {"status": "not_started", "remaining": self.time_limit_per_question, "elapsed": 0}
 
-        elapsed = (datetime.utcnow() - self.question_start_time).total_seconds()
         remaining = max(0, self.time_limit_per_question - elapsed)
 
         status = "in_progress"
@@ -83,18 +304,26 @@ class InterviewSession:
         
     def is_answer_timed_out(self) -> bool:
         """Check if current question has timed out."""
-        if not self.question_start_time:
+        elapsed = self._elapsed_seconds()
+        if elapsed is None:
             return False
-            
-        elapsed = (datetime.utcnow() - self.question_start_time).total_seconds()
         return elapsed >= self.time_limit_per_question
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert session to dict for storage."""
+    @functools.cached_property
+    def _frozen_header(self) -> Dict[str, Any]:
+        """Identity fields, fixed for the session's lifetime and built once."""
         return {
             "session_id": self.session_id,
-            "application_id": self.application_id,
+            "application_id": self.application_id
+        }
+
+    def to_dict(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """Convert session to dict for storage; `now` lets callers share one timestamp across writes."""
+        return {
+            **self._frozen_header,
             "questions": self.questions,
+            "questions_by_id": self.questions_by_id,
+            "question_count": len(self.questions),
             "current_question": self.current_question,
             "start_time": self.start_time,
             "responses": self.responses,
@@ -102,11 +331,237 @@ class InterviewSession:
             "status": self.status,
             "retries": self.retries,
             "question_start_time": self.question_start_time,
+            "question_start_ts": self.question_start_ts,
             "time_limit_per_question": self.time_limit_per_question,
             "timer_warnings": self.timer_warnings,
-            "timestamp": datetime.utcnow()
+            "timestamp": now or datetime.utcnow()
         }
 
+async def _generate_hedged(prompt: str):
+    """Race up to GEMINI_MAX_ATTEMPTS overlapping Gemini calls and return the first success."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + GEMINI_TOTAL_DEADLINE
+    tasks = {asyncio.create_task(model.generate_content_async(prompt))}
+    started = 1
+    last_error: Optional[BaseException] = None
+    try:
+        while tasks:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise asyncio.TimeoutError("Gemini question generation exceeded its deadline")
+            done, tasks = await asyncio.wait(
+                tasks,
+                timeout=min(GEMINI_HEDGE_DELAY, remaining),
+                return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                last_error = task.exception()
+                logger.warning(f"Gemini attempt failed: {last_error}")
+            # Hedge on a slow attempt, or replace a failed one straight away
+            if started < GEMINI_MAX_ATTEMPTS:
+                tasks.add(asyncio.create_task(model.generate_content_async(prompt)))
+                started += 1
+        raise last_error or RuntimeError("Gemini question generation failed")
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def _request_questions(prompt: str, application_id: str) -> List[Any]:
+    """Call Gemini with the question-generator prompt and parse the JSON array it returns."""
+    response = await _generate_hedged(prompt)
+
+    # Try to extract text/content from various response shapes
+    raw_text = None
+    try:
+        if hasattr(response, 'text') and getattr(response, 'text'):
+            raw_text = getattr(response, 'text')
+        elif hasattr(response, 'content') and getattr(response, 'content'):
+            raw_text = getattr(response, 'content')
+        elif hasattr(response, 'candidates') and getattr(response, 'candidates'):
+            cand = response.candidates[0]
+            if isinstance(cand, dict):
+                raw_text = cand.get('content') or cand.get('text') or str(cand)
+            else:
+                raw_text = str(cand)
+        else:
+            # Fallback to string representation
+            raw_text = str(response)
+    except Exception as extract_err:
+        raw_text = str(response)
+        logger.debug(f"Failed to introspect Gemini response: {extract_err}")
+
+    # If raw_text is empty, treat as failure
+    if not raw_text or not raw_text.strip():
+        logger.error("Gemini returned empty response when generating questions")
+        _fire_and_forget(audit_service.log_error, operation="generate_interview_empty_response", entity_id=application_id, error=str(response))
+        raise ValueError("Empty response from Gemini")
+
+    # Locate the JSON array first: Gemini usually wraps it in ```json fences,
+    # so parsing the raw text directly would mostly fail and raise
+    start = raw_text.find('[')
+    end = raw_text.rfind(']')
+    if start == -1 or end <= start:
+        logger.error("No JSON array found in Gemini response")
+        _fire_and_forget(audit_service.log_error, operation="generate_interview_no_json", entity_id=application_id, error=raw_text[:500])
+        raise ValueError("No JSON array found in Gemini response")
+
+    snippet = raw_text if (start == 0 and end == len(raw_text) - 1) else raw_text[start:end+1]
+    try:
+        questions = msgspec.json.decode(snippet)
+    except msgspec.DecodeError as e_parse:
+        logger.error(f"JSON parsing failed for extracted snippet: {e_parse}")
+        _fire_and_forget(audit_service.log_error, operation="generate_interview_json_parse_error", entity_id=application_id, error=f"parse_error:{e_parse}; raw:{raw_text[:200]}")
+        raise
+
+    if not questions or not isinstance(questions, list):
+        raise ValueError("Invalid question format: expected a JSON array of questions")
+
+    return questions
+
+
+# Flipped off the first time the server rejects a transaction (standalone mongod)
+_transactions_supported = True
+
+
+async def _insert_session_and_update_application(db, session_doc, app_filter, app_update):
+    """
+    Insert a new interview session and update its application together.
+    
+    Runs both writes in one transaction so a crash can't leave a session
+    without its application link. On deployments without transactions
+    (standalone mongod) the two writes are issued concurrently instead.
+    
+    Returns:
+        The application UpdateResult, or the exception the update raised
+        on the non-transactional path. A failed session insert is raised.
+    """
+    global _transactions_supported
+    if _transactions_supported:
+        try:
+            async with await db.client.start_session() as mongo_session:
+                async with mongo_session.start_transaction():
+                    await db.interview_sessions.insert_one(session_doc, session=mongo_session)
+                    return await db.applications.update_one(app_filter, app_update, session=mongo_session)
+        except OperationFailure as e:
+            # IllegalOperation: transactions need a replica set or mongos
+            if e.code != 20:
+                raise
+            logger.info("MongoDB transactions unavailable; persisting interview sessions without them")
+            _transactions_supported = False
+
+    inserted, updated = await asyncio.gather(
+        db.interview_sessions.insert_one(session_doc),
+        db.applications.update_one(app_filter, app_update),
+        return_exceptions=True
+    )
+    if isinstance(inserted, Exception):
+        raise inserted
+    return updated
+
+
+async def _persist_session_questions(
+    db,
+    application_id: str,
+    job: Dict[str, Any],
+    questions: List[Any],
+    role_type: str,
+    time_per_question: int,
+    ready_events: Optional[List[Tuple[str, str, Dict[str, Any]]]] = None
+) -> Dict[str, Any]:
+    """Create the interview session for generated questions, persist them and notify listeners.
+
+    When ready_events is given the interview_ready event is appended to it for the
+    caller to publish, instead of being published here.
+    """
+    # Create interview session
+    session_id = f"interview_{application_id}_{int(time.time())}"
+    session = InterviewSession(session_id, application_id)
+
+    # Store questions
+    processed = []
+    now_ts = datetime.utcnow()
+    expires_at = now_ts + timedelta(seconds=time_per_question)
+    for idx, q in enumerate(questions):
+        # Extract text from either 'text' or 'question' field (Gemini returns 'question')
+        if isinstance(q, dict):
+            text = q.get("text") or q.get("question") or str(q)
+        else:
+            text = q if isinstance(q, str) else str(q)
+        # Extract question ID from various possible field names
+        qid = (q.get("qid") if isinstance(q, dict) else None) or \
+              (q.get("id") if isinstance(q, dict) else None) or \
+              (q.get("question_id") if isinstance(q, dict) else None) or \
+              f"Q{idx+1}"
+        processed.append({
+            "qid": qid,
+            "text": text,
+            "expires_at": expires_at,
+            "role_type": role_type
+        })
+
+    session.questions = processed
+    session.questions_by_id = {q["qid"]: q for q in processed}
+    session.status = "questions_generated"
+
+    # Match on whichever id field the application id refers to
+    update_filter = _application_filter(application_id)
+    update_data = {
+        "gemini_questions": [
+            {"qid": q["qid"], "text": q["text"], "expires_at": q["expires_at"]} for q in session.questions
+        ],
+        "stage": "interview",
+        "updated_at": now_ts
+    }
+    logger.info(f"Persisting questions for {application_id}: update_filter={update_filter}, num_questions={len(session.questions)}")
+    logger.debug(f"Question texts: {[q.get('text', '')[:50] for q in session.questions]}")
+
+    # Save session and persist questions into the application document so frontend can read them
+    result = await _insert_session_and_update_application(
+        db, session.to_dict(now=now_ts), update_filter, {"$set": update_data}
+    )
+
+    try:
+        if isinstance(result, Exception):
+            raise result
+        logger.info(f"MongoDB update result: matched_count={result.matched_count}, modified_count={result.modified_count}, application_id={application_id}")
+        if result.matched_count == 0:
+            logger.error(f"No application matched for update! application_id={application_id}, update_filter={update_filter}")
+        if result.modified_count == 0:
+            logger.warning(f"Application matched but not modified (data unchanged?): {application_id}")
+        cache.delete_document("app", application_id)
+    except Exception as e:
+        logger.error(f"Failed to persist generated questions to application {application_id}: {e}")
+        _fire_and_forget(
+            audit_service.log_error,
+            operation="persist_generated_questions",
+            entity_id=application_id,
+            error=str(e)
+        )
+
+    # Notify application update in the background; the caller doesn't need the publish result
+    ready_event = (job.get("job_id") or str(job.get("_id")), application_id, {
+        "application_id": application_id,
+        "session_id": session_id,
+        "questions": [
+            {"qid": q["qid"], "text": q["text"], "expires_at": q["expires_at"].isoformat()} for q in session.questions
+        ]
+    })
+    if ready_events is not None:
+        ready_events.append(ready_event)
+    else:
+        _fire_and_forget(_publish_interview_ready, *ready_event)
+
+    return {
+        "session_id": session_id,
+        "questions": questions,
+        "application_id": application_id,
+        "status": "ready"
+    }
+
+
 async def generate_interview_questions_async(
     application_id: str,
     job_id: str,
@@ -128,201 +583,53 @@ async def generate_interview_questions_async(
     try:
         # Get application and job details
         # Use explicit database name to avoid Motor's get_default_database
-        async with AsyncMongoClient() as client:
-            db = client[settings.mongo_db_name]
-
-            # Resolve application by either `application_id` (business id) or `_id` (Mongo ObjectId)
-            try:
-                from bson import ObjectId
-                or_clause = [{"application_id": application_id}]
-                if ObjectId.is_valid(application_id):
-                    or_clause.append({"_id": ObjectId(application_id)})
-            except Exception:
-                or_clause = [{"application_id": application_id}]
-
-            application = await db.applications.find_one({"$or": or_clause})
+        db = get_db()
 
-            # Resolve job similarly: job may be stored as `job_id` or `_id`
-            try:
-                from bson import ObjectId as _OID
-                job_or = [{"job_id": job_id}]
-                if _OID.is_valid(job_id):
-                    job_or.append({"_id": _OID(job_id)})
-            except Exception:
-                job_or = [{"job_id": job_id}]
-
-            job = await db.jobs.find_one({"$or": job_or})
-            
-            if not application or not job:
-                raise ValueError("Application or job not found")
-                
-            # Create interview session
-            session_id = f"interview_{application_id}_{int(time.time())}"
-            session = InterviewSession(session_id, application_id)
+        # Resolve application and job by either business id or `_id` (Mongo ObjectId).
+        # The two lookups are independent; overlap their round-trips
+        application, job = await asyncio.gather(
+            db.applications.find_one(_application_filter(application_id)),
+            db.jobs.find_one(_job_filter(job_id))
+        )
+        
+        if not application or not job:
+            raise ValueError("Application or job not found")
             
-            # Generate questions
+        # Reuse questions already generated for this job/resume/role combination
+        resume_text = application.get("resume_text", "")
+        question_cache_key = cache.generate_interview_questions_key(job_id, role_type, time_per_question, resume_text)
+        cached_questions = cache.get_interview_questions(question_cache_key)
+
+        # Generate questions
+        prompt = None
+        if cached_questions is None:
             prompt = PromptTemplates.get_interview_question_generator_prompt(
                 job_description=job.get("description", ""),
-                candidate_resume=application.get("resume_text", ""),
+                candidate_resume=resume_text,
                 role_type=role_type,
                 time_per_question=time_per_question
             )
-            
-            # Get questions with retries
-            for attempt in range(3):
-                try:
-                    response = model.generate_content(prompt)
-
-                    # Try to extract text/content from various response shapes
-                    raw_text = None
-                    try:
-                        if hasattr(response, 'text') and getattr(response, 'text'):
-                            raw_text = getattr(response, 'text')
-                        elif hasattr(response, 'content') and getattr(response, 'content'):
-                            raw_text = getattr(response, 'content')
-                        elif hasattr(response, 'candidates') and getattr(response, 'candidates'):
-                            cand = response.candidates[0]
-                            if isinstance(cand, dict):
-                                raw_text = cand.get('content') or cand.get('text') or str(cand)
-                            else:
-                                raw_text = str(cand)
-                        else:
-                            # Fallback to string representation
-                            raw_text = str(response)
-                    except Exception as extract_err:
-                        raw_text = str(response)
-                        logger.debug(f"Failed to introspect Gemini response: {extract_err}")
-
-                    # If raw_text is empty, treat as failure
-                    if not raw_text or not raw_text.strip():
-                        logger.error("Gemini returned empty response when generating questions")
-                        audit_service.log_error(operation="generate_interview_empty_response", entity_id=application_id, error=str(response))
-                        raise ValueError("Empty response from Gemini")
-
-                    # Attempt to find JSON array in raw_text
-                    questions = None
-                    try:
-                        # Prefer direct parse
-                        questions = json.loads(raw_text)
-                    except Exception:
-                        # Try to extract the first JSON array block present in the string
-                        start = raw_text.find('[')
-                        end = raw_text.rfind(']')
-                        if start != -1 and end != -1 and end > start:
-                            snippet = raw_text[start:end+1]
-                            try:
-                                questions = json.loads(snippet)
-                            except Exception as e_parse:
-                                logger.error(f"JSON parsing failed for extracted snippet: {e_parse}")
-                                audit_service.log_error(operation="generate_interview_json_parse_error", entity_id=application_id, error=f"parse_error:{e_parse}; raw:{raw_text[:200]}")
-                                raise
-                        else:
-                            logger.error("No JSON array found in Gemini response")
-                            audit_service.log_error(operation="generate_interview_no_json", entity_id=application_id, error=raw_text[:500])
-                            raise ValueError("No JSON array found in Gemini response")
-
-                    if not questions or not isinstance(questions, list):
-                        raise ValueError("Invalid question format: expected a JSON array of questions")
-
-                    # Store questions
-                    processed = []
-                    now_ts = datetime.utcnow()
-                    for idx, q in enumerate(questions):
-                        # Extract text from either 'text' or 'question' field (Gemini returns 'question')
-                        if isinstance(q, dict):
-                            text = q.get("text") or q.get("question") or str(q)
-                        else:
-                            text = q if isinstance(q, str) else str(q)
-                        # Extract question ID from various possible field names
-                        qid = (q.get("qid") if isinstance(q, dict) else None) or \
-                              (q.get("id") if isinstance(q, dict) else None) or \
-                              (q.get("question_id") if isinstance(q, dict) else None) or \
-                              f"Q{idx+1}"
-                        expires_at = now_ts + timedelta(seconds=time_per_question)
-                        processed.append({
-                            "qid": qid,
-                            "text": text,
-                            "expires_at": expires_at,
-                            "role_type": role_type
-                        })
-
-                    session.questions = processed
-                    session.status = "questions_generated"
-
-                    # Save session
-                    await db.interview_sessions.insert_one(session.to_dict())
-
-                    # Persist questions into the application document so frontend can read them
-                    try:
-                        # Reuse the application lookup OR clause to match either business id or ObjectId
-                        try:
-                            from bson import ObjectId
-                            update_or = [{"application_id": application_id}]
-                            if ObjectId.is_valid(application_id):
-                                update_or.append({"_id": ObjectId(application_id)})
-                        except Exception:
-                            update_or = [{"application_id": application_id}]
-
-                        # Log the query and data being persisted for debugging
-                        update_data = {
-                            "gemini_questions": [
-                                {"qid": q["qid"], "text": q["text"], "expires_at": q["expires_at"]} for q in session.questions
-                            ],
-                            "stage": "interview",
-                            "updated_at": datetime.utcnow()
-                        }
-                        logger.info(f"Persisting questions for {application_id}: update_or={update_or}, num_questions={len(session.questions)}")
-                        logger.debug(f"Question texts: {[q.get('text', '')[:50] for q in session.questions]}")
-
-                        result = await db.applications.update_one(
-                            {"$or": update_or},
-                            {"$set": update_data},
-                            upsert=False
-                        )
-                        logger.info(f"MongoDB update result: matched_count={result.matched_count}, modified_count={result.modified_count}, application_id={application_id}")
-                        if result.matched_count == 0:
-                            logger.error(f"No application matched for update! application_id={application_id}, update_or={update_or}")
-                        if result.modified_count == 0:
-                            logger.warning(f"Application matched but not modified (data unchanged?): {application_id}")
-                    except Exception as e:
-                        logger.error(f"Failed to persist generated questions to application {application_id}: {e}")
-                        audit_service.log_error(
-                            operation="persist_generated_questions",
-                            entity_id=application_id,
-                            error=str(e)
-                        )
-
-                    # Notify application update
-                    try:
-                        notifier.publish_event("interview_ready", job.get("job_id") or str(job.get("_id")), {
-                            "application_id": application_id,
-                            "session_id": session_id,
-                            "questions": [
-                                {"qid": q["qid"], "text": q["text"], "expires_at": q["expires_at"].isoformat()} for q in session.questions
-                            ]
-                        })
-                    except Exception as e:
-                        logger.error(f"Failed to publish interview_ready event for {application_id}: {e}")
-                        audit_service.log_error(
-                            operation="publish_interview_ready",
-                            entity_id=application_id,
-                            error="failed to publish interview_ready"
-                        )
-
-                    return {
-                        "session_id": session_id,
-                        "questions": questions,
-                        "application_id": application_id,
-                        "status": "ready"
-                    }
+        
+        # Get questions with retries
+        for attempt in range(3):
+            try:
+                if cached_questions is not None:
+                    questions = cached_questions
+                else:
+                    questions = await _request_questions(prompt, application_id)
+                    cache.set_interview_questions(question_cache_key, questions)
+
+                return await _persist_session_questions(
+                    db, application_id, job, questions, role_type, time_per_question
+                )
 
-                except Exception as e:
-                    logger.warning(f"Attempt {attempt+1} to generate questions failed: {e}")
-                    if attempt == 2:  # Last attempt
-                        logger.error(f"All attempts failed for application {application_id}")
-                        raise
-                    await asyncio.sleep(2 ** attempt)  # Exponential backoff
-                    
+            except Exception as e:
+                logger.warning(f"Attempt {attempt+1} to generate questions failed: {e}")
+                if attempt == 2:  # Last attempt
+                    logger.error(f"All attempts failed for application {application_id}")
+                    raise
+                await asyncio.sleep(2 ** attempt)  # Exponential backoff
+                
     except Exception as e:
         audit_service.log_error(
             operation="generate_interview_questions",
@@ -337,7 +644,7 @@ async def generate_interview_questions_async(
 def generate_interview_questions(self, application_id: str, job_id: str, role_type: str = "technical", time_per_question: int = 60) -> Dict[str, Any]:
     """Synchronous Celery task wrapper for generating interview questions."""
     try:
-        return asyncio.run(generate_interview_questions_async(application_id, job_id, role_type, time_per_question))
+        return run_async(_run_and_drain(generate_interview_questions_async(application_id, job_id, role_type, time_per_question)))
     except Exception as e:
         audit_service.log_error(
             operation="generate_interview_questions",
@@ -346,6 +653,303 @@ def generate_interview_questions(self, application_id: str, job_id: str, role_ty
         )
         raise self.retry(exc=e, countdown=5)
 
+
+def request_interview_questions(
+    application_id: str,
+    job_id: str,
+    role_type: str = "technical",
+    time_per_question: int = 60
+) -> str:
+    """
+    Queue question generation for an application so it can be batched with other candidates of the same job.
+    
+    The first request queued in a batch window schedules
+    dispatch_interview_question_batches to run INTERVIEW_QUESTION_BATCH_WINDOW
+    seconds later; requests arriving before it runs ride along. Falls back to
+    dispatching generate_interview_questions directly if the request cannot be queued.
+    
+    Returns:
+        Request id to track the generation by (the Celery task id on the fallback path)
+    """
+    request_id = uuid.uuid4().hex
+    group = f"{job_id}|{role_type}|{int(time_per_question)}"
+    if cache.enqueue_interview_question_request(group, {"application_id": application_id, "request_id": request_id}):
+        if cache.claim_interview_question_dispatch():
+            dispatch_interview_question_batches.apply_async(countdown=INTERVIEW_QUESTION_BATCH_WINDOW)
+        return request_id
+    task = generate_interview_questions.delay(application_id, job_id, role_type, time_per_question)
+    return task.id
+
+
+async def generate_interview_questions_batch_async(
+    job_id: str,
+    application_ids: List[str],
+    role_type: str = "technical",
+    time_per_question: int = 60
+) -> Dict[str, Any]:
+    """
+    Generate interview questions for several applications to one job with a single Gemini call.
+    
+    Args:
+        job_id: ID of the job all applications belong to
+        application_ids: IDs of the applications
+        role_type: Type of role (technical, non-technical, leadership)
+        time_per_question: Time in seconds per question
+        
+    Returns:
+        Dict with per-application results and the ids handed back to the single-candidate task
+    """
+    db = get_db()
+
+    # Group the ids by the field they refer to so each lookup is one $in on one index
+    by_field: Dict[str, List[Any]] = {}
+    for application_id in application_ids:
+        (field, value), = _application_filter(application_id).items()
+        by_field.setdefault(field, []).append(value)
+    app_queries = [db.applications.find({field: {"$in": values}}).to_list(None) for field, values in by_field.items()]
+
+    job, *app_results = await asyncio.gather(db.jobs.find_one(_job_filter(job_id)), *app_queries)
+    app_docs = [doc for docs in app_results for doc in docs]
+    if not job:
+        raise ValueError("Job not found")
+
+    by_id = {}
+    for doc in app_docs:
+        by_id[str(doc.get("_id"))] = doc
+        if doc.get("application_id"):
+            by_id[str(doc["application_id"])] = doc
+
+    questions_by_app: Dict[str, List[Any]] = {}
+    pending = []
+    for application_id in application_ids:
+        application = by_id.get(str(application_id))
+        if not application:
+            logger.error(f"Application {application_id} not found for batched question generation")
+            continue
+        resume_text = application.get("resume_text", "")
+        key = cache.generate_interview_questions_key(job_id, role_type, time_per_question, resume_text)
+        cached_questions = cache.get_interview_questions(key)
+        if cached_questions is not None:
+            questions_by_app[application_id] = cached_questions
+        else:
+            pending.append((application_id, resume_text, key))
+
+    fallback = []
+    if pending:
+        prompt = PromptTemplates.get_batch_interview_question_generator_prompt(
+            job_description=job.get("description", ""),
+            candidate_resumes=[resume_text for _, resume_text, _ in pending],
+            role_type=role_type,
+            time_per_question=time_per_question
+        )
+        try:
+            per_candidate = await _request_questions(prompt, job_id)
+        except Exception as e:
+            logger.error(f"Batched question generation failed for job {job_id}: {str(e)}")
+            per_candidate = []
+
+        if len(per_candidate) != len(pending):
+            logger.warning(f"Batched generation for job {job_id} returned {len(per_candidate)} lists for {len(pending)} candidates")
+        for idx, (application_id, _, key) in enumerate(pending):
+            questions = per_candidate[idx] if idx < len(per_candidate) else None
+            if not questions or not isinstance(questions, list):
+                fallback.append(application_id)
+                continue
+            cache.set_interview_questions(key, questions)
+            questions_by_app[application_id] = questions
+
+    app_ids = list(questions_by_app)
+    ready_events: List[Tuple[str, str, Dict[str, Any]]] = []
+    persisted = await asyncio.gather(*[
+        _persist_session_questions(db, application_id, job, questions_by_app[application_id], role_type, time_per_question, ready_events)
+        for application_id in app_ids
+    ], return_exceptions=True)
+    # One pipelined publish for the whole batch
+    if ready_events:
+        _fire_and_forget(_publish_interview_ready_bulk, ready_events)
+
+    results = {}
+    for application_id, result in zip(app_ids, persisted):
+        if isinstance(result, Exception):
+            logger.error(f"Failed to persist batched questions for {application_id}: {str(result)}")
+            fallback.append(application_id)
+        else:
+            results[application_id] = result
+
+    # Anything the batch could not serve goes through the single-candidate task and its retries
+    for application_id in fallback:
+        generate_interview_questions.delay(application_id, job_id, role_type, time_per_question)
+
+    return {"job_id": job_id, "results": results, "fallback": fallback}
+
+
+@celery.task(bind=True, max_retries=3)
+def generate_interview_questions_batch(
+    self,
+    job_id: str,
+    application_ids: List[str],
+    role_type: str = "technical",
+    time_per_question: int = 60
+) -> Dict[str, Any]:
+    """Synchronous Celery task wrapper for batched interview question generation."""
+    try:
+        return run_async(_run_and_drain(generate_interview_questions_batch_async(job_id, application_ids, role_type, time_per_question)))
+    except Exception as e:
+        audit_service.log_error(
+            operation="generate_interview_questions_batch",
+            entity_id=job_id,
+            error=str(e)
+        )
+        raise self.retry(exc=e, countdown=5)
+
+
+@celery.task
+def dispatch_interview_question_batches() -> int:
+    """Drain queued question requests into one batch task per job group.
+
+    Scheduled by request_interview_questions; celery beat also runs it as a backstop.
+    """
+    # Release before draining: anything queued from here on schedules a fresh run,
+    # and anything queued before it is picked up below
+    cache.release_interview_question_dispatch()
+    dispatched = 0
+    for group in cache.get_pending_interview_question_groups():
+        job_id, role_type, time_per_question = group.rsplit("|", 2)
+        while True:
+            requests = cache.pop_interview_question_requests(group, INTERVIEW_QUESTION_BATCH_SIZE)
+            if not requests:
+                break
+            application_ids = [r["application_id"] for r in requests]
+            if len(application_ids) == 1:
+                generate_interview_questions.delay(application_ids[0], job_id, role_type, int(time_per_question))
+            else:
+                generate_interview_questions_batch.delay(job_id, application_ids, role_type, int(time_per_question))
+            dispatched += 1
+            if len(requests) < INTERVIEW_QUESTION_BATCH_SIZE:
+                break
+    return dispatched
+
+# Session fields evaluate_interview_response_async needs; responses and scores
+# grow with every answer and are written with targeted $set/$inc instead
+_EVALUATION_SESSION_PROJECTION = {
+    "session_id": 1,
+    "application_id": 1,
+    "question_count": 1,
+    "question_start_time": 1,
+    "question_start_ts": 1,
+    "time_limit_per_question": 1,
+    "max_retries": 1,
+    "_id": 0
+}
+
+
+def _evaluation_session_projection(question_id: str) -> Dict[str, Any]:
+    """Evaluation projection plus just the answered question out of questions_by_id."""
+    projection = dict(_EVALUATION_SESSION_PROJECTION)
+    if "." not in question_id and not question_id.startswith("$"):
+        projection[f"questions_by_id.{question_id}"] = 1
+    return projection
+
+
+def _find_question(questions: List[Dict[str, Any]], question_id: str) -> Optional[Dict[str, Any]]:
+    """Linear lookup supporting multiple field names (qid, id, question_id) for older sessions."""
+    for q in questions:
+        if q.get("qid") == question_id or q.get("id") == question_id or q.get("question_id") == question_id:
+            return q
+    return None
+
+
+# Application and job fields response evaluation reads; cached per id for the
+# length of an interview since none of them change while it runs
+_EVALUATION_APPLICATION_PROJECTION = {"application_id": 1, "job_id": 1, "job": 1, "job_description": 1}
+_EVALUATION_JOB_PROJECTION = {"job_id": 1, "description": 1}
+
+
+async def _get_application(db, application_id) -> Optional[Dict[str, Any]]:
+    """Fetch the evaluation fields of an application, through the Redis document cache."""
+    cached = cache.get_document("app", str(application_id))
+    if cached is not None:
+        return cached
+    application = await db.applications.find_one(
+        _application_filter(application_id), _EVALUATION_APPLICATION_PROJECTION
+    )
+    if application is not None:
+        cache.set_document("app", str(application_id), application, ttl=600)
+    return application
+
+
+async def _get_job(db, job_id) -> Optional[Dict[str, Any]]:
+    """Fetch the evaluation fields of a job, through the Redis document cache."""
+    cached = cache.get_document("job", str(job_id))
+    if cached is not None:
+        return cached
+    job = await db.jobs.find_one(_job_filter(job_id), _EVALUATION_JOB_PROJECTION)
+    if job is not None:
+        cache.set_document("job", str(job_id), job, ttl=600)
+    return job
+
+
+def _type_key(question_type: Optional[str]) -> str:
+    """Question type as a statistics.by_type field name (no dots or leading $)."""
+    return (question_type or "unknown").replace(".", "_").lstrip("$") or "unknown"
+
+
+async def _session_score_totals(db, session_id: str) -> Dict[str, Any]:
+    """Rebuild a session's running score sums (overall and per question type) with an aggregation."""
+    pipeline = [
+        {"$match": {"session_id": session_id}},
+        {"$project": {"scores": {"$objectToArray": "$scores"}}},
+        {"$unwind": "$scores"},
+        {"$facet": {
+            "totals": [
+                {"$group": {
+                    "_id": None,
+                    "questions_answered": {"$sum": 1},
+                    "total_time": {"$sum": "$scores.v.timing.elapsed"},
+                    "sum_technical": {"$sum": "$scores.v.criteria_scores.technical_accuracy.score"},
+                    "sum_communication": {"$sum": "$scores.v.criteria_scores.communication.score"},
+                    "sum_problem_solving": {"$sum": "$scores.v.criteria_scores.problem_solving.score"}
+                }},
+                {"$project": {"_id": 0}}
+            ],
+            "by_type": [
+                {"$group": {
+                    "_id": {"$ifNull": ["$scores.v.question_type", "unknown"]},
+                    "sum": {"$sum": "$scores.v.final_score"},
+                    "count": {"$sum": 1}
+                }}
+            ]
+        }}
+    ]
+    results = await db.interview_sessions.aggregate(pipeline).to_list(1)
+    if not results or not results[0]["totals"]:
+        return {}
+    totals = results[0]["totals"][0]
+    totals["by_type"] = {
+        _type_key(row["_id"]): {"sum": row["sum"], "count": row["count"]}
+        for row in results[0]["by_type"]
+    }
+    return totals
+
+
+def _statistics_averages(statistics: Dict[str, Any]) -> Tuple[float, float, float]:
+    """Per-criterion averages from a session's running sums (older sessions stored the averages)."""
+    answered = statistics.get("questions_answered", 0)
+    if "sum_technical" not in statistics:
+        return (
+            statistics.get("avg_technical_score", 0),
+            statistics.get("avg_communication_score", 0),
+            statistics.get("avg_problem_solving_score", 0)
+        )
+    if not answered:
+        return 0, 0, 0
+    return (
+        round(statistics.get("sum_technical", 0) / answered, 2),
+        round(statistics.get("sum_communication", 0) / answered, 2),
+        round(statistics.get("sum_problem_solving", 0) / answered, 2)
+    )
+
+
 async def evaluate_interview_response_async(
     session_id: str,
     question_id: str,
@@ -367,351 +971,281 @@ async def evaluate_interview_response_async(
         Dict with score and feedback
     """
     try:
-        async with AsyncMongoClient() as client:
-            db = client[settings.mongo_db_name]
-            
-            # Get session
-            session_data = await db.interview_sessions.find_one({"session_id": session_id})
-            if not session_data:
-                raise ValueError("Interview session not found")
-                
-            session = InterviewSession(
-                session_id=session_data["session_id"],
-                application_id=session_data["application_id"]
+        db = get_db()
+        
+        # Get session, prefetching the application alongside it when the
+        # application id can be read from the session id
+        prefetched_app_id = _application_id_from_session_id(session_id)
+        session_projection = _evaluation_session_projection(question_id)
+        if prefetched_app_id:
+            session_data, prefetched_application = await asyncio.gather(
+                db.interview_sessions.find_one({"session_id": session_id}, session_projection),
+                _get_application(db, prefetched_app_id)
             )
-            session.__dict__.update(session_data)
+        else:
+            session_data = await db.interview_sessions.find_one({"session_id": session_id}, session_projection)
+            prefetched_application = None
+        if not session_data:
+            raise ValueError("Interview session not found")
             
-            # Find the question - defensive lookup supporting multiple field names (qid, id, question_id)
-            question = None
-            for q in session.questions:
-                if q.get("qid") == question_id or q.get("id") == question_id or q.get("question_id") == question_id:
-                    question = q
-                    break
-            
-            if not question:
-                logger.error(f"Question not found for question_id={question_id}. Available questions: {[q.get('qid') or q.get('id') or q.get('question_id') for q in session.questions]}")
-                raise ValueError(f"Question not found for question_id={question_id}")
-
-            # Check for timeout
-            if session.is_answer_timed_out():
-                # Timed-out responses get zero score; use structured feedback dict
-                score = 0
-                feedback = {
-                    "score": 0,
-                    "time_penalty": 0,
-                    "criteria_scores": {
-                        "technical_accuracy": {"score": 0, "weight": 0},
-                        "communication": {"score": 0, "weight": 0},
-                        "problem_solving": {"score": 0, "weight": 0}
-                    },
-                    "timing": {
-                        "elapsed": session.time_limit_per_question,
-                        "limit": session.time_limit_per_question,
-                        "overtime": 0
-                    },
-                    "message": f"Response submitted after time limit. Maximum time allowed was {session.time_limit_per_question} seconds."
-                }
-                attempt = 1
-            else:
-                # Extract question text defensively from various possible field names
-                question_text = question.get("text") or question.get("question") or question.get("content") or ""
-                logger.debug(f"Question text extracted: {question_text[:100] if question_text else '(empty)'}")
-                
-                # Ensure question has default scoring criteria if missing
-                if "scoring_criteria" not in question:
-                    question["scoring_criteria"] = {
-                        "technical_accuracy": {"weight": 60, "rubric": "Accuracy and depth of technical knowledge"},
-                        "communication": {"weight": 40, "rubric": "Clarity, structure, and articulation"},
-                        "problem_solving": {"weight": 0, "rubric": "Problem-solving approach"},
-                        "time_management": {"grace_period": 5, "penalty_per_second": 0.5}
-                    }
-                    logger.debug(f"Assigned default scoring_criteria to question {question_id}")
-                
-                if "expected_answer_points" not in question:
-                    question["expected_answer_points"] = 10
-                    logger.debug(f"Assigned default expected_answer_points=10 to question {question_id}")
-                
-                # Get application and job (support application_id or _id)
-                try:
-                    from bson import ObjectId
-                    app_or = [{"application_id": session.application_id}]
-                    if ObjectId.is_valid(str(session.application_id)):
-                        app_or.append({"_id": ObjectId(session.application_id)})
-                except Exception:
-                    app_or = [{"application_id": session.application_id}]
-
-                logger.debug(f"Querying application with $or={app_or}")
-                application = await db.applications.find_one({"$or": app_or})
-                logger.debug(f"Application query result: {'found' if application else 'not found'}")
-
-                # Resolve job robustly
-                job_id_val = None
-                if application:
-                    job_id_val = application.get("job_id") or application.get("job", {}).get("job_id") or application.get("job", {}).get("_id")
-
-                try:
-                    from bson import ObjectId as _OID
-                    job_or = [{"job_id": job_id_val}]
-                    if job_id_val and _OID.is_valid(str(job_id_val)):
-                        job_or.append({"_id": _OID(job_id_val)})
-                except Exception:
-                    job_or = [{"job_id": job_id_val}]
-
-                job = await db.jobs.find_one({"$or": job_or})
-                
-                # Calculate time-based penalty
-                time_data = session.check_time_remaining()
-                elapsed_time = time_data.get("elapsed", 0)
-                time_penalty = 0
-                
-                if elapsed_time > session.time_limit_per_question:
-                    grace_period = question["scoring_criteria"].get("time_management", {}).get("grace_period", 5)
-                    penalty_per_second = question["scoring_criteria"].get("time_management", {}).get("penalty_per_second", 0.5)
-                    overtime = elapsed_time - session.time_limit_per_question
-                    if overtime > grace_period:
-                        time_penalty = min(30, (overtime - grace_period) * penalty_per_second)
-
-                # Score response with retries. Use the service's `score_response` (blocking)
-                for attempt in range(session.max_retries):
-                    try:
-                        q_text = question.get("text") or question.get("question") or question.get("content") or ""
-
-                        # scorer_service.score_response returns (score_0_10, feedback_text)
-                        tech_raw, tech_feedback = await asyncio.to_thread(
-                            scorer_service.score_response,
-                            q_text,
-                            response_text,
-                            application.get("job_description", "") if application else "",
-                            transcript
-                        )
-
-                        comm_raw, comm_feedback = await asyncio.to_thread(
-                            scorer_service.score_response,
-                            q_text,
-                            response_text,
-                            application.get("job_description", "") if application else "",
-                            transcript
-                        )
-
-                        ps_raw, ps_feedback = await asyncio.to_thread(
-                            scorer_service.score_response,
-                            q_text,
-                            response_text,
-                            application.get("job_description", "") if application else "",
-                            transcript
-                        )
-
-                        # Normalize 0-10 scale to 0-100
-                        technical_score = float(tech_raw) * 10
-                        communication_score = float(comm_raw) * 10
-                        problem_solving_score = float(ps_raw) * 10
-
-                        weights = question.get("scoring_criteria", {})
-                        t_w = weights.get("technical_accuracy", {}).get("weight", 60)
-                        c_w = weights.get("communication", {}).get("weight", 40)
-                        p_w = weights.get("problem_solving", {}).get("weight", 0)
-
-                        weighted_score = (
-                            (technical_score * t_w / 100) +
-                            (communication_score * c_w / 100) +
-                            (problem_solving_score * p_w / 100)
-                        )
-
-                        final_score = max(0, weighted_score - time_penalty)
-
-                        feedback = {
-                            "score": round(final_score, 2),
-                            "time_penalty": round(time_penalty, 2),
-                            "criteria_scores": {
-                                "technical_accuracy": {"score": round(technical_score, 2), "weight": t_w},
-                                "communication": {"score": round(communication_score, 2), "weight": c_w},
-                                "problem_solving": {"score": round(problem_solving_score, 2), "weight": p_w}
-                            },
-                            "timing": {
-                                "elapsed": elapsed_time,
-                                "limit": session.time_limit_per_question,
-                                "overtime": max(0, elapsed_time - session.time_limit_per_question)
-                            },
-                            "tech_feedback": tech_feedback,
-                            "comm_feedback": comm_feedback,
-                            "ps_feedback": ps_feedback
-                        }
-
-                        break
-                    except Exception as e:
-                        logger.exception(f"Scoring attempt {attempt+1} failed: {e}")
-                        if attempt == session.max_retries - 1:
-                            raise
-                        await asyncio.sleep(2 ** attempt)
-            
-            # Store response and detailed score
-            session.responses[question_id] = {
-                "text": response_text,
-                "audio_url": audio_url,
-                "transcript": transcript,
+        session = InterviewSession(
+            session_id=session_data["session_id"],
+            application_id=session_data["application_id"]
+        )
+        session.__dict__.update(session_data)
+        
+        # Find the question: O(1) from the normalized questions_by_id map
+        question = session.questions_by_id.get(question_id)
+        total_questions = session_data.get("question_count")
+        if question is None or total_questions is None:
+            # Sessions stored before questions_by_id, or ids that can't be projected
+            legacy = await db.interview_sessions.find_one({"session_id": session_id}, {"questions": 1, "_id": 0})
+            session.questions = (legacy or {}).get("questions", [])
+            question = _find_question(session.questions, question_id)
+            total_questions = len(session.questions)
+        
+        if not question:
+            logger.error(f"Question not found for question_id={question_id}. Available questions: {[q.get('qid') or q.get('id') or q.get('question_id') for q in session.questions] or list(session.questions_by_id)}")
+            raise ValueError(f"Question not found for question_id={question_id}")
+
+        # Check for timeout
+        if session.is_answer_timed_out():
+            # Timed-out responses get zero score; use structured feedback dict
+            score = 0
+            feedback = {
+                "score": 0,
+                "time_penalty": 0,
+                "criteria_scores": {
+                    "technical_accuracy": {"score": 0, "weight": 0},
+                    "communication": {"score": 0, "weight": 0},
+                    "problem_solving": {"score": 0, "weight": 0}
+                },
                 "timing": {
-                    "started_at": session.question_start_time,
-                    "completed_at": datetime.utcnow(),
-                    "elapsed_seconds": elapsed_time
-                }
+                    "elapsed": session.time_limit_per_question,
+                    "limit": session.time_limit_per_question,
+                    "overtime": 0
+                },
+                "message": f"Response submitted after time limit. Maximum time allowed was {session.time_limit_per_question} seconds."
             }
+            attempt = 1
+        else:
+            # Extract question text defensively from various possible field names
+            question_text = question.get("text") or question.get("question") or question.get("content") or ""
+            logger.debug(f"Question text extracted: {question_text[:100] if question_text else '(empty)'}")
             
-            session.scores[question_id] = {
-                "final_score": feedback.get("score", 0),
-                "time_penalty": feedback.get("time_penalty", 0),
-                "criteria_scores": feedback.get("criteria_scores", {}),
-                "timing": feedback.get("timing", {}),
-                "timestamp": datetime.utcnow(),
-                "attempt": attempt + 1,
-                "question_type": question.get("type", "unknown"),
-                "difficulty_level": question.get("difficulty_level", "unknown")
-            }
+            # Ensure question has default scoring criteria if missing
+            if "scoring_criteria" not in question:
+                question["scoring_criteria"] = {
+                    "technical_accuracy": {"weight": 60, "rubric": "Accuracy and depth of technical knowledge"},
+                    "communication": {"weight": 40, "rubric": "Clarity, structure, and articulation"},
+                    "problem_solving": {"weight": 0, "rubric": "Problem-solving approach"},
+                    "time_management": {"grace_period": 5, "penalty_per_second": 0.5}
+                }
+                logger.debug(f"Assigned default scoring_criteria to question {question_id}")
             
-            # Update session with aggregated statistics
-            total_questions_answered = len(session.scores)
-            avg_technical_score = sum(
-                s["criteria_scores"]["technical_accuracy"]["score"] 
-                for s in session.scores.values()
-            ) / total_questions_answered if total_questions_answered > 0 else 0
+            if "expected_answer_points" not in question:
+                question["expected_answer_points"] = 10
+                logger.debug(f"Assigned default expected_answer_points=10 to question {question_id}")
             
-            avg_communication_score = sum(
-                s["criteria_scores"]["communication"]["score"]
-                for s in session.scores.values()
-            ) / total_questions_answered if total_questions_answered > 0 else 0
+            # Get application and job (support application_id or _id)
+            if prefetched_application is not None and str(session.application_id) == prefetched_app_id:
+                application = prefetched_application
+            else:
+                application = await _get_application(db, session.application_id)
+            logger.debug(f"Application query result: {'found' if application else 'not found'}")
+
+            # Resolve job robustly
+            job_id_val = None
+            if application:
+                job_id_val = application.get("job_id") or application.get("job", {}).get("job_id") or application.get("job", {}).get("_id")
+
+            job = await _get_job(db, job_id_val) if job_id_val else None
             
-            avg_problem_solving_score = sum(
-                s["criteria_scores"]["problem_solving"]["score"]
-                for s in session.scores.values()
-            ) / total_questions_answered if total_questions_answered > 0 else 0
+            # Calculate time-based penalty
+            time_data = session.check_time_remaining()
+            elapsed_time = time_data.get("elapsed", 0)
+            time_penalty = 0
             
-            await db.interview_sessions.update_one(
-                {"session_id": session_id},
-                {"$set": {
-                    "responses": session.responses,
-                    "scores": session.scores,
-                    "statistics": {
-                        "total_questions": len(session.questions),
-                        "questions_answered": total_questions_answered,
-                        "avg_technical_score": round(avg_technical_score, 2),
-                        "avg_communication_score": round(avg_communication_score, 2),
-                        "avg_problem_solving_score": round(avg_problem_solving_score, 2),
-                        "total_time": sum(
-                            s["timing"]["elapsed"] 
-                            for s in session.scores.values()
-                        ),
-                        "last_updated": datetime.utcnow()
-                    }
-                }}
-            )
-
-            # Also persist feedback and score into the application document's gemini_answers
-            try:
+            if elapsed_time > session.time_limit_per_question:
+                grace_period = question["scoring_criteria"].get("time_management", {}).get("grace_period", 5)
+                penalty_per_second = question["scoring_criteria"].get("time_management", {}).get("penalty_per_second", 0.5)
+                overtime = elapsed_time - session.time_limit_per_question
+                if overtime > grace_period:
+                    time_penalty = min(30, (overtime - grace_period) * penalty_per_second)
+
+            # Score response with retries using the service's async multi-criterion scorer
+            transcript_window = _transcript_window(transcript)
+            for attempt in range(session.max_retries):
                 try:
-                    from bson import ObjectId
-                    app_or = [{"application_id": session.application_id}]
-                    if ObjectId.is_valid(str(session.application_id)):
-                        app_or.append({"_id": ObjectId(session.application_id)})
-                except Exception:
-                    app_or = [{"application_id": session.application_id}]
-
-                qid_val = question.get("qid") or question.get("id") or question.get("question_id") or question_id
-
-                # Prefer array_filters-based update to avoid ambiguity with positional operator
-                update_result = await db.applications.update_one(
-                    {"$or": app_or},
-                    {"$set": {
-                        "gemini_answers.$[elem].feedback": feedback,
-                        "gemini_answers.$[elem].score": feedback.get("score", 0),
-                        "gemini_answers.$[elem].evaluated_at": datetime.utcnow()
-                    }},
-                    array_filters=[{"elem.qid": qid_val, "elem.session_id": session_id}]
-                )
+                    q_text = question.get("text") or question.get("question") or question.get("content") or ""
+
+                    # One multi-criterion LLM call returns (score_0_10, feedback_text) per criterion
+                    criteria_results = await scorer_service.score_response_multi_async(
+                        q_text,
+                        response_text,
+                        (application.get("job_description") if application else None) or (job.get("description", "") if job else ""),
+                        transcript_window
+                    )
+                    tech_raw, tech_feedback = criteria_results["technical_accuracy"]
+                    comm_raw, comm_feedback = criteria_results["communication"]
+                    ps_raw, ps_feedback = criteria_results["problem_solving"]
+
+                    # Normalize 0-10 scale to 0-100
+                    technical_score = float(tech_raw) * 10
+                    communication_score = float(comm_raw) * 10
+                    problem_solving_score = float(ps_raw) * 10
+
+                    weights = question.get("scoring_criteria", {})
+                    t_w = weights.get("technical_accuracy", {}).get("weight", 60)
+                    c_w = weights.get("communication", {}).get("weight", 40)
+                    p_w = weights.get("problem_solving", {}).get("weight", 0)
+
+                    weighted_score = (
+                        (technical_score * t_w / 100) +
+                        (communication_score * c_w / 100) +
+                        (problem_solving_score * p_w / 100)
+                    )
+
+                    final_score = max(0, weighted_score - time_penalty)
+
+                    feedback = {
+                        "score": round(final_score, 2),
+                        "time_penalty": round(time_penalty, 2),
+                        "criteria_scores": {
+                            "technical_accuracy": {"score": round(technical_score, 2), "weight": t_w},
+                            "communication": {"score": round(communication_score, 2), "weight": c_w},
+                            "problem_solving": {"score": round(problem_solving_score, 2), "weight": p_w}
+                        },
+                        "timing": {
+                            "elapsed": elapsed_time,
+                            "limit": session.time_limit_per_question,
+                            "overtime": max(0, elapsed_time - session.time_limit_per_question)
+                        },
+                        "tech_feedback": tech_feedback,
+                        "comm_feedback": comm_feedback,
+                        "ps_feedback": ps_feedback
+                    }
 
-                # Log result for diagnostics
-                logger.info("Attempted array_filters update for gemini_answers",
-                            extra={"app_id": session.application_id, "qid": qid_val, "session_id": session_id, "matched": getattr(update_result, "matched_count", None), "modified": getattr(update_result, "modified_count", None)})
-
-                if update_result.matched_count == 0:
-                    # No existing array element matched for (qid + session_id).
-                    # Try a broader update by matching only on qid (covers older entries without session_id)
-                    try:
-                        alt_update = await db.applications.update_one(
-                            {"$or": app_or},
-                            {"$set": {
-                                "gemini_answers.$[elem].feedback": feedback,
-                                "gemini_answers.$[elem].score": feedback.get("score", 0),
-                                "gemini_answers.$[elem].evaluated_at": datetime.utcnow(),
-                                "gemini_answers.$[elem].session_id": session_id
-                            }},
-                            array_filters=[{"elem.qid": qid_val}]
-                        )
-                        logger.info("Attempted array_filters update for gemini_answers (qid-only)",
-                                    extra={"app_id": session.application_id, "qid": qid_val, "matched": getattr(alt_update, "matched_count", None), "modified": getattr(alt_update, "modified_count", None)})
-                    except Exception:
-                        alt_update = None
-
-                    if alt_update and getattr(alt_update, "matched_count", 0) > 0:
-                        # Successfully updated an existing element matched by qid; nothing more to do
-                        pass
-                    else:
-                        # No matching element found even by qid; push a new entry with feedback
-                        answer_with_feedback = {
-                            "qid": qid_val,
-                            "question": question.get("text") or question.get("question") or "",
-                            "answer": response_text,
-                            "audio_url": audio_url,
-                            "transcript": transcript,
-                            "session_id": session_id,
-                            "submitted_at": datetime.utcnow(),
-                            "feedback": feedback,
-                            "score": feedback.get("score", 0),
-                            "evaluated_at": datetime.utcnow()
-                        }
-                        push_res = await db.applications.update_one(
-                            {"$or": app_or},
-                            {"$push": {"gemini_answers": answer_with_feedback}}
-                        )
-                        logger.info("Pushed new gemini_answers entry as fallback",
-                                    extra={"app_id": session.application_id, "qid": qid_val, "push_result": getattr(push_res, "raw_result", None)})
-            except Exception:
-                logger.exception(f"Failed to persist feedback to applications.gemini_answers for application_id={session.application_id}, session={session_id}, qid={question_id}")
-            
-            # Store in vector DB for analysis
-            metadata = {
+                    break
+                except Exception as e:
+                    logger.exception(f"Scoring attempt {attempt+1} failed: {e}")
+                    if attempt == session.max_retries - 1:
+                        raise
+                    await asyncio.sleep(2 ** attempt)
+        
+        # One wall-clock reading for every timestamp this evaluation writes
+        now = datetime.utcnow()
+        now_iso = now.isoformat()
+
+        # Store response and detailed score
+        response_doc = {
+            "text": response_text,
+            "audio_url": audio_url,
+            "transcript": transcript,
+            "timing": {
+                "started_at": session.question_start_time,
+                "completed_at": now,
+                "elapsed_seconds": elapsed_time
+            }
+        }
+        
+        score_doc = {
+            "final_score": feedback.get("score", 0),
+            "time_penalty": feedback.get("time_penalty", 0),
+            "criteria_scores": feedback.get("criteria_scores", {}),
+            "timing": feedback.get("timing", {}),
+            "timestamp": now,
+            "attempt": attempt + 1,
+            "question_type": question.get("type", "unknown"),
+            "difficulty_level": question.get("difficulty_level", "unknown")
+        }
+        
+        # The application's gemini_answers and the QA vector are written once, in
+        # finalize_interview; until then the evaluated answer waits on the session
+        qid_val = question.get("qid") or question.get("id") or question.get("question_id") or question_id
+        q_text_for_vec = question.get("text") or question.get("question") or question.get("content") or ""
+        vector = {
+            "vector_id": f"interview_{session_id}_{question_id}",
+            "text": f"Q: {q_text_for_vec}\nA: {response_text}",
+            "metadata": {
                 "type": "interview_qa",
                 "session_id": session_id,
                 "application_id": session.application_id,
                 "job_id": application["job_id"],
                 "question_id": question_id,
-                "timestamp": datetime.utcnow().isoformat()
-            }
-            
-            vector_id = f"interview_{session_id}_{question_id}"
-            try:
-                q_text_for_vec = question.get("text") or question.get("question") or question.get("content") or ""
-                embedder.upsert_to_pinecone(
-                    vector_id=vector_id,
-                    text=f"Q: {q_text_for_vec}\nA: {response_text}",
-                    metadata=metadata
-                )
-            except Exception:
-                logger.exception("Failed to upsert QA pair to vector DB")
-            
-            # Check if interview is complete
-            completed_questions = len(session.scores)
-            total_questions = len(session.questions)
-            
-            if completed_questions == total_questions:
-                await finalize_interview(session_id)
-                
-            return {
-                "question_id": question_id,
-                "score": feedback.get("score", 0),
-                "feedback": feedback,
-                "status": "complete" if completed_questions == total_questions else "in_progress",
-                "progress": f"{completed_questions}/{total_questions}"
+                "timestamp": now_iso
             }
+        }
+        pending_answer = {
+            "qid": qid_val,
+            "question": question.get("text") or question.get("question") or "",
+            "answer": response_text,
+            "audio_url": audio_url,
+            "transcript": transcript,
+            "session_id": session_id,
+            "submitted_at": now,
+            "feedback": feedback,
+            "score": feedback.get("score", 0),
+            "evaluated_at": now
+        }
+        if settings.live_interview_vector_upsert:
+            _get_pinecone_queue().put_nowait(vector)
+        else:
+            pending_answer["vector"] = vector
+
+        # Write only this question's entries; the counters move only the first
+        # time a question is scored so a retried evaluation doesn't double count
+        set_fields = {
+            f"responses.{question_id}": response_doc,
+            f"scores.{question_id}": score_doc,
+            f"pending_answers.{question_id}": pending_answer,
+            "statistics.total_questions": total_questions,
+            "statistics.last_updated": now
+        }
+        criteria_scores = score_doc["criteria_scores"]
+        first_write = await db.interview_sessions.find_one_and_update(
+            {"session_id": session_id, f"scores.{question_id}": {"$exists": False}},
+            {
+                "$set": set_fields,
+                # Running sums; averages are derived from them when statistics are read
+                "$inc": {
+                    "statistics.questions_answered": 1,
+                    "statistics.total_time": score_doc["timing"].get("elapsed", 0),
+                    "statistics.sum_technical": criteria_scores.get("technical_accuracy", {}).get("score", 0),
+                    "statistics.sum_communication": criteria_scores.get("communication", {}).get("score", 0),
+                    "statistics.sum_problem_solving": criteria_scores.get("problem_solving", {}).get("score", 0),
+                    f"statistics.by_type.{_type_key(score_doc['question_type'])}.sum": score_doc["final_score"],
+                    f"statistics.by_type.{_type_key(score_doc['question_type'])}.count": 1
+                }
+            },
+            projection={"statistics.questions_answered": 1, "_id": 0},
+            return_document=ReturnDocument.AFTER
+        )
+        if first_write is not None:
+            completed_questions = first_write.get("statistics", {}).get("questions_answered", 0)
+        else:
+            # Re-scoring an answered question: the sums still hold the old score, so rebuild them
+            await db.interview_sessions.update_one({"session_id": session_id}, {"$set": set_fields})
+            totals = await _session_score_totals(db, session_id)
+            await db.interview_sessions.update_one(
+                {"session_id": session_id},
+                {"$set": {f"statistics.{name}": value for name, value in totals.items()}}
+            )
+            completed_questions = totals.get("questions_answered", 0)
+        
+        # Check if interview is complete
+        
+        if completed_questions == total_questions:
+            await finalize_interview(session_id)
             
+        return {
+            "question_id": question_id,
+            "score": feedback.get("score", 0),
+            "feedback": feedback,
+            "status": "complete" if completed_questions == total_questions else "in_progress",
+            "progress": f"{completed_questions}/{total_questions}"
+        }
+        
     except Exception as e:
         audit_service.log_error(
             operation="evaluate_interview_response",
@@ -726,7 +1260,7 @@ async def evaluate_interview_response_async(
 def evaluate_interview_response(self, session_id: str, question_id: str, response_text: str, audio_url: Optional[str] = None, transcript: Optional[str] = None) -> Dict[str, Any]:
     """Synchronous Celery wrapper for evaluating an interview response."""
     try:
-        return asyncio.run(evaluate_interview_response_async(session_id, question_id, response_text, audio_url, transcript))
+        return run_async(_run_and_drain(evaluate_interview_response_async(session_id, question_id, response_text, audio_url, transcript)))
     except Exception as e:
         audit_service.log_error(
             operation="evaluate_interview_response",
@@ -735,113 +1269,176 @@ def evaluate_interview_response(self, session_id: str, question_id: str, respons
         )
         raise self.retry(exc=e, countdown=5)
 
+def _merge_gemini_answers(entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Aggregation expression folding evaluated answers into gemini_answers.
+
+    For each entry, in order: patch the element for (qid + session_id) if present,
+    else any element for qid (older entries lack session_id), else append it.
+    """
+    expr: Any = {"$ifNull": ["$gemini_answers", []]}
+    for entry in entries:
+        qid_val, session_id = entry["qid"], entry["session_id"]
+        same_qid = {"$eq": ["$$e.qid", qid_val]}
+        same_entry = {"$and": [same_qid, {"$eq": ["$$e.session_id", session_id]}]}
+        expr = {"$let": {
+            "vars": {"answers": expr},
+            "in": {"$let": {
+                "vars": {"exact": {"$anyElementTrue": [
+                    {"$map": {"input": "$$answers", "as": "e", "in": same_entry}}
+                ]}},
+                "in": {"$cond": [
+                    {"$in": [qid_val, "$$answers.qid"]},
+                    {"$map": {"input": "$$answers", "as": "e", "in": {"$cond": [
+                        {"$cond": ["$$exact", same_entry, same_qid]},
+                        {"$mergeObjects": ["$$e", {
+                            "feedback": {"$literal": entry["feedback"]},
+                            "score": {"$literal": entry["score"]},
+                            "evaluated_at": entry["evaluated_at"],
+                            "session_id": session_id
+                        }]},
+                        "$$e"
+                    ]}}},
+                    {"$concatArrays": ["$$answers", [{"$literal": entry}]]}
+                ]}
+            }}
+        }}
+    return expr
+
+
 async def finalize_interview(session_id: str):
     """Calculate final interview scores and update application with detailed statistics."""
     try:
-        async with AsyncMongoClient() as client:
-            db = client[settings.mongo_db_name]
-
-            session_data = await db.interview_sessions.find_one({"session_id": session_id})
-            if not session_data:
-                raise ValueError("Interview session not found")
-
-            logger.info(f"finalize_interview: session_id={session_id}, application_id={session_data.get('application_id')}")
-
-            # Get all scores and statistics
-            scores = session_data.get("scores", {})
-            statistics = session_data.get("statistics", {})
-            if not scores or not statistics:
-                logger.warning(f"finalize_interview: no scores or statistics to finalize for session={session_id}")
-                return
-
-            logger.debug(f"finalize_interview: scores={len(scores)}, statistics keys={list(statistics.keys())}")
-
-            # Calculate comprehensive final score
-            avg_technical = statistics.get("avg_technical_score", 0)
-            avg_communication = statistics.get("avg_communication_score", 0)
-            avg_problem_solving = statistics.get("avg_problem_solving_score", 0)
-
-            # Weight the averages based on role type (fetch from session)
-            role_weights = {
-                "technical": {"technical": 0.5, "communication": 0.2, "problem_solving": 0.3},
-                "non-technical": {"technical": 0.2, "communication": 0.5, "problem_solving": 0.3},
-                "leadership": {"technical": 0.3, "communication": 0.4, "problem_solving": 0.3}
-            }
+        db = get_db()
+        now = datetime.utcnow()
+
+        # Claim the finalize and read the session in one round trip; concurrent evaluations can
+        # both see the last answer land, and only one of them should finalize
+        session_data = await db.interview_sessions.find_one_and_update(
+            {"session_id": session_id, "finalize_claimed": {"$ne": True}},
+            {"$set": {"finalize_claimed": True, "finalize_started_at": now}},
+            # Responses carry the full answer text and aren't needed here
+            projection={"responses": 0},
+            return_document=ReturnDocument.AFTER
+        )
+        if not session_data:
+            logger.info(f"finalize_interview: session={session_id} not found or already being finalized")
+            return
+
+        logger.info(f"finalize_interview: session_id={session_id}, application_id={session_data.get('application_id')}")
+
+        # Get all scores and statistics
+        scores = session_data.get("scores", {})
+        statistics = session_data.get("statistics", {})
+        if not scores or not statistics:
+            logger.warning(f"finalize_interview: no scores or statistics to finalize for session={session_id}")
+            await _release_finalize_claim(db, session_id)
+            return
+
+        logger.debug(f"finalize_interview: scores={len(scores)}, statistics keys={list(statistics.keys())}")
+
+        # Calculate comprehensive final score
+        avg_technical, avg_communication, avg_problem_solving = _statistics_averages(statistics)
+
+        # Weight the averages based on role type (fetch from session)
+        role_weights = {
+            "technical": {"technical": 0.5, "communication": 0.2, "problem_solving": 0.3},
+            "non-technical": {"technical": 0.2, "communication": 0.5, "problem_solving": 0.3},
+            "leadership": {"technical": 0.3, "communication": 0.4, "problem_solving": 0.3}
+        }
 
-            # Get role type from first question
-            role_type = (
-                session_data.get("questions", [{}])[0]
-                .get("role_type", "technical")
-            )
-            weights = role_weights.get(role_type, role_weights["technical"])
-
-            # Calculate weighted final score
-            final_score = round(
-                (avg_technical * weights["technical"]) +
-                (avg_communication * weights["communication"]) +
-                (avg_problem_solving * weights["problem_solving"]),
-                2
-            )
+        # Get role type from first question
+        role_type = (
+            session_data.get("questions", [{}])[0]
+            .get("role_type", "technical")
+        )
+        weights = role_weights.get(role_type, role_weights["technical"])
+
+        # Calculate weighted final score
+        final_score = round(
+            (avg_technical * weights["technical"]) +
+            (avg_communication * weights["communication"]) +
+            (avg_problem_solving * weights["problem_solving"]),
+            2
+        )
 
-            logger.info(f"finalize_interview: calculated final_score={final_score}, role_type={role_type}")
+        logger.info(f"finalize_interview: calculated final_score={final_score}, role_type={role_type}")
 
-            # Update application with detailed results - use resilient query to match by application_id or _id
-            try:
-                from bson import ObjectId
-                app_id_val = session_data.get("application_id")
-                app_or = [{"application_id": app_id_val}]
-                if ObjectId.is_valid(str(app_id_val)):
-                    app_or.append({"_id": ObjectId(app_id_val)})
-                logger.debug(f"finalize_interview: querying applications with $or={app_or}")
-            except Exception:
-                app_or = [{"application_id": session_data.get("application_id")}]
-                logger.debug(f"finalize_interview: ObjectId conversion failed, using simple query: {app_or}")
-
-            total_time = statistics.get("total_time", 0)
-            avg_time_per_question = round(
-                total_time / statistics.get("questions_answered", 1),
-                1
-            )
+        # Update application with detailed results - match by application_id or _id
+        app_filter = _application_filter(session_data.get("application_id"))
+        logger.debug(f"finalize_interview: querying applications with {app_filter}")
 
-            # Generate performance by type
-            performance_by_type = {}
-            for q_id, score in scores.items():
-                q_type = score.get("question_type", "unknown")
-                performance_by_type.setdefault(q_type, []).append(score.get("final_score", 0))
+        total_time = statistics.get("total_time", 0)
+        avg_time_per_question = round(
+            total_time / statistics.get("questions_answered", 1),
+            1
+        )
 
+        # Generate performance by type
+        by_type = statistics.get("by_type")
+        if by_type:
+            # Running per-type sums kept by evaluate_interview_response_async
             type_averages = {
-                q_type: round(sum(scores_list) / len(scores_list), 2)
-                for q_type, scores_list in performance_by_type.items()
+                q_type: round(totals["sum"] / totals["count"], 2)
+                for q_type, totals in by_type.items() if totals.get("count")
             }
+        else:
+            # Sessions scored before by_type existed: one pass keeping a [sum, count] per type
+            performance_by_type = defaultdict(lambda: [0.0, 0])
+            for score in scores.values():
+                totals = performance_by_type[score.get("question_type", "unknown")]
+                totals[0] += score.get("final_score", 0)
+                totals[1] += 1
 
-            app_update_result = await db.applications.update_one(
-                {"$or": app_or},
-                {"$set": {
-                    "interview_score": final_score,
-                    "interview_completed": True,
-                    "interview_timestamp": datetime.utcnow(),
-                    "interview_statistics": {
-                        "total_score": final_score,
-                        "technical_score": avg_technical,
-                        "communication_score": avg_communication,
-                        "problem_solving_score": avg_problem_solving,
-                        "total_time": total_time,
-                        "avg_time_per_question": avg_time_per_question,
-                        "performance_by_type": type_averages,
-                        "questions_completed": statistics.get("questions_answered", 0),
-                        "total_questions": statistics.get("total_questions", 0)
-                    },
-                    "status": "interview_completed"
-                }}
-            )
-            logger.info(f"finalize_interview: application update result matched={app_update_result.matched_count}, modified={app_update_result.modified_count}, application_id={session_data.get('application_id')}")
-            if app_update_result.matched_count == 0:
-                logger.error(f"finalize_interview: NO APPLICATION FOUND TO UPDATE! application_id={session_data.get('application_id')}, query={app_or}")
-            elif app_update_result.modified_count == 0:
-                logger.warning(f"finalize_interview: application matched but not modified (data unchanged?): {session_data.get('application_id')}")
-
-            # Store interview summary in vector DB for analysis
-            summary_text = f"""
+            type_averages = {
+                q_type: round(total / count, 2)
+                for q_type, (total, count) in performance_by_type.items()
+            }
+
+        # Answers evaluated during the interview, in question order; vectors split off for Pinecone
+        question_order = {q.get("qid"): i for i, q in enumerate(session_data.get("questions", []))}
+        pending = sorted(
+            session_data.get("pending_answers", {}).items(),
+            key=lambda item: question_order.get(item[0], len(question_order))
+        )
+        qa_vectors = []
+        answer_entries = []
+        for _, entry in pending:
+            vector = entry.pop("vector", None)
+            if vector:
+                qa_vectors.append(vector)
+            answer_entries.append(entry)
+
+        app_update_result = await db.applications.update_one(
+            app_filter,
+            [{"$set": {
+                "interview_score": final_score,
+                "interview_completed": True,
+                "interview_timestamp": now,
+                # Pipeline updates read "$..." strings as field paths and merge embedded documents
+                "interview_statistics": {"$literal": {
+                    "total_score": final_score,
+                    "technical_score": avg_technical,
+                    "communication_score": avg_communication,
+                    "problem_solving_score": avg_problem_solving,
+                    "total_time": total_time,
+                    "avg_time_per_question": avg_time_per_question,
+                    "performance_by_type": type_averages,
+                    "questions_completed": statistics.get("questions_answered", 0),
+                    "total_questions": statistics.get("total_questions", 0)
+                }},
+                "status": "interview_completed",
+                "gemini_answers": _merge_gemini_answers(answer_entries)
+            }}]
+        )
+        logger.info(f"finalize_interview: application update result matched={app_update_result.matched_count}, modified={app_update_result.modified_count}, application_id={session_data.get('application_id')}")
+        cache.delete_document("app", session_data.get("application_id"))
+        if app_update_result.matched_count == 0:
+            logger.error(f"finalize_interview: NO APPLICATION FOUND TO UPDATE! application_id={session_data.get('application_id')}, query={app_filter}")
+        elif app_update_result.modified_count == 0:
+            logger.warning(f"finalize_interview: application matched but not modified (data unchanged?): {session_data.get('application_id')}")
+
+        # Store interview summary in vector DB for analysis
+        summary_text = f"""
 Interview Summary for Application {session_data['application_id']}:
 Total Score: {final_score}/100
 Technical Score: {avg_technical}/100
@@ -852,55 +1449,68 @@ Average Time per Question: {avg_time_per_question}s
 Performance by Question Type: {json.dumps(type_averages)}
 """
 
-            vector_id = f"interview_summary_{session_id}"
-            try:
-                embedder.upsert_to_pinecone(
-                    vector_id=vector_id,
-                    text=summary_text,
-                    metadata={
-                        "type": "interview_summary",
-                        "session_id": session_id,
-                        "application_id": session_data["application_id"],
-                        "final_score": final_score,
-                        "timestamp": datetime.utcnow().isoformat()
-                    }
-                )
-            except Exception:
-                logger.exception("Failed to store interview summary in vector DB")
-
-            # Notify completion with detailed stats
-            try:
-                await notifier.notify_interview_completed(
-                    application_id=session_data["application_id"],
-                    score=final_score,
-                    statistics={
-                        "technical_score": avg_technical,
-                        "communication_score": avg_communication,
-                        "problem_solving_score": avg_problem_solving,
-                        "completion_rate": f"{statistics.get('questions_answered', 0)}/{statistics.get('total_questions', 0)}",
-                        "avg_time_per_question": f"{avg_time_per_question}s"
-                    }
-                )
-            except Exception:
-                logger.exception("Failed to notify interview completion")
+        vector_id = f"interview_summary_{session_id}"
+        # Let any live-upserted QA vectors land before the summary
+        await _join_pinecone_queue(timeout=10.0)
+        summary_vector = {
+            "vector_id": vector_id,
+            "text": summary_text,
+            "metadata": {
+                "type": "interview_summary",
+                "session_id": session_id,
+                "application_id": session_data["application_id"],
+                "final_score": final_score,
+                "timestamp": now.isoformat()
+            }
+        }
+        try:
+            # The interview's QA pairs and its summary go to Pinecone as one batch
+            await asyncio.to_thread(embedder.upsert_to_pinecone_batch, qa_vectors + [summary_vector])
+        except Exception:
+            logger.exception("Failed to store interview summary in vector DB")
+
+        # Notify completion with detailed stats in the background; failures are logged by the task callback
+        _fire_and_forget(
+            notifier.notify_interview_completed,
+            application_id=session_data["application_id"],
+            score=final_score,
+            statistics={
+                "technical_score": avg_technical,
+                "communication_score": avg_communication,
+                "problem_solving_score": avg_problem_solving,
+                "completion_rate": f"{statistics.get('questions_answered', 0)}/{statistics.get('total_questions', 0)}",
+                "avg_time_per_question": f"{avg_time_per_question}s"
+            }
+        )
     except Exception as e:
         logger.error(f"finalize_interview failed for session_id={session_id}: {str(e)}", exc_info=True)
         audit_service.log_error(operation="finalize_interview", entity_id=session_id, error=str(e))
+        # Let a later evaluation or retry finalize again
+        try:
+            await _release_finalize_claim(get_db(), session_id)
+        except Exception as release_error:
+            logger.error(f"Failed to release finalize claim for session={session_id}: {release_error}")
+
+
+async def _release_finalize_claim(db, session_id: str) -> None:
+    await db.interview_sessions.update_one(
+        {"session_id": session_id},
+        {"$unset": {"finalize_claimed": "", "finalize_started_at": ""}}
+    )
 
 async def cleanup_expired_sessions_async() -> int:
     """Cleanup expired interview sessions older than 7 days (async helper)."""
     try:
-        async with AsyncMongoClient() as client:
-            db = client[settings.mongo_db_name]
-            
-            expiry = datetime.utcnow() - timedelta(days=7)
-            result = await db.interview_sessions.delete_many({
-                "timestamp": {"$lt": expiry},
-                "status": {"$in": ["complete", "expired"]}
-            })
-            
-            return result.deleted_count
-            
+        db = get_db()
+        
+        expiry = datetime.utcnow() - timedelta(days=7)
+        result = await db.interview_sessions.delete_many({
+            "timestamp": {"$lt": expiry},
+            "status": {"$in": ["complete", "expired"]}
+        })
+        
+        return result.deleted_count
+        
     except Exception as e:
         audit_service.log_error(
             operation="cleanup_expired_sessions",
@@ -913,10 +1523,89 @@ async def cleanup_expired_sessions_async() -> int:
 @celery.task(bind=True)
 def cleanup_expired_sessions(self) -> int:
     try:
-        return asyncio.run(cleanup_expired_sessions_async())
+        return run_async(cleanup_expired_sessions_async())
     except Exception as e:
         audit_service.log_error(
             operation="cleanup_expired_sessions",
             error=str(e)
         )
-        raise self.retry(exc=e, countdown=60)
\ No newline at end of file
+        raise self.retry(exc=e, countdown=60)
+
+
+def _weighted_response_scores(tech, comm, ps, t_w, c_w, p_w, penalty):
+    """Weighted 0-100 score per response after its time penalty, floored at zero."""
+    return np.maximum((tech * t_w + comm * c_w + ps * p_w) / 100.0 - penalty, 0.0)
+
+
+def _rebuild_session_statistics(scores: Dict[str, Any]) -> Tuple[Dict[str, float], Dict[str, float]]:
+    """Recompute per-question final scores and the running sums for one session's scores map."""
+    qids = list(scores)
+    criteria = [scores[qid].get("criteria_scores", {}) for qid in qids]
+
+    def column(name, field):
+        return np.array([float(c.get(name, {}).get(field, 0) or 0) for c in criteria], dtype=np.float64)
+
+    tech = column("technical_accuracy", "score")
+    comm = column("communication", "score")
+    ps = column("problem_solving", "score")
+    penalty = np.array([float(scores[qid].get("time_penalty", 0) or 0) for qid in qids], dtype=np.float64)
+    final = _weighted_response_scores(
+        tech, comm, ps,
+        column("technical_accuracy", "weight"),
+        column("communication", "weight"),
+        column("problem_solving", "weight"),
+        penalty
+    )
+
+    final_scores = {qid: round(float(value), 2) for qid, value in zip(qids, final)}
+    by_type = defaultdict(lambda: {"sum": 0.0, "count": 0})
+    for qid in qids:
+        totals = by_type[_type_key(scores[qid].get("question_type"))]
+        totals["sum"] += final_scores[qid]
+        totals["count"] += 1
+    statistics = {
+        "by_type": dict(by_type),
+        "questions_answered": len(qids),
+        "total_time": sum(float(scores[qid].get("timing", {}).get("elapsed", 0) or 0) for qid in qids),
+        "sum_technical": float(tech.sum()),
+        "sum_communication": float(comm.sum()),
+        "sum_problem_solving": float(ps.sum())
+    }
+    return final_scores, statistics
+
+
+async def rebuild_interview_statistics_async() -> int:
+    """Recompute final scores and running sums for every scored interview session (async helper)."""
+    db = get_db()
+    cursor = db.interview_sessions.find(
+        {"scores": {"$exists": True, "$ne": {}}},
+        {"session_id": 1, "scores": 1, "_id": 0}
+    ).batch_size(STATS_REBUILD_BATCH_SIZE)
+
+    rebuilt = 0
+    ops = []
+    async for session_data in cursor:
+        final_scores, statistics = _rebuild_session_statistics(session_data["scores"])
+        update = {f"scores.{qid}.final_score": value for qid, value in final_scores.items()}
+        update.update({f"statistics.{name}": value for name, value in statistics.items()})
+        update["statistics.last_updated"] = datetime.utcnow()
+        ops.append(UpdateOne({"session_id": session_data["session_id"]}, {"$set": update}))
+        if len(ops) >= STATS_REBUILD_BATCH_SIZE:
+            rebuilt += (await db.interview_sessions.bulk_write(ops, ordered=False)).modified_count
+            ops = []
+    if ops:
+        rebuilt += (await db.interview_sessions.bulk_write(ops, ordered=False)).modified_count
+    return rebuilt
+
+
+@celery.task(bind=True)
+def rebuild_interview_statistics(self) -> int:
+    """Admin task: re-derive session scores and statistics after a rubric or weighting change."""
+    try:
+        return run_async(rebuild_interview_statistics_async())
+    except Exception as e:
+        audit_service.log_error(
+            operation="rebuild_interview_statistics",
+            error=str(e)
+        )
+        raise self.retry(exc=e, countdown=60)
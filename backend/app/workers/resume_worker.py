@@ -1,7 +1,13 @@
 import uuid
+import time
 import logging
+import functools
+from tempfile import SpooledTemporaryFile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, Any
+from celery import group
+from celery.signals import worker_process_init, worker_process_shutdown
 from app.workers.celery_app import celery
 from app.services import (
     ResumeParser,
@@ -13,9 +19,85 @@ from app.services import (
 )
 from app.config import settings
 
+# Resumes up to this size stay in memory while streamed from GCS; larger ones spill to disk
+RESUME_SPOOL_MAX_BYTES = 2 * 1024 * 1024
+RESUME_IO_WORKERS = 4
+RESUME_NOTIFY_WORKERS = 4
+RESUME_EXCERPT_CHARS = 2000
+
+
+# Services hold no per-task state, so each worker process builds them once on first use
+@functools.lru_cache(maxsize=1)
+def _storage_service() -> StorageService:
+    return StorageService()
+
+
+@functools.lru_cache(maxsize=1)
+def _parser() -> ResumeParser:
+    return ResumeParser()
+
+
+@functools.lru_cache(maxsize=1)
+def _embedder() -> EmbedderService:
+    return EmbedderService()
+
+
+@functools.lru_cache(maxsize=1)
+def _db_service() -> SyncDatabaseService:
+    return SyncDatabaseService()
+
+
+@functools.lru_cache(maxsize=1)
+def _notifier() -> NotificationService:
+    return NotificationService()
+
+
+@functools.lru_cache(maxsize=1)
+def _cache() -> CacheService:
+    return CacheService()
+
+
+@functools.lru_cache(maxsize=1)
+def _io_executor() -> ThreadPoolExecutor:
+    """Threads for blocking network calls that can overlap within a task."""
+    return ThreadPoolExecutor(max_workers=RESUME_IO_WORKERS, thread_name_prefix="resume-io")
+
+
+@functools.lru_cache(maxsize=1)
+def _notify_executor() -> ThreadPoolExecutor:
+    """Threads that publish WebSocket events without holding up the task."""
+    return ThreadPoolExecutor(max_workers=RESUME_NOTIFY_WORKERS, thread_name_prefix="notify")
+
+
+def _notify(notifier: NotificationService, application_id: str, payload: Dict[str, Any]) -> None:
+    """Publish a resume_processed event in the background, logging a failed publish."""
+    def _done(future):
+        if future.exception() is not None or not future.result():
+            logger.error(f"[{application_id}] Could not publish resume_processed event: {future.exception()}")
+
+    _notify_executor().submit(notifier.publish_event, "resume_processed", application_id, payload).add_done_callback(_done)
+
+
+@worker_process_shutdown.connect
+def _flush_notifications(**kwargs):
+    """Let queued event publishes finish before the worker process exits."""
+    if _notify_executor.cache_info().currsize:
+        _notify_executor().shutdown(wait=True)
+
+
+@worker_process_init.connect
+def _warm_resume_services(**kwargs):
+    """Build the service clients in each forked worker before its first task."""
+    for factory in (_storage_service, _parser, _embedder, _db_service, _notifier, _cache):
+        try:
+            factory()
+        except Exception as e:
+            # Not cached on failure; the first task retries construction
+            logger.error(f"Failed to pre-warm {factory.__name__}: {str(e)}")
+
 # Configure logging
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.INFO)
+logger.setLevel(settings.worker_log_level)
 
 
 @celery.task(name="app.workers.resume_worker.process_resume", bind=True)
@@ -30,78 +112,70 @@ def process_resume(self, application_id: str, gcs_path: str) -> Dict[str, Any]:
     Returns:
         Dict with candidate_id, embedding_id and status.
     """
-    start_time = datetime.now()
-    logger.info(f"[{application_id}] Starting resume processing at {start_time}")
+    start = time.monotonic()
+    logger.info(f"[{application_id}] Starting resume processing at {datetime.now()}")
     try:
         # Initialize services
         logger.info(f"[{application_id}] Initializing services...")
-        print(f"[{application_id}] resume_worker: initializing services")
-        storage_service = StorageService()
-        parser = ResumeParser()
-        embedder = EmbedderService()
-        db_service = SyncDatabaseService()  # Use sync wrapper
-        notifier = NotificationService()
-        cache = CacheService()
-        
-        # First get application to check current state
-        app = db_service.get_application(application_id)
-        if app and app.get("status") == "COMPLETED" and app.get("resume_vector_id"):
-            logger.info(f"[{application_id}] Application already processed successfully")
-            return {
-                "status": "completed",
-                "resume_vector_id": app.get("resume_vector_id"),
-                "application_id": application_id,
-                "message": "Already processed"
-            }
+        storage_service = _storage_service()
+        parser = _parser()
+        embedder = _embedder()
+        db_service = _db_service()  # Use sync wrapper
+        notifier = _notifier()
+        cache = _cache()
         
         logger.info(f"[{application_id}] Services initialized successfully")
-        print(f"[{application_id}] resume_worker: services initialized")
 
-        # Update application status to processing
+        # Mark the application PROCESSING unless it already has a completed resume;
+        # only when that write matches nothing do we read the application to find out why
         logger.info(f"[{application_id}] Updating application status to PROCESSING")
-        db_service.update_application(application_id, {
+        if not db_service.start_application_processing(application_id, {
             "status": "PROCESSING",
             "stage": "resume_processing"
-        })
+        }):
+            app = db_service.get_application(application_id)
+            if app and app.get("status") == "COMPLETED" and app.get("resume_vector_id"):
+                logger.info(f"[{application_id}] Application already processed successfully")
+                return {
+                    "status": "completed",
+                    "resume_vector_id": app.get("resume_vector_id"),
+                    "application_id": application_id,
+                    "message": "Already processed"
+                }
 
         # Download file from GCS
         logger.info(f"[{application_id}] Downloading resume from GCS: {gcs_path}")
-        print(f"[{application_id}] resume_worker: downloading from GCS {gcs_path}")
-        file_content = storage_service.download_file(gcs_path)
-        logger.info(f"[{application_id}] Resume file downloaded successfully")
-        print(f"[{application_id}] resume_worker: download complete, {len(file_content) if file_content else 0} bytes")
-
-        # Extract text from resume
-        logger.info(f"[{application_id}] Parsing resume content...")
-        print(f"[{application_id}] resume_worker: parsing resume content")
-        parsed_data = parser.parse_resume_bytes(file_content)
+        with SpooledTemporaryFile(max_size=RESUME_SPOOL_MAX_BYTES) as resume_file:
+            size = storage_service.download_file_to(gcs_path, resume_file)
+            logger.info(f"[{application_id}] Resume file downloaded successfully ({size} bytes)")
+            resume_file.seek(0)
+
+            # Extract text from resume
+            logger.info(f"[{application_id}] Parsing resume content...")
+            parsed_data = parser.parse_resume_stream(resume_file)
         resume_text = parsed_data.get('text', '')
         logger.info(f"[{application_id}] Parsed resume text length: {len(resume_text) if resume_text else 0}")
-        print(f"[{application_id}] resume_worker: parsed {len(resume_text or '')} characters")
 
         if not resume_text.strip():
             raise ValueError("Could not extract text from resume")
 
         # Check cache for existing embedding
         logger.info(f"[{application_id}] Checking cache for existing embedding...")
-        print(f"[{application_id}] resume_worker: computing text hash and checking cache")
         text_hash = cache.hash_text(resume_text)
         cached_embedding_id = cache.get_embedding(text_hash)
+        # Scoring reads the full text from here rather than from the candidate document
+        cache.set_resume_text(text_hash, resume_text)
 
         if cached_embedding_id:
             logger.info(f"[{application_id}] Found cached embedding: {cached_embedding_id}")
-            print(f"[{application_id}] resume_worker: using cached embedding {cached_embedding_id}")
             embedding_id = cached_embedding_id
         else:
             # Create new embedding (this method also upserts to the configured index)
             logger.info(f"[{application_id}] Creating new embedding and upserting to Vertex AI index...")
-            print(f"[{application_id}] resume_worker: creating new embedding (may be slow) ")
             embedding_id = embedder.create_embedding(resume_text)
             logger.info(f"[{application_id}] Embedding created with ID: {embedding_id}")
-            print(f"[{application_id}] resume_worker: embedding created id={embedding_id}")
             cache.set_embedding(text_hash, embedding_id)
             logger.info(f"[{application_id}] Embedding cached for future use")
-            print(f"[{application_id}] resume_worker: cached embedding for hash {text_hash}")
 
         # Extract and validate email first
         email = parsed_data.get('email')
@@ -117,7 +191,12 @@ def process_resume(self, application_id: str, gcs_path: str) -> Dict[str, Any]:
             "skills": parsed_data.get('skills', []),
             "experience": parsed_data.get('total_experience', 0),
             "education": parsed_data.get('degree'),
-            "resume_text": resume_text,
+            # The full text stays in GCS (and briefly in Redis); the candidate keeps an excerpt.
+            # resume_text is cleared so a re-upload doesn't leave an older full copy behind.
+            "resume_text": None,
+            "resume_text_excerpt": resume_text[:RESUME_EXCERPT_CHARS],
+            "resume_text_gcs_path": gcs_path,
+            "resume_text_hash": text_hash,
             "embedding_id": embedding_id,
             "gcs_path": gcs_path,
             "application_id": application_id,
@@ -128,7 +207,6 @@ def process_resume(self, application_id: str, gcs_path: str) -> Dict[str, Any]:
         logger.info(f"[{application_id}] Saving candidate data to MongoDB...")
         candidate_id = db_service.save_candidate(candidate_data)
         logger.info(f"[{application_id}] Candidate saved with ID: {candidate_id}")
-        print(f"[{application_id}] resume_worker: candidate saved id={candidate_id}")
 
         # Prepare metadata to persist in MongoDB and Pinecone (include canonical candidate_id)
         metadata = {
@@ -147,21 +225,17 @@ def process_resume(self, application_id: str, gcs_path: str) -> Dict[str, Any]:
             "text": resume_text[:1000],  # Truncate for DB
         }
 
-        # Attempt metadata upsert to vector index (now including candidate_id)
-        try:
-            logger.info(f"[{application_id}] Upserting metadata to Vertex AI index...")
-            print(f"[{application_id}] resume_worker: upserting metadata to vector index (id={embedding_id})")
-            embedder.upsert_to_pinecone(embedding_id, resume_text, metadata)
-            logger.info(f"[{application_id}] Metadata upserted successfully")
-            print(f"[{application_id}] resume_worker: upsert successful for vector {embedding_id}")
-        except Exception as upsert_error:
-            # Non-fatal: continue even if index upsert fails; worker will retry or log
-            logger.warning(f"[{application_id}] Metadata upsert warning (non-fatal): {str(upsert_error)}")
-            print(f"[{application_id}] resume_worker: upsert WARNING: {str(upsert_error)}")
+        # Metadata upsert to vector index (now including candidate_id) runs in the
+        # background while the application is updated; the two don't depend on each other
+        logger.info(f"[{application_id}] Upserting metadata to Vertex AI index...")
+        if cached_embedding_id:
+            # Same resume text was embedded before: the vector exists, only its metadata changes
+            upsert_future = _io_executor().submit(embedder.update_metadata, embedding_id, metadata)
+        else:
+            upsert_future = _io_executor().submit(embedder.upsert_to_pinecone, embedding_id, resume_text, metadata)
 
         # Update application status to completed
         logger.info(f"[{application_id}] Updating application status to COMPLETED...")
-        print(f"[{application_id}] resume_worker: updating application DB with vector id and metadata")
         # Persist consistent field names expected by other parts of the app
         try:
             ok = db_service.update_application(application_id, {
@@ -171,21 +245,26 @@ def process_resume(self, application_id: str, gcs_path: str) -> Dict[str, Any]:
                 "resume_vector_id": embedding_id,
                 "pinecone_metadata": metadata
             })
-            print(f"[{application_id}] resume_worker: DB update completed ok={ok}")
+            logger.debug(f"[{application_id}] Application update completed ok={ok}")
         except Exception as e:
             logger.warning(f"[{application_id}] Failed to update application with vector info: {str(e)}")
-            print(f"[{application_id}] resume_worker: DB update FAILED: {str(e)}")
+
+        try:
+            upsert_future.result()
+            logger.info(f"[{application_id}] Metadata upserted successfully")
+        except Exception as upsert_error:
+            # Non-fatal: continue even if index upsert fails; worker will retry or log
+            logger.warning(f"[{application_id}] Metadata upsert warning (non-fatal): {str(upsert_error)}")
 
         # Notify frontend via WebSocket
         logger.info(f"[{application_id}] Sending WebSocket notification to frontend...")
-        notifier.publish_event("resume_processed", application_id, {
+        _notify(notifier, application_id, {
             "candidate_id": candidate_id,
             "status": "completed",
             "embedding_id": embedding_id
         })
 
-        end_time = datetime.now()
-        duration = (end_time - start_time).total_seconds()
+        duration = time.monotonic() - start
         logger.info(f"[{application_id}] Resume processing completed successfully in {duration:.2f} seconds")
         
         return {
@@ -197,8 +276,7 @@ def process_resume(self, application_id: str, gcs_path: str) -> Dict[str, Any]:
         }
 
     except Exception as e:
-        error_time = datetime.now()
-        duration = (error_time - start_time).total_seconds()
+        duration = time.monotonic() - start
         logger.error(f"[{application_id}] Error processing resume after {duration:.2f} seconds: {str(e)}")
         
         # Update application status to failed
@@ -216,7 +294,7 @@ def process_resume(self, application_id: str, gcs_path: str) -> Dict[str, Any]:
         # Notify frontend of failure
         try:
             logger.info(f"[{application_id}] Sending failure notification to frontend...")
-            notifier.publish_event("resume_processed", application_id, {
+            _notify(notifier, application_id, {
                 "status": "failed",
                 "error": str(e),
                 "duration_seconds": duration
@@ -242,15 +320,13 @@ def batch_process_resumes(application_ids: list, gcs_paths: list) -> Dict[str, A
         Dict with processing results
     """
     results = []
+    signatures = []
+    queued_ids = []
     
     for application_id, gcs_path in zip(application_ids, gcs_paths):
         try:
-            result = process_resume.delay(application_id, gcs_path)
-            results.append({
-                "application_id": application_id,
-                "task_id": result.id,
-                "status": "queued"
-            })
+            signatures.append(process_resume.s(application_id, gcs_path))
+            queued_ids.append(application_id)
         except Exception as e:
             results.append({
                 "application_id": application_id,
@@ -258,4 +334,31 @@ def batch_process_resumes(application_ids: list, gcs_paths: list) -> Dict[str, A
                 "error": str(e)
             })
     
+    if not signatures:
+        return {"results": results}
+    
+    try:
+        # One group publish over a single producer connection instead of a .delay() per resume
+        group_result = group(signatures).apply_async()
+        queued = zip(queued_ids, (r.id for r in group_result.results))
+    except Exception as e:
+        logger.error(f"Group dispatch of {len(signatures)} resumes failed, falling back to per-task delay: {str(e)}")
+        queued = []
+        for application_id, sig in zip(queued_ids, signatures):
+            try:
+                queued.append((application_id, sig.delay().id))
+            except Exception as delay_error:
+                results.append({
+                    "application_id": application_id,
+                    "status": "failed",
+                    "error": str(delay_error)
+                })
+    
+    for application_id, task_id in queued:
+        results.append({
+            "application_id": application_id,
+            "task_id": task_id,
+            "status": "queued"
+        })
+    
     return {"results": results}
@@ -1,10 +1,14 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
+import functools
 import logging
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from celery import chord, group
+from celery.signals import worker_process_init
 from app.workers.celery_app import celery
 from app.services import (
     EmbedderService,
+    StorageService,
     ScorerService,
     SyncDatabaseService,
     NotificationService,
@@ -14,192 +18,330 @@ from app.services import (
 from app.config import settings
 
 logger = logging.getLogger(__name__)
+logger.setLevel(settings.worker_log_level)
 
 
-@celery.task(name="app.workers.scoring_worker.score_candidate", bind=True)
-def score_candidate(self, candidate_id: str, job_description: str, job_id: str = None) -> Dict[str, Any]:
-    """
-    Score a candidate against a job description using LLM.
-    """
+# A candidate that isn't visible yet re-queues the task after this many seconds;
+# transient read errors are already retried inside the driver (retryReads)
+CANDIDATE_RETRY_COUNTDOWN = 5
+
+
+# Fields each scoring path reads, so lookups don't ship whole documents
+CANDIDATE_SCORING_FIELDS = {
+    "resume_text": 1, "resume_text_gcs_path": 1, "resume_text_hash": 1, "resume_url": 1
+}
+APPLICATION_ID_FIELDS = {"application_id": 1, "candidate_id": 1}
+INTERVIEW_SCORING_FIELDS = {
+    "gemini_questions": 1, "gemini_answers": 1, "job.description": 1, "resume_text": 1
+}
+
+
+# Candidates batch_score_candidates scores concurrently in-process
+SCORE_BATCH_WORKERS = 8
+
+# Matches per process_match_chunk task when match_job_candidates fans out
+MATCH_CHUNK_SIZE = 25
+
+
+# Services hold no per-task state and their clients are thread-safe, so each
+# worker process builds them once on first use
+@functools.lru_cache(maxsize=1)
+def _scorer() -> ScorerService:
+    return ScorerService()
+
+
+@functools.lru_cache(maxsize=1)
+def _embedder() -> EmbedderService:
+    return EmbedderService()
+
+
+@functools.lru_cache(maxsize=1)
+def _storage_service() -> StorageService:
+    return StorageService()
+
+
+@functools.lru_cache(maxsize=1)
+def _db_service() -> SyncDatabaseService:
+    return SyncDatabaseService()
+
+
+@functools.lru_cache(maxsize=1)
+def _notifier() -> NotificationService:
+    return NotificationService()
+
+
+@functools.lru_cache(maxsize=1)
+def _cache() -> CacheService:
+    return CacheService()
+
+
+@functools.lru_cache(maxsize=1)
+def _audit() -> AuditService:
+    return AuditService()
+
+
+@functools.lru_cache(maxsize=1)
+def _score_executor() -> ThreadPoolExecutor:
+    """Threads that run batch scoring in-process; each item is network-bound."""
+    return ThreadPoolExecutor(max_workers=SCORE_BATCH_WORKERS, thread_name_prefix="score")
+
+
+@worker_process_init.connect
+def _warm_scoring_services(**kwargs):
+    """Build the service clients in each forked worker before its first task."""
+    for factory in (_scorer, _embedder, _storage_service, _db_service, _notifier, _cache, _audit):
+        try:
+            factory()
+        except Exception as e:
+            # Not cached on failure; the first task retries construction
+            logger.error(f"Failed to pre-warm {factory.__name__}: {str(e)}")
+
+
+def _load_full_resume_text(candidate: Dict[str, Any], cache: CacheService) -> str:
+    """Full resume text for a candidate that stores only an excerpt: Redis first, then GCS."""
+    text_hash = candidate.get("resume_text_hash")
+    if text_hash:
+        text = cache.get_resume_text(text_hash)
+        if text:
+            return text
+    gcs_path = candidate.get("resume_text_gcs_path")
+    if not gcs_path:
+        return ""
+    text = _storage_service().download_text(gcs_path)
+    if text and text_hash:
+        cache.set_resume_text(text_hash, text)
+    return text
+
+
+def _jd_embedding(job_description: str, cache: CacheService):
+    """Embedding of a job description: the one match_job_candidates cached, else encoded locally."""
+    embedding = cache.get_jd_embedding(job_description)
+    if embedding:
+        return embedding
     try:
-        # Validate input parameters
-        if not candidate_id:
-            raise ValueError("candidate_id cannot be None or empty")
-        if not job_description:
-            raise ValueError("job_description cannot be None or empty")
+        embedding = _embedder().encode(job_description)
+    except Exception as e:
+        logger.error(f"Failed to embed job description: {str(e)}")
+        return None
+    cache.set_jd_embedding(job_description, embedding)
+    return embedding
 
-        # Initialize services
-        scorer = ScorerService()
-        db_service = SyncDatabaseService()  # Use sync wrapper
-        notifier = NotificationService()
-        cache = CacheService()
-
-        print(f"[score_candidate] candidate_id={candidate_id} job_id={job_id} - starting scoring")
-        logger.info(f"[score_candidate] Scoring candidate {candidate_id} for job {job_id}")
-
-        # Get candidate data with retries
-        retry_count = 0
-        max_retries = 3
-        candidate = None
-        
-        while retry_count < max_retries:
-            try:
-                candidate = db_service.get_candidate(candidate_id)
-                if candidate:
-                    print(f"[score_candidate] Successfully retrieved candidate data: {candidate_id}")
-                    break
-                logger.warning(f"[score_candidate] Candidate {candidate_id} not found on attempt {retry_count + 1}")
-                retry_count += 1
-                if retry_count < max_retries:
-                    time.sleep(1)  # Wait 1 second before retrying
-            except Exception as e:
-                logger.error(f"[score_candidate] Attempt {retry_count + 1} failed to get candidate {candidate_id}: {str(e)}")
-                retry_count += 1
-                if retry_count < max_retries:
-                    time.sleep(1)
 
-        if not candidate:
-            error_msg = f"Candidate {candidate_id} not found after {max_retries} attempts"
-            logger.error(f"[score_candidate] {error_msg}")
-            raise ValueError(error_msg)
+class CandidateNotFound(ValueError):
+    """The candidate document isn't visible yet; worth retrying after a short delay."""
+
+
+class LLMScoringFailed(Exception):
+    """Gemini could not score a candidate whose keyword fallback the caller batches."""
 
-        resume_text = candidate.get('resume_text', '')
-        if not resume_text:
-            # Try to get resume text from resume_url if available
-            resume_url = candidate.get('resume_url')
-            if resume_url:
+    def __init__(self, candidate_id: str, resume_text: str):
+        super().__init__(f"LLM scoring failed for candidate {candidate_id}")
+        self.resume_text = resume_text
+
+
+def _score_candidate_impl(
+    candidate_id: str, job_description: str, job_id: str = None, batch_fallback: bool = False
+) -> Dict[str, Any]:
+    """Score a candidate against a job description using LLM; the body of score_candidate.
+
+    With batch_fallback, an LLM failure raises LLMScoringFailed instead of
+    keyword-scoring this one candidate, so the caller can fallback-score the
+    whole batch in one pass.
+    """
+    # Validate input parameters
+    if not candidate_id:
+        raise ValueError("candidate_id cannot be None or empty")
+    if not job_description:
+        raise ValueError("job_description cannot be None or empty")
+
+    # Initialize services
+    scorer = _scorer()
+    db_service = _db_service()  # Use sync wrapper
+    notifier = _notifier()
+    cache = _cache()
+    # One timestamp for every record this run writes
+    now = datetime.utcnow()
+
+    logger.info("[score_candidate] Scoring candidate %s for job %s", candidate_id, job_id)
+
+    # Get candidate data; a miss is retried by the task, not by sleeping here
+    candidate = db_service.get_candidate(candidate_id, CANDIDATE_SCORING_FIELDS)
+    if not candidate:
+        error_msg = f"Candidate {candidate_id} not found"
+        logger.warning("[score_candidate] %s", error_msg)
+        raise CandidateNotFound(error_msg)
+    logger.debug("[score_candidate] Successfully retrieved candidate data: %s", candidate_id)
+
+    resume_text = candidate.get('resume_text', '')
+    if not resume_text and candidate.get('resume_text_gcs_path'):
+        try:
+            resume_text = _load_full_resume_text(candidate, cache)
+        except Exception as e:
+            logger.error(f"[score_candidate] Failed to load resume text for {candidate_id}: {str(e)}")
+    if not resume_text:
+        # Try to get resume text from resume_url if available
+        resume_url = candidate.get('resume_url')
+        if resume_url:
+            try:
+                storage_service = db_service.get_storage_service()
+                resume_text = storage_service.get_file_text(resume_url)
+                if resume_text:
+                    # Update candidate with extracted text
+                    db_service.update_candidate(candidate_id, {"resume_text": resume_text})
+                    logger.info("[score_candidate] Successfully extracted and updated resume text for %s", candidate_id)
+                else:
+                    raise ValueError("Failed to extract text from resume")
+            except Exception as e:
+                # If resume extraction fails, fallback to assigning score 0 instead of raising
+                logger.error(f"[score_candidate] Failed to extract text from resume: {str(e)}")
+                logger.warning("[score_candidate] Assigning fallback score=0 for candidate %s due to resume fetch failure", candidate_id)
+                # Build fallback score data
+                score_data = {
+                    "score": 0,
+                    "rationale": "Resume unavailable or could not be processed. Assigned fallback score 0.",
+                    "model": "fallback",
+                    "timestamp": now.isoformat()
+                }
+                # Persist fallback score and notify; avoid retry loop
                 try:
-                    storage_service = db_service.get_storage_service()
-                    resume_text = storage_service.get_file_text(resume_url)
-                    if resume_text:
-                        # Update candidate with extracted text
-                        db_service.update_candidate(candidate_id, {"resume_text": resume_text})
-                        logger.info(f"[score_candidate] Successfully extracted and updated resume text for {candidate_id}")
-                    else:
-                        raise ValueError("Failed to extract text from resume")
-                except Exception as e:
-                    # If resume extraction fails, fallback to assigning score 0 instead of raising
-                    logger.error(f"[score_candidate] Failed to extract text from resume: {str(e)}")
-                    logger.warning(f"[score_candidate] Assigning fallback score=0 for candidate {candidate_id} due to resume fetch failure")
-                    # Build fallback score data
-                    score_data = {
-                        "score": 0,
-                        "rationale": "Resume unavailable or could not be processed. Assigned fallback score 0.",
-                        "model": "fallback",
-                        "timestamp": datetime.utcnow().isoformat()
-                    }
-                    # Persist fallback score and notify; avoid retry loop
-                    try:
-                        db_service.update_candidate_score(candidate_id, score_data, job_id)
-                        logger.info(f"[score_candidate] Persisted fallback score for candidate {candidate_id}")
-                        if job_id:
-                            # Try to update corresponding application record
-                            try:
-                                application = db_service.get_application_by_job_and_candidate(job_id, candidate_id)
-                                if application:
-                                    application_id = application.get('application_id') or application.get('_id')
-                                    db_service.update_application(application_id, {
-                                        "ai_match_score": 0,
-                                        "match_score": 0,
-                                        "latest_score": score_data,
-                                        "updated_at": datetime.utcnow()
-                                    })
-                                    logger.info(f"[score_candidate] Updated application {application_id} with fallback score")
-                            except Exception as e2:
-                                logger.error(f"[score_candidate] Failed to update application with fallback score: {str(e2)}")
-
-                        # Notify frontend of fallback scoring
+                    db_service.update_candidate_score(candidate_id, score_data, job_id)
+                    logger.info("[score_candidate] Persisted fallback score for candidate %s", candidate_id)
+                    if job_id:
+                        # Try to update corresponding application record
                         try:
-                            if job_id:
-                                notifier.publish_event("candidate_scored", job_id, {
-                                    "candidate_id": candidate_id,
-                                    "score": 0,
-                                    "rationale": score_data.get('rationale'),
-                                    "status": "scored"
+                            application = db_service.get_application_by_job_and_candidate(job_id, candidate_id, APPLICATION_ID_FIELDS)
+                            if application:
+                                application_id = application.get('application_id') or application.get('_id')
+                                db_service.update_application(application_id, {
+                                    "ai_match_score": 0,
+                                    "match_score": 0,
+                                    "latest_score": score_data,
+                                    "updated_at": now
                                 })
-                        except Exception:
-                            pass
-
-                        return {
-                            "candidate_id": candidate_id,
-                            "score": 0,
-                            "rationale": score_data.get('rationale'),
-                            "status": "completed"
-                        }
+                                logger.info("[score_candidate] Updated application %s with fallback score", application_id)
+                        except Exception as e2:
+                            logger.error(f"[score_candidate] Failed to update application with fallback score: {str(e2)}")
+
+                    # Notify frontend of fallback scoring
+                    try:
+                        if job_id:
+                            notifier.publish_event("candidate_scored", job_id, {
+                                "candidate_id": candidate_id,
+                                "score": 0,
+                                "rationale": score_data.get('rationale'),
+                                "status": "scored"
+                            })
                     except Exception:
-                        # If persisting fallback fails, raise to trigger retry logic
-                        raise
-            else:
-                error_msg = "No resume text or URL available for candidate"
-                logger.error(f"[score_candidate] {error_msg}")
-                raise ValueError(error_msg)
-
-        # Check cache for existing score
-        score_key = cache.generate_score_key(candidate_id, job_description)
-        cached_score = cache.get_score(score_key)
-
-        if cached_score:
-            print(f"[score_candidate] Using cached score for {candidate_id}")
-            score_data = cached_score
+                        pass
+
+                    return {
+                        "candidate_id": candidate_id,
+                        "score": 0,
+                        "rationale": score_data.get('rationale'),
+                        "status": "completed"
+                    }
+                except Exception:
+                    # If persisting fallback fails, raise to trigger retry logic
+                    raise
         else:
-            print(f"[score_candidate] Generating new LLM score for {candidate_id}")
-            # Generate new score using LLM
-            score_data = scorer.score_candidate(resume_text, job_description)
-            # Cache the result
-            cache.set_score(score_key, score_data)
+            error_msg = "No resume text or URL available for candidate"
+            logger.error(f"[score_candidate] {error_msg}")
+            raise ValueError(error_msg)
 
-        # Update candidate with score
-        try:
-            db_service.update_candidate_score(candidate_id, score_data, job_id)
-            logger.info(f"[score_candidate] Successfully updated score for candidate {candidate_id}")
+    # Check cache for existing score: exact job description first, then a near-identical one
+    score_key = cache.generate_score_key(candidate_id, job_description)
+    cached_score = cache.get_score(score_key)
+    resume_hash = candidate.get('resume_text_hash') or cache.hash_text(resume_text)
+    jd_embedding = None
+    if not cached_score and settings.semantic_score_threshold > 0:
+        jd_embedding = _jd_embedding(job_description, cache)
+        if jd_embedding:
+            cached_score = cache.get_score_semantic(candidate_id, resume_hash, jd_embedding)
+            if cached_score:
+                # Serve later exact repeats without the embedding lookup
+                cache.set_score(score_key, cached_score)
+
+    if cached_score:
+        logger.debug("[score_candidate] Using cached score for %s", candidate_id)
+        score_data = cached_score
+    else:
+        logger.debug("[score_candidate] Generating new LLM score for %s", candidate_id)
+        # Generate new score using LLM
+        if batch_fallback:
+            try:
+                score_data = scorer.score_candidate(resume_text, job_description, fallback=False)
+            except Exception as e:
+                raise LLMScoringFailed(candidate_id, resume_text) from e
+        else:
+            score_data = scorer.score_candidate(resume_text, job_description)
+        # Cache the result
+        cache.set_score(score_key, score_data)
+        if jd_embedding:
+            cache.set_score_semantic(candidate_id, resume_hash, jd_embedding, score_data)
 
-            # Also update application document (if exists) so front-end shows the ai_match_score
-            if job_id:
-                try:
-                    application = db_service.get_application_by_job_and_candidate(job_id, candidate_id)
-                    if application:
-                        application_id = application.get('application_id') or application.get('_id')
-                        # Update the application with the ai match score and rationale
-                        db_service.update_application(application_id, {
-                            "ai_match_score": score_data.get('score'),
-                            "match_score": score_data.get('score'),
-                            "latest_score": score_data,
-                            "updated_at": datetime.utcnow()
-                        })
-                        logger.info(f"[score_candidate] Updated application {application_id} with score for job {job_id}")
-                    else:
-                        logger.warning(f"[score_candidate] No application found for job={job_id} candidate={candidate_id}")
-                except Exception as e:
-                    logger.error(f"[score_candidate] Failed to update application with score: {str(e)}")
-        except Exception as e:
-            logger.error(f"[score_candidate] Failed to update score in database: {str(e)}")
-            raise
+    # Update candidate with score
+    try:
+        db_service.update_candidate_score(candidate_id, score_data, job_id)
+        logger.info("[score_candidate] Successfully updated score for candidate %s", candidate_id)
 
-        # Notify frontend if job_id provided
+        # Also update application document (if exists) so front-end shows the ai_match_score
         if job_id:
             try:
-                notifier.publish_event("candidate_scored", job_id, {
-                    "candidate_id": candidate_id,
-                    "score": score_data.get('score'),
-                    "rationale": score_data.get('rationale'),
-                    "status": "SCORED"
-                })
-                logger.info(f"[score_candidate] Sent scoring notification for candidate {candidate_id}")
+                application = db_service.get_application_by_job_and_candidate(job_id, candidate_id, APPLICATION_ID_FIELDS)
+                if application:
+                    application_id = application.get('application_id') or application.get('_id')
+                    # Update the application with the ai match score and rationale
+                    db_service.update_application(application_id, {
+                        "ai_match_score": score_data.get('score'),
+                        "match_score": score_data.get('score'),
+                        "latest_score": score_data,
+                        "updated_at": now
+                    })
+                    logger.info("[score_candidate] Updated application %s with score for job %s", application_id, job_id)
+                else:
+                    logger.warning("[score_candidate] No application found for job=%s candidate=%s", job_id, candidate_id)
             except Exception as e:
-                logger.error(f"[score_candidate] Failed to send notification: {str(e)}")
+                logger.error(f"[score_candidate] Failed to update application with score: {str(e)}")
+    except Exception as e:
+        logger.error(f"[score_candidate] Failed to update score in database: {str(e)}")
+        raise
 
-        return {
-            "candidate_id": candidate_id,
-            "score": score_data.get('score'),
-            "rationale": score_data.get('rationale'),
-            "status": "completed"
-        }
+    # Notify frontend if job_id provided
+    if job_id:
+        try:
+            notifier.publish_event("candidate_scored", job_id, {
+                "candidate_id": candidate_id,
+                "score": score_data.get('score'),
+                "rationale": score_data.get('rationale'),
+                "status": "SCORED"
+            })
+            logger.info("[score_candidate] Sent scoring notification for candidate %s", candidate_id)
+        except Exception as e:
+            logger.error(f"[score_candidate] Failed to send notification: {str(e)}")
 
+    return {
+        "candidate_id": candidate_id,
+        "score": score_data.get('score'),
+        "rationale": score_data.get('rationale'),
+        "status": "completed"
+    }
+
+
+@celery.task(name="app.workers.scoring_worker.score_candidate", bind=True)
+def score_candidate(self, candidate_id: str, job_description: str, job_id: str = None) -> Dict[str, Any]:
+    """
+    Score a candidate against a job description using LLM.
+    """
+    try:
+        return _score_candidate_impl(candidate_id, job_description, job_id)
+    except CandidateNotFound as e:
+        # Re-queue rather than sleeping again so the worker slot is released
+        raise self.retry(exc=e, countdown=CANDIDATE_RETRY_COUNTDOWN, max_retries=3)
     except Exception as e:
         # Log error and notify frontend
         try:
             if job_id:
-                notifier.publish_event("candidate_scored", job_id, {
+                _notifier().publish_event("candidate_scored", job_id, {
                     "candidate_id": candidate_id,
                     "status": "failed",
                     "error": str(e)
@@ -211,6 +353,150 @@ def score_candidate(self, candidate_id: str, job_description: str, job_id: str =
 
 
 
+def _extract_matches(similar_candidates: List[Dict[str, Any]]) -> List[tuple]:
+    """(similarity, metadata, application_id, candidate_id) for each vector/DB match."""
+    matches = []
+    for candidate_data in similar_candidates or []:
+        metadata = candidate_data.get('metadata', {}) or {}
+        application_id = (
+            metadata.get('application_id') or 
+            metadata.get('applicationId') or 
+            candidate_data.get('application_id')
+        )
+        candidate_id = (
+            metadata.get('candidate_id') or 
+            metadata.get('candidateId') or 
+            candidate_data.get('candidate_id') or 
+            candidate_data.get('id')
+        )
+        # Only the similarity score is read downstream; keeps chunk messages small
+        similarity = {"score": candidate_data["score"]} if "score" in candidate_data else {}
+        matches.append((similarity, metadata, application_id, candidate_id))
+    return matches
+
+
+def _application_id_for_candidate(apps_by_candidate: Dict[str, Dict[str, Any]], candidate_id: Optional[str]):
+    """The id of the job's application for candidate_id from the bulk lookup, or None."""
+    app_record = apps_by_candidate.get(candidate_id) if candidate_id else None
+    if app_record:
+        return app_record.get('application_id') or app_record.get('_id')
+    return None
+
+
+def _process_matches(db_service: SyncDatabaseService, job_id: str, matches: List[tuple]) -> List[Dict[str, Any]]:
+    """Resolve and record a set of matches; returns their job_matches entries."""
+    # Two queries up front instead of up to three lookups per match inside the loop
+    apps_by_id = db_service.get_applications_bulk((m[2] for m in matches), APPLICATION_ID_FIELDS)
+    apps_by_candidate = db_service.get_applications_by_job_and_candidates_bulk(
+        job_id,
+        [m[3] for m in matches if m[3] and m[3] != "None"] +
+        [a.get('candidate_id') for a in apps_by_id.values() if a.get('candidate_id')],
+        APPLICATION_ID_FIELDS
+    )
+
+    # Score each candidate with LLM
+    scored_candidates = []
+    application_updates = []
+    for idx, (candidate_data, metadata, application_id, candidate_id) in enumerate(matches):
+        # Attempt to resolve candidate via application_id if candidate_id missing
+        if (not candidate_id or candidate_id == "None") and application_id:
+            try:
+                app_record = apps_by_id.get(application_id)
+                if app_record and app_record.get('candidate_id'):
+                    candidate_id = app_record.get('candidate_id')
+                    logger.info("[match_job_candidates] Resolved candidate_id from application: %s", candidate_id)
+                else:
+                    logger.warning("[match_job_candidates] candidate_id missing and application %s has no candidate_id", application_id)
+            except Exception as _e:
+                logger.warning("[match_job_candidates] Failed to resolve application %s: %s", application_id, _e)
+
+        # If still missing candidate_id, try to resolve application via candidate_id; otherwise include Pinecone-only result
+        if not candidate_id or candidate_id == "None":
+            logger.warning("[match_job_candidates] Invalid candidate_id found: %s, attempting to resolve application_id from DB", candidate_id)
+            resolved_app_id = _application_id_for_candidate(apps_by_candidate, candidate_id)
+            if resolved_app_id:
+                logger.info("[match_job_candidates] Resolved application_id from DB for candidate %s: %s", candidate_id, resolved_app_id)
+
+            scored_candidates.append({
+                "application_id": resolved_app_id,
+                "candidate_id": candidate_id or None,
+                "similarity_score": candidate_data.get('score', 0.0),
+                "status": "pinecone_only",
+                "score": candidate_data.get('score', 0.0),
+                "rationale": "Pinecone match only; candidate record not found in DB"
+            })
+            # Continue to next candidate
+            continue
+
+        # Ensure application_id refers to a real application in DB. If not, attempt to resolve via candidate_id
+        # Missing application_id, or one not found in DB: resolve via candidate_id
+        if not application_id or application_id not in apps_by_id:
+            resolved_app_id = _application_id_for_candidate(apps_by_candidate, candidate_id)
+            if resolved_app_id:
+                logger.info("[match_job_candidates] Resolved application_id from DB for candidate %s: %s", candidate_id, resolved_app_id)
+                application_id = resolved_app_id
+
+        logger.info("[match_job_candidates] candidate idx=%s app=%s cand=%s score=%s", idx, application_id, candidate_id, candidate_data.get('score'))
+
+            # Skip only if we don't have either ID
+        if not candidate_id and not application_id:
+            logger.warning("[match_job_candidates] Skipping match with no IDs")
+            continue
+
+        try:
+            # Get Pinecone similarity score
+            similarity_score = candidate_data.get('score', 0.0)
+            logger.debug("[match_job_candidates] Processing match: app=%s score=%s", application_id, similarity_score)
+
+            # Queue application update with similarity score; written in one batch below
+            if application_id:
+                application_updates.append((application_id, {
+                    "similarity_score": similarity_score,
+                    "match_score": similarity_score,  # Also update match_score for compatibility
+                    "ai_match_score": similarity_score,  # And ai_match_score
+                    "status": "embedded generated",
+                    "stage": "ai_screening",
+                    "pinecone_metadata": metadata
+                }))
+
+            # Add to matches list for job_matches collection
+            scored_candidates.append({
+                "application_id": application_id,
+                "candidate_id": candidate_id,
+                "similarity_score": candidate_data.get('score', 0.0),
+                "score": candidate_data.get('score', 0.0),  # Use similarity as final score
+                "status": "embedded generated"  # Mark as embedded generated for Pinecone score
+            })
+        except Exception as e:
+            logger.error(f"[match_job_candidates] Error processing candidate {candidate_id}: {str(e)}")
+            continue
+
+    # Write all application score updates in a single round trip
+    updated = db_service.bulk_update_applications(application_updates)
+    logger.info("[match_job_candidates] Updated %s of %s applications with similarity scores", updated, len(application_updates))
+    return scored_candidates
+
+
+def _complete_job_matching(
+    db_service: SyncDatabaseService, notifier: NotificationService, job_id: str,
+    scored_candidates: List[Dict[str, Any]]
+) -> None:
+    """Store the job's matches, mark matching complete and notify the frontend."""
+    # Store initial matches in database
+    db_service.store_job_matches(job_id, scored_candidates)
+
+    # Update job status
+    db_service.update_job_status(job_id, "MATCHING_COMPLETED", {
+        "total_candidates": len(scored_candidates)
+    })
+
+    # Notify frontend
+    notifier.publish_event("job_matching_started", job_id, {
+        "total_candidates": len(scored_candidates),
+        "status": "matching"
+    })
+
+
 @celery.task(name="app.workers.scoring_worker.match_job_candidates", bind=True)
 def match_job_candidates(self, job_id: str, job_description: str, top_k: int = 10) -> Dict[str, Any]:
     """
@@ -218,36 +504,34 @@ def match_job_candidates(self, job_id: str, job_description: str, top_k: int = 1
     """
     try:
         # Initialize services
-        embedder = EmbedderService()
-        db_service = SyncDatabaseService()  # Use sync wrapper
-        notifier = NotificationService()
+        embedder = _embedder()
+        db_service = _db_service()  # Use sync wrapper
+        notifier = _notifier()
 
         # Update job status to matching
         db_service.update_job_status(job_id, "MATCHING")
-        print(f"[match_job_candidates] job_id={job_id} top_k={top_k} - starting matching")
-        logger.info(f"[match_job_candidates] job_id={job_id} - starting matching (top_k={top_k})")
+        logger.info("[match_job_candidates] job_id=%s - starting matching (top_k=%s)", job_id, top_k)
 
-        # Create embedding for job description
-        print(f"[match_job_candidates] Creating job embedding (may take a moment)")
-        job_embedding = embedder.create_embedding(job_description)
-        logger.info(f"[match_job_candidates] job_embedding created for job_id={job_id}")
+        # Embedding for job description: reused across retries, re-matches and the scoring tasks
+        job_embedding = _jd_embedding(job_description, _cache())
+        if not job_embedding:
+            raise ValueError("Failed to embed job description")
+        logger.info("[match_job_candidates] job_embedding ready for job_id=%s", job_id)
 
         # Query Pinecone for similar candidates (resume vectors)
-        print(f"[match_job_candidates] Querying Pinecone for top_k={top_k} resume vectors")
         similar_candidates = embedder.query_similar(
             job_embedding,
             top_k=top_k,
             min_score=0.0,  # Lower threshold to get more matches
             vector_type="resume"  # This matches metadata.vector_type
         )
-        print(f"[match_job_candidates] Pinecone returned {len(similar_candidates) if similar_candidates else 0} matches")
-        logger.info(f"[match_job_candidates] Pinecone returned {len(similar_candidates) if similar_candidates else 0} matches for job {job_id}")
+        logger.info("[match_job_candidates] Pinecone returned %s matches for job %s", len(similar_candidates) if similar_candidates else 0, job_id)
 
         if not similar_candidates:
             # Fallback to database query
             similar_candidates = db_service.get_candidates_for_matching(limit=top_k)
             if not similar_candidates:
-                logger.warning(f"[match_job_candidates] No candidates found for job {job_id}")
+                logger.warning("[match_job_candidates] No candidates found for job %s", job_id)
                 return {
                     "job_id": job_id,
                     "total_candidates": 0,
@@ -255,135 +539,26 @@ def match_job_candidates(self, job_id: str, job_description: str, top_k: int = 1
                     "message": "No candidates found"
                 }
 
-        # Score each candidate with LLM
-        scored_candidates = []
-        for idx, candidate_data in enumerate(similar_candidates or []):
-            metadata = candidate_data.get('metadata', {}) or {}
-            
-            # Extract IDs with proper validation
-            application_id = (
-                metadata.get('application_id') or 
-                metadata.get('applicationId') or 
-                candidate_data.get('application_id')
-            )
-            
-            candidate_id = (
-                metadata.get('candidate_id') or 
-                metadata.get('candidateId') or 
-                candidate_data.get('candidate_id') or 
-                candidate_data.get('id')
-            )
-            
-            # Attempt to resolve candidate via application_id if candidate_id missing
-            if (not candidate_id or candidate_id == "None") and application_id:
-                try:
-                    app_record = db_service.get_application(application_id)
-                    if app_record and app_record.get('candidate_id'):
-                        candidate_id = app_record.get('candidate_id')
-                        logger.info(f"[match_job_candidates] Resolved candidate_id from application: {candidate_id}")
-                    else:
-                        logger.warning(f"[match_job_candidates] candidate_id missing and application {application_id} has no candidate_id")
-                except Exception as _e:
-                    logger.warning(f"[match_job_candidates] Failed to resolve application {application_id}: {_e}")
-
-            # If still missing candidate_id, try to resolve application via candidate_id; otherwise include Pinecone-only result
-            if not candidate_id or candidate_id == "None":
-                logger.warning(f"[match_job_candidates] Invalid candidate_id found: {candidate_id}, attempting to resolve application_id from DB")
-                resolved_app_id = None
-                try:
-                    if candidate_id:
-                        app_record = db_service.get_application_by_job_and_candidate(job_id, candidate_id)
-                        if app_record:
-                            resolved_app_id = app_record.get('application_id') or app_record.get('_id')
-                            logger.info(f"[match_job_candidates] Resolved application_id from DB for candidate {candidate_id}: {resolved_app_id}")
-                except Exception as _e:
-                    logger.warning(f"[match_job_candidates] Failed to resolve application for candidate {candidate_id}: {_e}")
-
-                scored_candidates.append({
-                    "application_id": resolved_app_id,
-                    "candidate_id": candidate_id or None,
-                    "similarity_score": candidate_data.get('score', 0.0),
-                    "status": "pinecone_only",
-                    "score": candidate_data.get('score', 0.0),
-                    "rationale": "Pinecone match only; candidate record not found in DB"
-                })
-                # Continue to next candidate
-                continue
-
-            # Ensure application_id refers to a real application in DB. If not, attempt to resolve via candidate_id
-            try:
-                if application_id:
-                    app_check = db_service.get_application(application_id)
-                    if not app_check:
-                        # suspicious application_id (not found), try resolving via candidate_id
-                        if candidate_id:
-                            app_record = db_service.get_application_by_job_and_candidate(job_id, candidate_id)
-                            if app_record:
-                                application_id = app_record.get('application_id') or app_record.get('_id')
-                                logger.info(f"[match_job_candidates] Corrected application_id from DB for candidate {candidate_id}: {application_id}")
-                else:
-                    # No application_id provided; try to resolve from candidate_id
-                    if candidate_id:
-                        app_record = db_service.get_application_by_job_and_candidate(job_id, candidate_id)
-                        if app_record:
-                            application_id = app_record.get('application_id') or app_record.get('_id')
-                            logger.info(f"[match_job_candidates] Resolved missing application_id from DB for candidate {candidate_id}: {application_id}")
-            except Exception as _e:
-                logger.warning(f"[match_job_candidates] Application resolution check failed: {_e}")
-
-            print(f"[match_job_candidates] candidate[{idx}] application_id={application_id} candidate_id={candidate_id} score={candidate_data.get('score')}")
-            logger.info(f"[match_job_candidates] candidate idx={idx} app={application_id} cand={candidate_id} score={candidate_data.get('score')}")
-
-                # Skip only if we don't have either ID
-            if not candidate_id and not application_id:
-                logger.warning(f"[match_job_candidates] Skipping match with no IDs")
-                continue
-
-            try:
-                # Get Pinecone similarity score
-                similarity_score = candidate_data.get('score', 0.0)
-                print(f"[match_job_candidates] Processing match: app={application_id} score={similarity_score}")
-
-                # Update application record with similarity score
-                if application_id:
-                    try:
-                        db_service.update_application(application_id, {
-                            "similarity_score": similarity_score,
-                            "match_score": similarity_score,  # Also update match_score for compatibility
-                            "ai_match_score": similarity_score,  # And ai_match_score
-                            "status": "embedded generated",
-                            "stage": "ai_screening",
-                            "pinecone_metadata": metadata
-                        })
-                        print(f"[match_job_candidates] Updated application {application_id} with score {similarity_score}")
-                    except Exception as e:
-                        print(f"[match_job_candidates] Failed to update application {application_id}: {e}")
-
-                # Add to matches list for job_matches collection
-                scored_candidates.append({
-                    "application_id": application_id,
-                    "candidate_id": candidate_id,
-                    "similarity_score": candidate_data.get('score', 0.0),
-                    "score": candidate_data.get('score', 0.0),  # Use similarity as final score
-                    "status": "embedded generated"  # Mark as embedded generated for Pinecone score
-                })
-            except Exception as e:
-                logger.error(f"[match_job_candidates] Error processing candidate {candidate_id}: {str(e)}")
-                continue
-
-        # Store initial matches in database
-        db_service.store_job_matches(job_id, scored_candidates)
-
-        # Update job status
-        db_service.update_job_status(job_id, "MATCHING_COMPLETED", {
-            "total_candidates": len(scored_candidates)
-        })
+        # Extract IDs with proper validation
+        matches = _extract_matches(similar_candidates)
+
+        # Large result sets fan out in chunks across the pool; the chord callback stores the matches
+        if len(matches) > MATCH_CHUNK_SIZE:
+            chunks = [matches[i:i + MATCH_CHUNK_SIZE] for i in range(0, len(matches), MATCH_CHUNK_SIZE)]
+            chord(
+                group(process_match_chunk.s(job_id, chunk) for chunk in chunks),
+                finalize_job_matches.s(job_id)
+            ).apply_async()
+            logger.info("[match_job_candidates] job_id=%s dispatched %s matches in %s chunks", job_id, len(matches), len(chunks))
+            return {
+                "job_id": job_id,
+                "total_candidates": len(matches),
+                "chunks": len(chunks),
+                "status": "dispatched"
+            }
 
-        # Notify frontend
-        notifier.publish_event("job_matching_started", job_id, {
-            "total_candidates": len(scored_candidates),
-            "status": "matching"
-        })
+        scored_candidates = _process_matches(db_service, job_id, matches)
+        _complete_job_matching(db_service, notifier, job_id, scored_candidates)
 
         return {
             "job_id": job_id,
@@ -415,11 +590,101 @@ def match_job_candidates(self, job_id: str, job_description: str, top_k: int = 1
 
 
 
+@celery.task(name="app.workers.scoring_worker.process_match_chunk")
+def process_match_chunk(job_id: str, matches: List[list]) -> List[Dict[str, Any]]:
+    """Resolve and record one chunk of a job's matches for the finalize_job_matches chord."""
+    try:
+        return _process_matches(_db_service(), job_id, matches)
+    except Exception as e:
+        # Same tolerance as a single bad match: the rest of the job's matches still complete
+        logger.error(f"[process_match_chunk] job_id={job_id} chunk of {len(matches)} failed: {str(e)}")
+        return []
+
+
+@celery.task(name="app.workers.scoring_worker.finalize_job_matches")
+def finalize_job_matches(chunk_results: List[List[Dict[str, Any]]], job_id: str) -> Dict[str, Any]:
+    """Chord callback: store the matches from every chunk and complete the job."""
+    db_service = _db_service()
+    notifier = _notifier()
+    scored_candidates = [entry for chunk in chunk_results for entry in chunk]
+    try:
+        _complete_job_matching(db_service, notifier, job_id, scored_candidates)
+    except Exception as e:
+        logger.error(f"[finalize_job_matches] job_id={job_id} failed: {str(e)}")
+        try:
+            db_service.update_job_status(job_id, "FAILED", {"error": str(e)})
+            notifier.publish_event("job_matching_failed", job_id, {"error": str(e)})
+        except Exception:
+            pass
+        raise
+    return {
+        "job_id": job_id,
+        "total_candidates": len(scored_candidates),
+        "status": "completed"
+    }
+
+
+def _persist_fallback_scores(
+    pending: List[Tuple[str, str]], job_description: str, job_id: str
+) -> List[Dict[str, Any]]:
+    """Keyword-score the candidates Gemini could not, in one pass, with bulk writes and one publish."""
+    scores = _scorer().fallback_score_batch(job_description, [resume_text for _, resume_text in pending])
+    now = datetime.utcnow()
+    entries = [
+        (candidate_id, {**score_data, "timestamp": now.isoformat()}, job_id)
+        for (candidate_id, _), score_data in zip(pending, scores)
+    ]
+    db_service = _db_service()
+    db_service.bulk_update_candidate_scores(entries)
+    
+    if job_id:
+        apps_by_candidate = db_service.get_applications_by_job_and_candidates_bulk(
+            job_id, [candidate_id for candidate_id, _, _ in entries], APPLICATION_ID_FIELDS
+        )
+        application_updates = []
+        for candidate_id, score_data, _ in entries:
+            application_id = _application_id_for_candidate(apps_by_candidate, candidate_id)
+            if application_id:
+                application_updates.append((application_id, {
+                    "ai_match_score": score_data["score"],
+                    "match_score": score_data["score"],
+                    "latest_score": score_data,
+                    "updated_at": now
+                }))
+        db_service.bulk_update_applications(application_updates)
+        _notifier().publish_events_bulk([
+            ("candidate_scored", job_id, {
+                "candidate_id": candidate_id,
+                "score": score_data["score"],
+                "rationale": score_data["rationale"],
+                "status": "SCORED"
+            })
+            for candidate_id, score_data, _ in entries
+        ])
+    
+    return [
+        {
+            "candidate_id": candidate_id,
+            "score": score_data["score"],
+            "rationale": score_data["rationale"],
+            "status": "completed"
+        }
+        for candidate_id, score_data, _ in entries
+    ]
+
+
 @celery.task(name="app.workers.scoring_worker.batch_score_candidates")
-def batch_score_candidates(candidate_ids: List[str], job_description: str, job_id: str) -> Dict[str, Any]:
+def batch_score_candidates(
+    candidate_ids: List[str], job_description: str, job_id: str
+) -> Dict[str, Any]:
     """
     Score multiple candidates in batch for a job.
     
+    Candidates are scored in-process on a thread pool. Those Gemini could not
+    score are keyword-scored together in one fallback_score_batch pass; any
+    other failure is queued as a score_candidate task, which owns retries and
+    failure notification.
+    
     Args:
         candidate_ids: List of candidate IDs
         job_description: Job description
@@ -429,21 +694,61 @@ def batch_score_candidates(candidate_ids: List[str], job_description: str, job_i
         Dict with batch processing results
     """
     results = []
+    if not candidate_ids:
+        return {"results": results}
     
-    for candidate_id in candidate_ids:
+    # Score in-process on this already-warm worker rather than a broker round trip per candidate
+    futures = [
+        (candidate_id, _score_executor().submit(_score_candidate_impl, candidate_id, job_description, job_id, batch_fallback=True))
+        for candidate_id in candidate_ids
+    ]
+    retry_ids = []
+    fallback_pending = []
+    for candidate_id, future in futures:
         try:
-            result = score_candidate.delay(candidate_id, job_description, job_id)
-            results.append({
-                "candidate_id": candidate_id,
-                "task_id": result.id,
-                "status": "queued"
-            })
+            results.append(future.result())
+        except LLMScoringFailed as e:
+            fallback_pending.append((candidate_id, e.resume_text))
         except Exception as e:
-            results.append({
-                "candidate_id": candidate_id,
-                "status": "failed",
-                "error": str(e)
-            })
+            # The score_candidate task owns retries and failure notification
+            logger.warning("In-process scoring of %s failed, queueing score_candidate: %s", candidate_id, e)
+            retry_ids.append(candidate_id)
+    
+    if fallback_pending:
+        try:
+            results.extend(_persist_fallback_scores(fallback_pending, job_description, job_id))
+        except Exception as e:
+            logger.error(f"Batch fallback scoring failed, queueing score_candidate: {str(e)}")
+            retry_ids.extend(candidate_id for candidate_id, _ in fallback_pending)
+    candidate_ids = retry_ids
+    if not candidate_ids:
+        return {"results": results}
+    
+    signatures = [score_candidate.s(candidate_id, job_description, job_id) for candidate_id in candidate_ids]
+    try:
+        # One group publish; every message goes out on the same pooled producer
+        with celery.producer_pool.acquire(block=True) as producer:
+            group_result = group(signatures).apply_async(producer=producer)
+        queued = zip(candidate_ids, (r.id for r in group_result.results))
+    except Exception as e:
+        logger.error(f"Group dispatch of {len(signatures)} scoring tasks failed, falling back to per-task delay: {str(e)}")
+        queued = []
+        for candidate_id, sig in zip(candidate_ids, signatures):
+            try:
+                queued.append((candidate_id, sig.delay().id))
+            except Exception as delay_error:
+                results.append({
+                    "candidate_id": candidate_id,
+                    "status": "failed",
+                    "error": str(delay_error)
+                })
+    
+    for candidate_id, task_id in queued:
+        results.append({
+            "candidate_id": candidate_id,
+            "task_id": task_id,
+            "status": "queued"
+        })
     
     return {"results": results}
 
@@ -460,16 +765,15 @@ def score_interview(self, application_id: str) -> Dict[str, Any]:
         Dict with scoring results
     """
     try:
-        print(f"🎯 Starting interview scoring for application {application_id}...")
-        logger.info(f"Interview scoring started: application_id={application_id}")
+        logger.info("Interview scoring started: application_id=%s", application_id)
         # Initialize services
-        scorer = ScorerService()
-        db_service = SyncDatabaseService()  # Use sync wrapper
-        notifier = NotificationService()
-        audit = AuditService()
+        scorer = _scorer()
+        db_service = _db_service()  # Use sync wrapper
+        notifier = _notifier()
+        audit = _audit()
         
         # Get application data
-        application = db_service.get_application(application_id)
+        application = db_service.get_application(application_id, INTERVIEW_SCORING_FIELDS)
         if not application:
             raise ValueError(f"Application {application_id} not found")
         
@@ -479,13 +783,14 @@ def score_interview(self, application_id: str) -> Dict[str, Any]:
         if not questions or not answers:
             raise ValueError("No questions or answers found")
         
-        # Prepare scoring context
+        # Prepare scoring context; questions indexed once rather than scanned per answer
+        question_text = {q["qid"]: q["text"] for q in questions}
         scoring_data = {
             "job_description": application["job"]["description"],
             "resume_text": application["resume_text"],
             "qa_pairs": [
                 {
-                    "question": next(q["text"] for q in questions if q["qid"] == a["qid"]),
+                    "question": question_text[a["qid"]],
                     "answer": a["answer_text"],
                     "expired": a.get("expired", False)
                 }
@@ -494,8 +799,7 @@ def score_interview(self, application_id: str) -> Dict[str, Any]:
         }
         
         # Score using Gemini
-        print("🤖 Evaluating answers with Gemini...")
-        logger.info(f"Starting Gemini evaluation: application_id={application_id}, num_answers={len(scoring_data['qa_pairs'])}")
+        logger.info("Starting Gemini evaluation: application_id=%s, num_answers=%s", application_id, len(scoring_data['qa_pairs']))
         
         prompt_hash = scorer.get_prompt_hash("interview_scoring")
         score_results = scorer.score_interview_answers(
@@ -503,8 +807,7 @@ def score_interview(self, application_id: str) -> Dict[str, Any]:
             prompt_hash=prompt_hash
         )
         
-        print(f"✅ Evaluation complete - Technical: {score_results['technical']}, Communication: {score_results['communication']}")
-        logger.info(f"Scoring complete: application_id={application_id}, final_score={score_results['final_score']}")
+        logger.info("Scoring complete: application_id=%s, final_score=%s", application_id, score_results['final_score'])
         
         # Update application with results
         update_data = {
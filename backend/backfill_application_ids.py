@@ -0,0 +1,25 @@
+"""One-shot migration: give every application an application_id.
+
+Applications missing the field get application_id = str(_id). Once none are
+left, the apps_migrated_v1 flag is set in Redis and application lookups stop
+falling back to the `$or` over application_id and _id.
+"""
+from pymongo import MongoClient
+import redis
+from app.config import settings
+from app.services.cache import APPLICATIONS_MIGRATED_FLAG
+
+if __name__ == '__main__':
+    client = MongoClient(settings.mongo_url)
+    db = client[settings.mongo_db_name]
+
+    missing = {"$or": [{"application_id": {"$exists": False}}, {"application_id": None}, {"application_id": ""}]}
+    result = db.applications.update_many(missing, [{"$set": {"application_id": {"$toString": "$_id"}}}])
+    print('backfilled', result.modified_count)
+
+    remaining = db.applications.count_documents(missing)
+    if remaining:
+        print('still missing application_id:', remaining, '- flag not set')
+    else:
+        redis.from_url(settings.redis_url).set(APPLICATIONS_MIGRATED_FLAG, "1")
+        print('set', APPLICATIONS_MIGRATED_FLAG)
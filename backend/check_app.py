@@ -4,7 +4,8 @@ import json
 mongo_url = getattr(settings, 'mongo_url', None) or 'mongodb://localhost:27017/auralis_hr'
 mongo_db = getattr(settings, 'mongo_db_name', 'ai_ats')
 print('mongo_url=', mongo_url)
-client = MongoClient(mongo_url)
+# One lookup: a single socket, fail fast, compressed wire (zstd if installed, else zlib)
+client = MongoClient(mongo_url, maxPoolSize=1, serverSelectionTimeoutMS=2000, compressors='zstd,zlib')
 db = client[mongo_db]
-app = db.applications.find_one({'application_id':'APL-77A8F0C7'})
+app = db.applications.find_one({'application_id':'APL-77A8F0C7'}, projection={'resume_text': 0, 'gemini_answers': 0})
 print(json.dumps(app, default=str, indent=2))
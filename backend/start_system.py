@@ -4,16 +4,96 @@ Quick start script for the AI HRMS & ATS system.
 This script helps you start all the necessary services for local development.
 """
 
+import atexit
+import functools
+import json
+import multiprocessing
+import shutil
+import socket
 import subprocess
 import time
 import os
 import sys
 from pathlib import Path
+from typing import Final
+from concurrent.futures import ThreadPoolExecutor
+from dotenv import dotenv_values
 
+# Commands whose --version check passed, keyed by resolved path and its mtime
+DEPS_CACHE_FILE = Path.home() / ".cache" / "hrms_start" / "deps.json"
+# A single local worker has to serve every queue the tasks are routed to, and
+# embeds beat for the daily cleanup and question-batch backstop schedules
+LOCAL_WORKER_ARGS = ["-Q", "celery,llm_io,cleanup", "-B"]
+# Installed alongside requirements.txt in one pip run; CI may override via env.
+# en_core_web_sm 3.7.1 requires spacy>=3.7.2,<3.8.0 - bump with the pin in requirements.txt
+SPACY_MODEL_WHEEL = os.environ.get(
+    "SPACY_MODEL_WHEEL",
+    "https://github.com/explosion/spacy-models/releases/download/"
+    "en_core_web_sm-3.7.1/en_core_web_sm-3.7.1-py3-none-any.whl",
+)
 
-def check_dependencies():
-    """Check if required dependencies are installed."""
-    print("🔍 Checking dependencies...")
+
+class _Log:
+    """Collects a phase's status lines and writes them to stdout in one go."""
+    
+    def __init__(self):
+        self._lines = []
+    
+    def ok(self, msg: str):
+        self._lines.append(f"✅ {msg}")
+    
+    def err(self, msg: str):
+        self._lines.append(f"❌ {msg}")
+    
+    def info(self, msg: str):
+        self._lines.append(msg)
+    
+    def flush(self):
+        if self._lines:
+            sys.stdout.write("\n".join(self._lines) + "\n")
+            sys.stdout.flush()
+            self._lines.clear()
+
+
+log = _Log()
+
+
+def _flush_log(func):
+    """Flush the buffered log however the decorated phase returns."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            log.flush()
+    return wrapper
+
+
+def _load_deps_cache() -> dict:
+    try:
+        with open(DEPS_CACHE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_deps_cache(cache: dict):
+    try:
+        DEPS_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(DEPS_CACHE_FILE, "w") as f:
+            json.dump(cache, f)
+    except OSError:
+        pass  # Only an optimisation; the next run checks again
+
+
+@_flush_log
+def check_dependencies(use_cache: bool = True):
+    """Check if required dependencies are installed.
+
+    A command whose binary is unchanged (same path and mtime) since it last
+    passed is not re-run; pass use_cache=False (--no-cache) to check them all.
+    """
+    log.info("🔍 Checking dependencies...")
     
     required_commands = [
         ("python", "Python 3.11+"),
@@ -24,33 +104,59 @@ def check_dependencies():
     
     missing = []
     
+    cache = _load_deps_cache() if use_cache else {}
+    
+    # Start every uncached version check at once, then collect them in order
+    procs = []
     for command, description in required_commands:
+        path = shutil.which(command)
+        key = [path, os.path.getmtime(path)] if path else None
+        if key is not None and cache.get(command) == key:
+            procs.append((command, description, key, True, None))
+            continue
         try:
-            subprocess.run([command, "--version"], 
-                         capture_output=True, check=True)
-            print(f"✅ {description} - OK")
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            print(f"❌ {description} - Missing")
+            # Absolute path + close_fds=False lets CPython use posix_spawn
+            proc = subprocess.Popen([path or command, "--version"], close_fds=False,
+                                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except FileNotFoundError:
+            proc = None
+        procs.append((command, description, key, False, proc))
+    
+    for command, description, key, cached, proc in procs:
+        if cached or (proc is not None and proc.wait() == 0):
+            log.ok(f"{description} - OK")
+            if key is not None:
+                cache[command] = key
+        else:
+            log.err(f"{description} - Missing")
             missing.append(command)
+            cache.pop(command, None)
+    
+    _save_deps_cache(cache)
     
     if missing:
-        print(f"\n❌ Missing dependencies: {', '.join(missing)}")
-        print("Please install the missing dependencies and try again.")
+        log.info(f"\n❌ Missing dependencies: {', '.join(missing)}")
+        log.info("Please install the missing dependencies and try again.")
         return False
     
     return True
 
 
+@_flush_log
 def check_env_file():
     """Check if .env file exists and has required variables."""
-    print("\n🔍 Checking .env configuration...")
+    log.info("\n🔍 Checking .env configuration...")
     
     env_file = Path(".env")
     if not env_file.exists():
-        print("❌ .env file not found")
-        print("Creating template .env file...")
+        log.err(".env file not found")
+        log.info("Creating template .env file...")
         create_env_template()
         return False
+    if not env_file.is_file():
+        # A FIFO or directory would block or fail the parse
+        log.err(".env is not a regular file")
+        return False
     
     required_vars = [
         "MONGO_URL",
@@ -60,19 +166,16 @@ def check_env_file():
         "GCS_BUCKET_NAME"
     ]
     
-    missing_vars = []
-    with open(env_file, 'r') as f:
-        content = f.read()
-        for var in required_vars:
-            if var not in content or f"{var}=" in content and not content.split(f"{var}=")[1].split('\n')[0].strip():
-                missing_vars.append(var)
+    # One parse into a dict; exact keys, so comments and longer names don't count
+    values = dotenv_values(env_file)
+    missing_vars = [var for var in required_vars if not (values.get(var) or "").strip()]
     
     if missing_vars:
-        print(f"❌ Missing or empty environment variables: {', '.join(missing_vars)}")
-        print("Please update your .env file with the required values.")
+        log.err(f"Missing or empty environment variables: {', '.join(missing_vars)}")
+        log.info("Please update your .env file with the required values.")
         return False
     
-    print("✅ .env configuration looks good")
+    log.ok(".env configuration looks good")
     return True
 
 
@@ -113,54 +216,97 @@ LOG_LEVEL=INFO
     with open(".env", "w") as f:
         f.write(template)
     
-    print("✅ Created .env template file")
-    print("Please update it with your actual API keys and configuration.")
+    log.ok("Created .env template file")
+    log.info("Please update it with your actual API keys and configuration.")
 
 
+@_flush_log
 def install_python_dependencies():
     """Install Python dependencies."""
-    print("\n📦 Installing Python dependencies...")
+    log.info("\n📦 Installing Python dependencies and spaCy model...")
     
+    log.flush()
     try:
-        subprocess.run([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"], 
-                      check=True)
-        print("✅ Python dependencies installed")
-        
-        # Download spaCy model
-        print("📦 Downloading spaCy model...")
-        subprocess.run([sys.executable, "-m", "spacy", "download", "en_core_web_sm"], 
-                      check=True)
-        print("✅ spaCy model downloaded")
+        subprocess.run([sys.executable, "-m", "pip", "install", "--prefer-binary", "--no-input",
+                        "-r", "requirements.txt", SPACY_MODEL_WHEEL],
+                      check=True, close_fds=False)
+        log.ok("Python dependencies and spaCy model installed")
         
         return True
     except subprocess.CalledProcessError as e:
-        print(f"❌ Failed to install dependencies: {e}")
+        log.err(f"Failed to install dependencies: {e}")
         return False
 
 
+def _wait_port(host: str, port: int, timeout: float = 15) -> bool:
+    """Poll until a TCP connect to host:port succeeds, backing off up to 0.5s between tries."""
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    while time.monotonic() < deadline:
+        with socket.socket() as s:
+            s.settimeout(0.25)
+            try:
+                s.connect((host, port))
+                return True
+            except OSError:
+                pass
+        time.sleep(delay)
+        delay = min(delay * 1.6, 0.5)
+    return False
+
+
+COMPOSE_FILE = "docker/docker-compose.yaml"
+INFRA_SERVICES = ("redis", "mongodb")
+
+
+def _compose_bin() -> str:
+    """docker-compose resolved to a path, so subprocess can take the posix_spawn fast path."""
+    return shutil.which("docker-compose") or "docker-compose"
+
+
+def _infra_running() -> bool:
+    """True when compose reports every infrastructure service as running."""
+    result = subprocess.run(
+        [_compose_bin(), "-f", COMPOSE_FILE, "ps", "--services", "--filter", "status=running"],
+        capture_output=True, text=True, close_fds=False
+    )
+    return result.returncode == 0 and set(INFRA_SERVICES) <= set(result.stdout.split())
+
+
+@_flush_log
 def start_infrastructure():
     """Start Redis and MongoDB using Docker Compose."""
-    print("\n🐳 Starting infrastructure services...")
+    log.info("\n🐳 Starting infrastructure services...")
     
+    log.flush()
     try:
-        # Start only Redis and MongoDB
-        subprocess.run([
-            "docker-compose", "-f", "docker/docker-compose.yaml", "up", "-d", 
-            "redis", "mongodb"
-        ], check=True)
+        if _infra_running():
+            log.ok("Infrastructure services already running")
+        else:
+            # Start only Redis and MongoDB, leaving existing containers and images alone
+            subprocess.run([
+                _compose_bin(), "-f", COMPOSE_FILE, "up", "-d",
+                "--no-deps", "--no-recreate", "--no-build", *INFRA_SERVICES
+            ], check=True, close_fds=False)
+            log.ok("Infrastructure services started")
         
-        print("✅ Infrastructure services started")
-        print("   - Redis: localhost:6379")
-        print("   - MongoDB: localhost:27017")
+        log.info("   - Redis: localhost:6379")
+        log.info("   - MongoDB: localhost:27017")
         
-        # Wait a bit for services to be ready
-        print("⏳ Waiting for services to be ready...")
-        time.sleep(10)
+        # Wait only until both ports accept connections
+        log.info("⏳ Waiting for services to be ready...")
+        log.flush()
+        with ThreadPoolExecutor(2) as pool:
+            redis_ready, mongo_ready = pool.map(lambda port: _wait_port("localhost", port), (6379, 27017))
+        if not (redis_ready and mongo_ready):
+            not_ready = [name for name, ready in (("Redis", redis_ready), ("MongoDB", mongo_ready)) if not ready]
+            log.err(f"Timed out waiting for: {', '.join(not_ready)}")
+            return False
         
         return True
     except subprocess.CalledProcessError as e:
-        print(f"❌ Failed to start infrastructure: {e}")
-        print("Make sure Docker and Docker Compose are installed and running.")
+        log.err(f"Failed to start infrastructure: {e}")
+        log.info("Make sure Docker and Docker Compose are installed and running.")
         return False
 
 
@@ -172,7 +318,7 @@ def start_celery_workers():
         # Start workers in background
         worker_cmd = [
             sys.executable, "-m", "celery", "-A", "app.workers.celery_app", 
-            "worker", "--loglevel=info", "--concurrency=2"
+            "worker", "--loglevel=info", "--concurrency=2", *LOCAL_WORKER_ARGS
         ]
         
         print(f"Running: {' '.join(worker_cmd)}")
@@ -188,22 +334,30 @@ def start_celery_workers():
         return False
 
 
+def _fast_api_cmd():
+    """uvicorn command without the reloader, on uvloop/httptools, one worker per CPU."""
+    cmd = [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "0.0.0.0", "--port", "8000"]
+    if sys.platform != "win32":
+        # uvicorn[standard] installs uvloop everywhere except Windows
+        cmd += ["--loop", "uvloop"]
+    return cmd + ["--http", "httptools", "--workers", str(os.cpu_count() or 1)]
+
+
 def start_api_server():
     """Start the FastAPI server."""
     print("\n🚀 Starting FastAPI server...")
     
     try:
-        api_cmd = [
+        FAST_CMD = _fast_api_cmd()
+        DEV_CMD = [
             sys.executable, "-m", "uvicorn", "app.main:app", 
             "--reload", "--host", "0.0.0.0", "--port", "8000"
         ]
         
-        print(f"Running: {' '.join(api_cmd)}")
-        print("API server will start in the background...")
-        
-        # For development, we'll just show the command
-        print("To start the API server manually, run:")
-        print(f"   {' '.join(api_cmd)}")
+        # For development, we'll just show the commands
+        print("To start the API server manually, run one of:")
+        print(f"   Fast local (no file watcher, one worker per CPU): {' '.join(FAST_CMD)}")
+        print(f"   Dev-edit (auto-reload on code changes):           {' '.join(DEV_CMD)}")
         
         return True
     except Exception as e:
@@ -211,43 +365,82 @@ def start_api_server():
         return False
 
 
+def _run_worker():
+    """Celery worker entry point for --auto; runs in a spawned child."""
+    from celery.bin.celery import main as celery_main
+    sys.argv = ["celery", "-A", "app.workers.celery_app", "worker", "--loglevel=info", "--concurrency=2",
+                *LOCAL_WORKER_ARGS]
+    celery_main()
+
+
+def _run_api():
+    """API server entry point for --auto; runs in a spawned child."""
+    import uvicorn
+    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=False)
+
+
+def start_local_processes():
+    """Spawn the Celery worker and API server as children of this process."""
+    print("\n🚀 Starting Celery worker and API server...")
+    ctx = multiprocessing.get_context("spawn")
+    procs = [
+        ctx.Process(target=_run_worker, name="celery-worker"),
+        ctx.Process(target=_run_api, name="api-server"),
+    ]
+    for proc in procs:
+        proc.start()
+        print(f"✅ Started {proc.name} (pid {proc.pid})")
+    
+    # Take the children down with us however setup exits
+    atexit.register(lambda: [proc.terminate() for proc in procs if proc.is_alive()])
+    return procs
+
+
+# Static next-steps text, rendered once at import and written in a single call
+_NEXT_STEPS: Final[str] = """
+============================================================
+🎉 SYSTEM SETUP COMPLETE!
+============================================================
+
+📋 Next Steps:
+
+1. Start the API server:
+   Fast local: {fast_cmd}
+   Dev-edit:   uvicorn app.main:app --reload --host 0.0.0.0 --port 8000
+
+2. Start Celery workers (in another terminal):
+   celery -A app.workers.celery_app worker --loglevel=info --concurrency=2 -Q celery,llm_io,cleanup
+
+3. Start Celery beat for the daily cleanup (optional; or add -B to the worker):
+   celery -A app.workers.celery_app beat --loglevel=info
+
+4. Start Flower for monitoring (optional):
+   celery -A app.workers.celery_app flower --port=5555
+
+🌐 Access Points:
+   - API Server: http://localhost:8000
+   - API Documentation: http://localhost:8000/docs
+   - Health Check: http://localhost:8000/health
+   - Metrics: http://localhost:8000/metrics
+   - Flower (if started): http://localhost:5555
+
+🧪 Test the System:
+   python test_system.py
+
+📚 Documentation:
+   - README.md - Complete setup and usage guide
+   - API Docs at http://localhost:8000/docs
+
+🔧 Troubleshooting:
+   - Check logs for detailed error messages
+   - Ensure all API keys are set in .env
+   - Verify Docker services are running: docker-compose ps
+""".format(fast_cmd=" ".join(_fast_api_cmd()[2:]))
+
+
 def print_next_steps():
     """Print next steps for the user."""
-    print("\n" + "="*60)
-    print("🎉 SYSTEM SETUP COMPLETE!")
-    print("="*60)
-    
-    print("\n📋 Next Steps:")
-    print("\n1. Start the API server:")
-    print("   uvicorn app.main:app --reload --host 0.0.0.0 --port 8000")
-    
-    print("\n2. Start Celery workers (in another terminal):")
-    print("   celery -A app.workers.celery_app worker --loglevel=info --concurrency=2")
-    
-    print("\n3. Start Celery beat for scheduled tasks (optional):")
-    print("   celery -A app.workers.celery_app beat --loglevel=info")
-    
-    print("\n4. Start Flower for monitoring (optional):")
-    print("   celery -A app.workers.celery_app flower --port=5555")
-    
-    print("\n🌐 Access Points:")
-    print("   - API Server: http://localhost:8000")
-    print("   - API Documentation: http://localhost:8000/docs")
-    print("   - Health Check: http://localhost:8000/health")
-    print("   - Metrics: http://localhost:8000/metrics")
-    print("   - Flower (if started): http://localhost:5555")
-    
-    print("\n🧪 Test the System:")
-    print("   python test_system.py")
-    
-    print("\n📚 Documentation:")
-    print("   - README.md - Complete setup and usage guide")
-    print("   - API Docs at http://localhost:8000/docs")
-    
-    print("\n🔧 Troubleshooting:")
-    print("   - Check logs for detailed error messages")
-    print("   - Ensure all API keys are set in .env")
-    print("   - Verify Docker services are running: docker-compose ps")
+    sys.stdout.write(_NEXT_STEPS)
 
 
 def main():
@@ -256,7 +449,7 @@ def main():
     print("="*50)
     
     # Check dependencies
-    if not check_dependencies():
+    if not check_dependencies(use_cache="--no-cache" not in sys.argv):
         return False
     
     # Check environment configuration
@@ -272,6 +465,14 @@ def main():
     if not start_infrastructure():
         return False
     
+    if "--auto" in sys.argv:
+        # Run worker and API from this process until interrupted
+        procs = start_local_processes()
+        print("\nPress Ctrl+C to stop.")
+        for proc in procs:
+            proc.join()
+        return True
+    
     # Show how to start workers and API
     start_celery_workers()
     start_api_server()
@@ -1,14 +1,26 @@
-from google.cloud import storage
 import os
 
-# Ensure credentials path is set
-print("🔹 GCP Credential Path:", os.getenv("GOOGLE_APPLICATION_CREDENTIALS"))
-
-try:
-    client = storage.Client()
-    buckets = list(client.list_buckets())
-    print("✅ Connected successfully to GCP! Buckets:")
-    for b in buckets:
-        print("-", b.name)
-except Exception as e:
-    print("❌ GCP connection failed:", e)
+# Created on first use so importing this module stays cheap
+_CLIENT = None
+
+
+def main():
+    global _CLIENT
+    from google.cloud import storage
+
+    # Ensure credentials path is set
+    print("🔹 GCP Credential Path:", os.getenv("GOOGLE_APPLICATION_CREDENTIALS"))
+
+    try:
+        _CLIENT = _CLIENT or storage.Client()
+        # One bucket is enough to prove reachability; don't page through them all
+        buckets = list(_CLIENT.list_buckets(max_results=1))
+        print("✅ Connected successfully to GCP! Buckets:")
+        for b in buckets:
+            print("-", b.name)
+    except Exception as e:
+        print("❌ GCP connection failed:", e)
+
+
+if __name__ == "__main__":
+    main()